@@ -18,7 +18,7 @@ sys.path.append(str((context.config.config_file_name or "").split("/alembic.ini"
 sys.path.append(str(os.path.abspath(os.path.join(__file__, "../.."))))
 
 from app.database import Base  # noqa: E402
-from app.models import user, config as config_model, category, payment_method, account, share, operation, recurring  # noqa: F401,E402
+from app.models import user, config as config_model, category, payment_method, account, share, operation, recurring, job, fx_rate, snapshot  # noqa: F401,E402
 
 config = context.config
 
@@ -0,0 +1,26 @@
+"""Full-text index on operation labels and comments
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.search import fts_ddl
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for statement in fts_ddl(op.get_bind().dialect.name):
+        op.execute(sa.text(statement))
+
+
+def downgrade() -> None:
+    for statement in fts_ddl(op.get_bind().dialect.name, drop=True):
+        op.execute(sa.text(statement))
@@ -0,0 +1,68 @@
+"""Duplicate-detection fingerprint on operations
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+"""
+
+import hashlib
+import re
+import unicodedata
+from decimal import ROUND_HALF_UP, Decimal
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+
+def operation_fingerprint(account_id: int, type_: str, amount, label: str) -> str:
+    """Copie figée de `app.core.duplicates.operation_fingerprint` : cette
+    migration calcule les mêmes empreintes quelle que soit l’évolution du code."""
+    decomposed = unicodedata.normalize("NFKD", label.casefold())
+    words = _WORD_RE.findall(decomposed.encode("ascii", "ignore").decode("ascii"))
+    normalized = " ".join(word for word in words if len(word) > 1)
+    cents = int((Decimal(str(amount)) * 100).to_integral_value(rounding=ROUND_HALF_UP))
+    raw = f"{account_id}|{type_}|{cents}|{normalized}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def upgrade() -> None:
+    op.add_column("operations", sa.Column("fingerprint", sa.String(length=32), nullable=True))
+    op.create_index(
+        "ix_operations_fingerprint_date", "operations", ["fingerprint", "date"], unique=False
+    )
+    # Calcul des empreintes des opérations existantes
+    bind = op.get_bind()
+    operations = sa.table(
+        "operations",
+        sa.column("id", sa.Integer),
+        sa.column("type", sa.String),
+        sa.column("amount", sa.Numeric(12, 2)),
+        sa.column("label", sa.String),
+        sa.column("account_id", sa.Integer),
+        sa.column("fingerprint", sa.String),
+    )
+    rows = bind.execute(
+        sa.select(operations.c.id, operations.c.account_id, operations.c.type, operations.c.amount, operations.c.label)
+    ).all()
+    if rows:
+        bind.execute(
+            operations.update()
+            .where(operations.c.id == sa.bindparam("op_id"))
+            .values(fingerprint=sa.bindparam("fp")),
+            [
+                {"op_id": row.id, "fp": operation_fingerprint(row.account_id, row.type, row.amount, row.label)}
+                for row in rows
+            ],
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_operations_fingerprint_date", table_name="operations")
+    op.drop_column("operations", "fingerprint")
@@ -0,0 +1,65 @@
+"""Store money amounts as integer cents
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+MONEY_COLUMNS = [
+    ("bank_accounts", "initial_balance"),
+    ("operations", "amount"),
+    ("recurring_items", "amount"),
+]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for table, column in MONEY_COLUMNS:
+        if bind.dialect.name == "sqlite":
+            # L’affinité NUMERIC de SQLite conserve les entiers tels quels : une
+            # simple conversion des valeurs évite de recréer les tables (et les
+            # triggers plein texte de `operations`).
+            op.execute(
+                sa.text(f"UPDATE {table} SET {column} = CAST(ROUND({column} * 100) AS INTEGER)")
+            )
+        elif bind.dialect.name == "postgresql":
+            op.alter_column(
+                table,
+                column,
+                type_=sa.BigInteger(),
+                existing_type=sa.Numeric(precision=12, scale=2),
+                postgresql_using=f"round({column} * 100)::bigint",
+            )
+        else:
+            op.execute(sa.text(f"UPDATE {table} SET {column} = ROUND({column} * 100)"))
+            op.alter_column(
+                table, column, type_=sa.BigInteger(), existing_type=sa.Numeric(precision=12, scale=2)
+            )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for table, column in MONEY_COLUMNS:
+        if bind.dialect.name == "sqlite":
+            op.execute(sa.text(f"UPDATE {table} SET {column} = {column} / 100.0"))
+        elif bind.dialect.name == "postgresql":
+            op.alter_column(
+                table,
+                column,
+                type_=sa.Numeric(precision=12, scale=2),
+                existing_type=sa.BigInteger(),
+                postgresql_using=f"({column} / 100.0)::numeric(12, 2)",
+            )
+        else:
+            op.alter_column(
+                table, column, type_=sa.Numeric(precision=12, scale=2), existing_type=sa.BigInteger()
+            )
+            op.execute(sa.text(f"UPDATE {table} SET {column} = {column} / 100.0"))
@@ -0,0 +1,32 @@
+"""Per-account currency and local FX rate table
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("bank_accounts", sa.Column("currency", sa.String(length=3), nullable=True))
+    op.create_table(
+        "fx_rates",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("currency", sa.String(length=3), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("rate", sa.Numeric(precision=18, scale=8), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("currency", "date", name="uq_fx_currency_date"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("fx_rates")
+    op.drop_column("bank_accounts", "currency")
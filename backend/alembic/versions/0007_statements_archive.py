@@ -0,0 +1,83 @@
+"""Monthly statement snapshots and operations archive
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.models.enums import OperationType
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+# Le type énuméré existe déjà sous PostgreSQL (table `operations`)
+OPERATION_TYPE = sa.Enum(OperationType).with_variant(
+    postgresql.ENUM(OperationType, name="operationtype", create_type=False), "postgresql"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "bank_accounts",
+        sa.Column("archived_balance", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.create_table(
+        "account_snapshots",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("account_id", sa.Integer(), sa.ForeignKey("bank_accounts.id"), nullable=False),
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column("revenue", sa.BigInteger(), nullable=False),
+        sa.Column("expense", sa.BigInteger(), nullable=False),
+        sa.Column("operation_count", sa.Integer(), nullable=False),
+        sa.Column("closing_balance", sa.BigInteger(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("account_id", "month", name="uq_account_snapshots_account_month"),
+    )
+    op.create_table(
+        "category_snapshots",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("account_id", sa.Integer(), sa.ForeignKey("bank_accounts.id"), nullable=False),
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column("category_id", sa.Integer(), sa.ForeignKey("categories.id"), nullable=False),
+        sa.Column("revenue", sa.BigInteger(), nullable=False),
+        sa.Column("expense", sa.BigInteger(), nullable=False),
+        sa.Column("operation_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "account_id", "month", "category_id", name="uq_category_snapshots_account_month_category"
+        ),
+    )
+    op.create_table(
+        "operations_archive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("type", OPERATION_TYPE, nullable=False),
+        sa.Column("label", sa.String(length=255), nullable=False),
+        sa.Column("amount", sa.BigInteger(), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("account_id", sa.Integer(), sa.ForeignKey("bank_accounts.id"), nullable=False),
+        sa.Column("category_id", sa.Integer(), sa.ForeignKey("categories.id"), nullable=False),
+        sa.Column("payment_method_id", sa.Integer(), sa.ForeignKey("payment_methods.id"), nullable=True),
+        sa.Column("comment", sa.String(length=255), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("archived_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_operations_archive_account_date", "operations_archive", ["account_id", "date"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_operations_archive_account_date", table_name="operations_archive")
+    op.drop_table("operations_archive")
+    op.drop_table("category_snapshots")
+    op.drop_table("account_snapshots")
+    op.drop_column("bank_accounts", "archived_balance")
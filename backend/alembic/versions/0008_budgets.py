@@ -0,0 +1,60 @@
+"""Category budgets with incremental consumption counters
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.enums import BudgetPeriod
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "budgets",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("account_id", sa.Integer(), sa.ForeignKey("bank_accounts.id"), nullable=True),
+        sa.Column("category_id", sa.Integer(), sa.ForeignKey("categories.id"), nullable=False),
+        sa.Column("period", sa.Enum(BudgetPeriod), nullable=False),
+        sa.Column("limit_amount", sa.BigInteger(), nullable=False),
+        sa.Column("alert_percent", sa.Integer(), nullable=False, server_default="80"),
+        sa.Column("since", sa.Date(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_budgets_category_account", "budgets", ["category_id", "account_id"])
+    op.create_table(
+        "budget_counters",
+        sa.Column("budget_id", sa.Integer(), sa.ForeignKey("budgets.id"), nullable=False),
+        sa.Column("period_start", sa.Date(), nullable=False),
+        sa.Column("spent", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("budget_id", "period_start"),
+    )
+    op.create_table(
+        "budget_events",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("budget_id", sa.Integer(), sa.ForeignKey("budgets.id"), nullable=False),
+        sa.Column("period_start", sa.Date(), nullable=False),
+        sa.Column("threshold", sa.Integer(), nullable=False),
+        sa.Column("spent", sa.BigInteger(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "budget_id", "period_start", "threshold", name="uq_budget_events_period_threshold"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("budget_events")
+    op.drop_table("budget_counters")
+    op.drop_index("ix_budgets_category_account", table_name="budgets")
+    op.drop_table("budgets")
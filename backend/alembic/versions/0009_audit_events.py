@@ -0,0 +1,37 @@
+"""Audit log of operation, recurring item and share changes
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.enums import AuditAction, AuditEntity
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "audit_events",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("account_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("entity", sa.Enum(AuditEntity), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("action", sa.Enum(AuditAction), nullable=False),
+        sa.Column("changes", sa.JSON(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_audit_events_account_id", "audit_events", ["account_id", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_events_account_id", table_name="audit_events")
+    op.drop_table("audit_events")
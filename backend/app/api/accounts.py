@@ -2,22 +2,46 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..core.audit import audit_log
+from ..core.duplicates import account_duplicates
+from ..core.fx import fx_cache
+from ..core.money import from_cents
+from ..models.config import GlobalConfig
+from ..core.query_budget import query_budget
 from ..database import get_session
 from ..models.account import BankAccount
 from ..models.share import AccountShare
 from ..models.user import User
-from ..models.enums import PermissionLevel
-from ..schemas.account import AccountCreate, AccountRead, ShareCreate
-from .deps import get_current_user
+from ..models.audit import AuditEvent
+from ..models.enums import AuditAction, AuditEntity, OperationType, PermissionLevel
+from ..models.operation import Operation
+from ..models.snapshot import AccountSnapshot, CategorySnapshot
+from ..schemas.account import (
+    AccountBalance,
+    AccountCreate,
+    AccountRead,
+    AccountSnapshotRead,
+    AccountsSummary,
+    AccountSummaryLine,
+    CategorySnapshotRead,
+    ShareCreate,
+    ShareRead,
+)
+from ..schemas.audit import AuditEventRead
+from ..schemas.operation import DuplicateGroup, OperationRead
+from .deps import get_accessible_account_ids, get_current_user
 
 
 router = APIRouter()
 
 
 @router.get("/accounts", response_model=list[AccountRead])
+@query_budget(3)
 async def list_accounts(current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_session)) -> list[BankAccount]:
     """Retourne la liste des comptes accessibles à l’utilisateur courant."""
     from sqlalchemy import select
@@ -38,6 +62,7 @@ async def list_accounts(current_user: User = Depends(get_current_user), db: Asyn
 
 
 @router.post("/accounts", response_model=AccountRead, status_code=201)
+@query_budget(3)
 async def create_account(
     account_in: AccountCreate,
     current_user: User = Depends(get_current_user),
@@ -56,6 +81,7 @@ async def create_account(
         initial_balance=account_in.initial_balance,
         owner_id=current_user.id,
         type=account_in.type,
+        currency=account_in.currency.upper() if account_in.currency else None,
     )
     db.add(account)
     await db.commit()
@@ -63,6 +89,70 @@ async def create_account(
     return account
 
 
+@router.get("/accounts/summary", response_model=AccountsSummary)
+@query_budget(5)
+async def accounts_summary(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+) -> AccountsSummary:
+    """Soldes de tous les comptes accessibles, convertis dans la devise de l’instance.
+
+    Les soldes sont agrégés en une requête groupée, puis convertis en une seule
+    passe au dernier taux connu à la date du jour.
+    """
+    from sqlalchemy import BigInteger, case, func, select, type_coerce
+    base_currency = (await db.execute(select(GlobalConfig.currency))).scalars().first() or "EUR"
+    await fx_cache.ensure_loaded(db)
+    account_ids = await get_accessible_account_ids(db, current_user)
+    accounts = BankAccount.__table__
+    ops = Operation.__table__
+    cents = type_coerce(ops.c.amount, BigInteger)
+    movements = (
+        select(
+            ops.c.account_id,
+            func.sum(case((ops.c.type == OperationType.REVENU, cents), else_=-cents)).label("delta"),
+        )
+        .where(ops.c.account_id.in_(account_ids))
+        .group_by(ops.c.account_id)
+        .subquery()
+    )
+    result = await db.execute(
+        select(
+            accounts.c.id,
+            accounts.c.name,
+            func.coalesce(accounts.c.currency, base_currency),
+            type_coerce(accounts.c.initial_balance, BigInteger)
+            + type_coerce(accounts.c.archived_balance, BigInteger)
+            + func.coalesce(movements.c.delta, 0),
+        )
+        .outerjoin(movements, movements.c.account_id == accounts.c.id)
+        .where(accounts.c.id.in_(account_ids))
+        .order_by(accounts.c.id)
+    )
+    rows = result.all()
+    today = date.today()
+    converted = fx_cache.convert_cents(
+        [row[2] for row in rows], [row[3] for row in rows], today, base_currency
+    )
+    lines = [
+        AccountSummaryLine(
+            account_id=acc_id,
+            name=name,
+            currency=currency,
+            balance=from_cents(balance),
+            converted_balance=None if value is None else from_cents(value),
+        )
+        for (acc_id, name, currency, balance), value in zip(rows, converted)
+    ]
+    return AccountsSummary(
+        currency=base_currency,
+        rate_date=today,
+        accounts=lines,
+        total=from_cents(sum(value for value in converted if value is not None)),
+        missing_rates=sorted({line.currency for line in lines if line.converted_balance is None}),
+    )
+
+
 def _get_account_or_404(db: AsyncSession, account_id: int) -> BankAccount:
     """Récupère un compte ou lève 404 (utilitaire interne synchronisé)."""
     raise NotImplementedError  # placeholder pour Mypy
@@ -70,6 +160,7 @@ def _get_account_or_404(db: AsyncSession, account_id: int) -> BankAccount:
 
 # Retourne 201 (Created) pour refléter la création ou mise à jour d’un partage
 @router.post("/accounts/{account_id}/shares", status_code=201)
+@query_budget(4)
 async def share_account(
     account_id: int,
     share_in: ShareCreate,
@@ -101,8 +192,12 @@ async def share_account(
         .where(AccountShare.user_id == share_in.user_id)
     )
     share = result_share.scalars().first()
+    action = AuditAction.CREATE
     if share:
+        if share.permission == share_in.permission:
+            return
         # Mise à jour de la permission
+        action = AuditAction.UPDATE
         share.permission = share_in.permission
         db.add(share)
     else:
@@ -113,4 +208,269 @@ async def share_account(
         )
         db.add(share)
     await db.commit()
-    return
\ No newline at end of file
+    audit_log.record(
+        account_id, current_user.id, AuditEntity.SHARE, share_in.user_id, action, {"permission": share_in.permission}
+    )
+    return
+
+
+async def _check_owner(db: AsyncSession, user: User, account_id: int) -> None:
+    from sqlalchemy import select
+    owner_id = (
+        await db.execute(select(BankAccount.owner_id).where(BankAccount.id == account_id))
+    ).scalar_one_or_none()
+    if owner_id is None:
+        raise HTTPException(status_code=404, detail="Account not found")
+    if owner_id != user.id:
+        raise HTTPException(status_code=403, detail="Only owner can share account")
+
+
+def _upsert_shares(dialect: str):
+    """`INSERT … ON CONFLICT (account_id, user_id) DO UPDATE` pour `dialect`."""
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    stmt = insert(AccountShare)
+    return stmt.on_conflict_do_update(
+        index_elements=["account_id", "user_id"],
+        set_={"permission": stmt.excluded.permission},
+    )
+
+
+@router.get("/accounts/{account_id}/shares", response_model=list[ShareRead])
+@query_budget(3)
+async def list_shares(
+    account_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+) -> list[ShareRead]:
+    """Partages actuels d’un compte (propriétaire uniquement)."""
+    from sqlalchemy import select
+    await _check_owner(db, current_user, account_id)
+    result = await db.execute(
+        select(AccountShare.user_id, User.username, AccountShare.permission)
+        .join(User, User.id == AccountShare.user_id)
+        .where(AccountShare.account_id == account_id)
+        .order_by(User.username)
+    )
+    return [
+        ShareRead(user_id=user_id, username=username, permission=permission)
+        for user_id, username, permission in result
+    ]
+
+
+@router.put("/accounts/{account_id}/shares", response_model=list[ShareRead])
+@query_budget(6)
+async def replace_shares(
+    account_id: int,
+    shares_in: list[ShareCreate],
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+) -> list[ShareRead]:
+    """Remplace l’ensemble des partages d’un compte par la liste fournie.
+
+    La liste est appliquée comme un diff avec les partages actuels, lus en une
+    requête : un seul `DELETE` retire les utilisateurs absents, un seul upsert
+    sur `uq_account_user` crée ou met à jour les permissions modifiées (chaque
+    différence est journalisée). Les utilisateurs sont validés en une requête.
+    Retourne les partages effectifs (triés par nom d’utilisateur).
+    """
+    from sqlalchemy import delete, select
+    await _check_owner(db, current_user, account_id)
+    desired = {share.user_id: share.permission for share in shares_in}
+    if len(desired) != len(shares_in):
+        raise HTTPException(status_code=400, detail="Duplicate user in share list")
+    if current_user.id in desired:
+        raise HTTPException(status_code=400, detail="Cannot share account with yourself")
+    usernames: dict[int, str] = {}
+    if desired:
+        result = await db.execute(select(User.id, User.username).where(User.id.in_(desired)))
+        usernames = dict(result.all())
+        missing = sorted(set(desired) - set(usernames))
+        if missing:
+            raise HTTPException(
+                status_code=404, detail=f"User(s) not found: {', '.join(map(str, missing))}"
+            )
+    result = await db.execute(
+        select(AccountShare.user_id, AccountShare.permission).where(AccountShare.account_id == account_id)
+    )
+    current = dict(result.all())
+    removed = sorted(set(current) - set(desired))
+    changed = {
+        user_id: permission for user_id, permission in desired.items() if current.get(user_id) != permission
+    }
+    if removed:
+        await db.execute(
+            delete(AccountShare)
+            .where(AccountShare.account_id == account_id)
+            .where(AccountShare.user_id.in_(removed))
+        )
+    if changed:
+        await db.execute(
+            _upsert_shares(db.bind.dialect.name),
+            [
+                {"account_id": account_id, "user_id": user_id, "permission": permission}
+                for user_id, permission in changed.items()
+            ],
+        )
+    await db.commit()
+    for user_id in removed:
+        audit_log.record(account_id, current_user.id, AuditEntity.SHARE, user_id, AuditAction.DELETE)
+    for user_id, permission in changed.items():
+        action = AuditAction.UPDATE if user_id in current else AuditAction.CREATE
+        audit_log.record(account_id, current_user.id, AuditEntity.SHARE, user_id, action, {"permission": permission})
+    return sorted(
+        (
+            ShareRead(user_id=user_id, username=usernames[user_id], permission=permission)
+            for user_id, permission in desired.items()
+        ),
+        key=lambda share: share.username,
+    )
+
+
+@router.get("/accounts/{account_id}/duplicates", response_model=list[DuplicateGroup])
+@query_budget(3)
+async def list_duplicates(
+    account_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+) -> list[DuplicateGroup]:
+    """Rapport des opérations probablement saisies en double sur un compte."""
+    if account_id not in await get_accessible_account_ids(db, current_user):
+        raise HTTPException(status_code=403, detail="Not authorized to view this account")
+    groups = await account_duplicates(db, account_id)
+    return [
+        DuplicateGroup(
+            fingerprint=group[0].fingerprint,
+            operations=[OperationRead.model_validate(op) for op in group],
+        )
+        for group in groups
+    ]
+
+
+@router.get("/accounts/{account_id}/balance", response_model=AccountBalance)
+@query_budget(3)
+async def get_balance(
+    account_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+) -> AccountBalance:
+    """Solde courant d’un compte, agrégé en SQL sur les centimes entiers."""
+    from sqlalchemy import BigInteger, case, func, select, true, type_coerce
+    if account_id not in await get_accessible_account_ids(db, current_user):
+        raise HTTPException(status_code=403, detail="Not authorized to view this account")
+    accounts = BankAccount.__table__
+    ops = Operation.__table__
+    cents = type_coerce(ops.c.amount, BigInteger)
+    totals = (
+        select(
+            func.coalesce(func.sum(case((ops.c.type == OperationType.REVENU, cents), else_=0)), 0).label("revenue"),
+            func.coalesce(func.sum(case((ops.c.type == OperationType.DEPENSE, cents), else_=0)), 0).label("expense"),
+        )
+        .where(ops.c.account_id == account_id)
+        .subquery()
+    )
+    result = await db.execute(
+        select(
+            type_coerce(accounts.c.initial_balance, BigInteger),
+            type_coerce(accounts.c.archived_balance, BigInteger),
+            totals.c.revenue,
+            totals.c.expense,
+        )
+        .select_from(accounts.join(totals, true()))
+        .where(accounts.c.id == account_id)
+    )
+    initial, archived, revenue, expense = result.one()
+    return AccountBalance(
+        account_id=account_id,
+        initial_balance=from_cents(initial),
+        total_revenue=from_cents(revenue),
+        total_expense=from_cents(expense),
+        archived_balance=from_cents(archived),
+        balance=from_cents(initial + archived + revenue - expense),
+    )
+
+
+@router.get("/accounts/{account_id}/snapshots", response_model=list[AccountSnapshotRead])
+@query_budget(4)
+async def list_snapshots(
+    account_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+    from_month: date | None = None,
+    to_month: date | None = None,
+) -> list[AccountSnapshotRead]:
+    """Relevés mensuels figés d’un compte, du plus ancien au plus récent."""
+    from sqlalchemy import select
+    if account_id not in await get_accessible_account_ids(db, current_user):
+        raise HTTPException(status_code=403, detail="Not authorized to view this account")
+    filters = [AccountSnapshot.account_id == account_id]
+    category_filters = [CategorySnapshot.account_id == account_id]
+    if from_month:
+        filters.append(AccountSnapshot.month >= from_month.replace(day=1))
+        category_filters.append(CategorySnapshot.month >= from_month.replace(day=1))
+    if to_month:
+        filters.append(AccountSnapshot.month <= to_month)
+        category_filters.append(CategorySnapshot.month <= to_month)
+    snapshots = (
+        await db.execute(select(AccountSnapshot).where(*filters).order_by(AccountSnapshot.month))
+    ).scalars().all()
+    categories = (
+        await db.execute(
+            select(CategorySnapshot).where(*category_filters).order_by(CategorySnapshot.category_id)
+        )
+    ).scalars().all()
+    by_month: dict[date, list[CategorySnapshotRead]] = {}
+    for row in categories:
+        by_month.setdefault(row.month, []).append(
+            CategorySnapshotRead(
+                category_id=row.category_id,
+                revenue=row.revenue,
+                expense=row.expense,
+                operation_count=row.operation_count,
+            )
+        )
+    return [
+        AccountSnapshotRead(
+            month=snap.month,
+            revenue=snap.revenue,
+            expense=snap.expense,
+            operation_count=snap.operation_count,
+            closing_balance=snap.closing_balance,
+            categories=by_month.get(snap.month, []),
+        )
+        for snap in snapshots
+    ]
+
+
+@router.get("/accounts/{account_id}/audit", response_model=list[AuditEventRead])
+@query_budget(3)
+async def list_audit_events(
+    account_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+    before_id: int | None = None,
+    limit: int = Query(default=50, ge=1, le=500),
+) -> list[AuditEventRead]:
+    """Journal d’audit d’un compte, du plus récent au plus ancien.
+
+    Pagination par clé : passer l’`id` du dernier événement reçu dans
+    `before_id` pour obtenir la page suivante. Les événements sont écrits par
+    lots et apparaissent au plus `AUDIT_FLUSH_INTERVAL_MS` ms après la
+    modification.
+    """
+    from sqlalchemy import select
+    if account_id not in await get_accessible_account_ids(db, current_user):
+        raise HTTPException(status_code=403, detail="Not authorized to view this account")
+    events = AuditEvent.__table__
+    stmt = (
+        select(*events.c, User.username)
+        .outerjoin(User, User.id == events.c.user_id)
+        .where(events.c.account_id == account_id)
+        .order_by(events.c.id.desc())
+        .limit(limit)
+    )
+    if before_id is not None:
+        stmt = stmt.where(events.c.id < before_id)
+    return [AuditEventRead.model_validate(row) for row in (await db.execute(stmt)).mappings()]
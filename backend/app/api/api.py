@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter
 
-from . import setup, auth, users, accounts, categories, operations, recurring
+from . import setup, auth, users, accounts, categories, operations, recurring, jobs, forecast, budgets
 
 
 api_router = APIRouter()
@@ -15,4 +15,7 @@ api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(accounts.router, prefix="/accounts", tags=["accounts"])
 api_router.include_router(categories.router, prefix="/categories", tags=["categories"])
 api_router.include_router(operations.router, prefix="/operations", tags=["operations"])
-api_router.include_router(recurring.router, prefix="/recurring", tags=["recurring"])
\ No newline at end of file
+api_router.include_router(recurring.router, prefix="/recurring", tags=["recurring"])
+api_router.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
+api_router.include_router(forecast.router, prefix="/forecast", tags=["forecast"])
+api_router.include_router(budgets.router, prefix="/budgets", tags=["budgets"])
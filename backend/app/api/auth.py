@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..core.query_budget import query_budget
 from ..database import get_session
 from ..models.user import User
 from ..core.security import verify_password, get_password_hash, create_token
@@ -24,6 +25,7 @@ class LoginRequest(BaseModel):
 
 
 @router.post("/login", response_model=Token)
+@query_budget(1)
 async def login(
     data: LoginRequest,
     response: Response,
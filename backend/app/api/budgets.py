@@ -0,0 +1,175 @@
+"""Routes pour gérer les budgets par catégorie et lire leur consommation."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.budgets import open_counters, period_end, period_start
+from ..core.money import from_cents, to_cents
+from ..core.query_budget import query_budget
+from ..database import get_session
+from ..models.budget import Budget, BudgetCounter, BudgetEvent
+from ..models.enums import BudgetPeriod
+from ..models.user import User
+from ..schemas.budget import BudgetCreate, BudgetEventRead, BudgetRead, BudgetStatus
+from .deps import check_references, get_accessible_account_ids, get_current_user
+
+
+router = APIRouter()
+
+
+async def _visible_budgets(db: AsyncSession, user: User):
+    """Condition SQL : budgets de l’utilisateur ou portant sur un compte accessible."""
+    from sqlalchemy import or_
+    budgets = Budget.__table__
+    return or_(
+        budgets.c.user_id == user.id,
+        budgets.c.account_id.in_(await get_accessible_account_ids(db, user)),
+    )
+
+
+@router.get("/budgets", response_model=list[BudgetRead])
+@query_budget(3)
+async def list_budgets(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+) -> list[Budget]:
+    """Liste les budgets visibles par l’utilisateur."""
+    from sqlalchemy import select
+    visible = await _visible_budgets(db, current_user)
+    result = await db.execute(select(Budget).where(visible).order_by(Budget.id))
+    return result.scalars().all()
+
+
+@router.post("/budgets", response_model=BudgetRead, status_code=201)
+@query_budget(7)
+async def create_budget(
+    budget_in: BudgetCreate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+) -> Budget:
+    """Crée un budget et initialise son compteur de la période en cours.
+
+    Sans `account_id`, le budget porte sur tous les comptes dont l’utilisateur
+    est propriétaire. L’administrateur ne peut pas créer de budgets.
+    """
+    if current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin cannot create budgets")
+    if budget_in.account_id is not None:
+        if budget_in.account_id not in await get_accessible_account_ids(db, current_user):
+            raise HTTPException(status_code=403, detail="Not authorized to view this account")
+    await check_references(db, [budget_in.category_id])
+    budget = Budget(
+        **budget_in.model_dump(),
+        user_id=current_user.id,
+        since=period_start(budget_in.period, date.today()),
+    )
+    db.add(budget)
+    await db.flush()
+    await open_counters(db, budget)
+    await db.commit()
+    return budget
+
+
+@router.delete("/budgets/{budget_id}", status_code=204)
+@query_budget(5)
+async def delete_budget(
+    budget_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+) -> Response:
+    """Supprime un budget, ses compteurs et ses événements (créateur uniquement)."""
+    from sqlalchemy import delete, select
+    owner_id = (await db.execute(select(Budget.user_id).where(Budget.id == budget_id))).scalar_one_or_none()
+    if owner_id is None:
+        raise HTTPException(status_code=404, detail="Budget not found")
+    if owner_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Only the creator can delete a budget")
+    await db.execute(delete(BudgetEvent.__table__).where(BudgetEvent.budget_id == budget_id))
+    await db.execute(delete(BudgetCounter.__table__).where(BudgetCounter.budget_id == budget_id))
+    await db.execute(delete(Budget.__table__).where(Budget.id == budget_id))
+    await db.commit()
+    return Response(status_code=204)
+
+
+@router.get("/budgets/status", response_model=list[BudgetStatus])
+@query_budget(3)
+async def budgets_status(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+) -> list[BudgetStatus]:
+    """Consommation de chaque budget visible sur sa période en cours.
+
+    Une seule requête lit chaque budget et le compteur de sa période ; aucune
+    opération n’est relue.
+    """
+    from sqlalchemy import and_, case, select
+    budgets = Budget.__table__
+    counters = BudgetCounter.__table__
+    today = date.today()
+    current = case({period: period_start(period, today) for period in BudgetPeriod}, value=budgets.c.period)
+    result = await db.execute(
+        select(
+            budgets.c.id,
+            budgets.c.category_id,
+            budgets.c.account_id,
+            budgets.c.period,
+            budgets.c.limit_amount,
+            budgets.c.alert_percent,
+            counters.c.spent,
+        )
+        .outerjoin(
+            counters,
+            and_(counters.c.budget_id == budgets.c.id, counters.c.period_start == current),
+        )
+        .where(await _visible_budgets(db, current_user))
+        .order_by(budgets.c.id)
+    )
+    lines = []
+    for budget_id, category_id, account_id, period, limit, alert_percent, spent in result:
+        spent_cents, limit_cents = to_cents(spent or 0), to_cents(limit)
+        start = period_start(period, today)
+        lines.append(
+            BudgetStatus(
+                budget_id=budget_id,
+                category_id=category_id,
+                account_id=account_id,
+                period=period,
+                period_start=start,
+                period_end=period_end(period, start),
+                limit_amount=limit,
+                spent=from_cents(spent_cents),
+                remaining=from_cents(limit_cents - spent_cents),
+                percent=spent_cents * 100 // limit_cents,
+                alert=spent_cents * 100 >= alert_percent * limit_cents,
+                exceeded=spent_cents > limit_cents,
+            )
+        )
+    return lines
+
+
+@router.get("/budgets/events", response_model=list[BudgetEventRead])
+@query_budget(3)
+async def list_budget_events(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+    after_id: int = 0,
+    limit: int = Query(default=100, ge=1, le=1000),
+) -> list[BudgetEvent]:
+    """Franchissements de seuil des budgets visibles, du plus récent au plus ancien.
+
+    `after_id` permet de ne récupérer que les événements nouveaux (scrutation).
+    """
+    from sqlalchemy import select
+    result = await db.execute(
+        select(BudgetEvent)
+        .join(Budget, Budget.id == BudgetEvent.budget_id)
+        .where(await _visible_budgets(db, current_user))
+        .where(BudgetEvent.id > after_id)
+        .order_by(BudgetEvent.id.desc())
+        .limit(limit)
+    )
+    return result.scalars().all()
@@ -5,6 +5,8 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..core.query_budget import query_budget
+from ..core.reference import reference
 from ..database import get_session
 from ..models.category import Category
 from ..schemas.category import CategoryCreate, CategoryRead
@@ -16,45 +18,56 @@ router = APIRouter()
 
 
 @router.get("/categories", response_model=list[CategoryRead])
-async def list_categories(db: AsyncSession = Depends(get_session)) -> list[Category]:
-    """Liste toutes les catégories non supprimées."""
-    from sqlalchemy import select
-    result = await db.execute(select(Category).where(Category.deleted.is_(False)))
-    return result.scalars().all()
+@query_budget(1)
+async def list_categories(db: AsyncSession = Depends(get_session)) -> list[CategoryRead]:
+    """Liste toutes les catégories non supprimées (registre en mémoire)."""
+    await reference.ensure_loaded(db)
+    return [
+        CategoryRead(id=category_id, name=name, deleted=deleted)
+        for category_id, name, deleted in reference.categories.items()
+        if not deleted
+    ]
 
 
 @router.post("/categories", response_model=CategoryRead, status_code=201)
+@query_budget(4)
 async def create_category(
     category_in: CategoryCreate,
     db: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ) -> Category:
     """Crée une catégorie (accessible à tous les utilisateurs)."""
-    from sqlalchemy import select
-    exists = await db.execute(select(Category).where(Category.name == category_in.name))
-    if exists.scalars().first():
+    from sqlalchemy.exc import IntegrityError
+    await reference.ensure_loaded(db)
+    if reference.categories.id_of(category_in.name) is not None:
         raise HTTPException(status_code=400, detail="Category already exists")
     cat = Category(name=category_in.name)
     db.add(cat)
-    await db.commit()
+    try:
+        await db.commit()
+    except IntegrityError:
+        # Créée entre-temps par un autre worker
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Category already exists")
+    finally:
+        reference.bump()
     await db.refresh(cat)
     return cat
 
 
 # Retourne 200 (OK) car FastAPI refuse 204 avec un corps
 @router.delete("/categories/{category_id}", status_code=200)
+@query_budget(3)
 async def delete_category(
     category_id: int,
     db: AsyncSession = Depends(get_session),
     current_admin: User = Depends(require_admin),
 ) -> None:
     """Supprime (soft-delete) une catégorie (admin uniquement)."""
-    from sqlalchemy import select
-    result = await db.execute(select(Category).where(Category.id == category_id))
-    cat = result.scalars().first()
-    if not cat:
+    from sqlalchemy import update
+    result = await db.execute(update(Category.__table__).where(Category.id == category_id).values(deleted=True))
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Category not found")
-    cat.deleted = True
-    db.add(cat)
     await db.commit()
-    return
\ No newline at end of file
+    reference.bump()
+    return
@@ -6,22 +6,27 @@ de l’utilisateur courant à partir du cookie d’authentification.
 
 from __future__ import annotations
 
+from typing import Callable, Iterable
+
 from fastapi import Depends, HTTPException, status, Cookie
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database import get_session
+from ..models.account import BankAccount
+from ..models.enums import PermissionLevel
+from ..models.share import AccountShare
 from ..models.user import User
+from ..core.reference import reference
 from ..core.security import decode_token
 
 
-async def get_db() -> AsyncSession:
-    """Dépendance pour obtenir une session de base de données."""
-    async for session in get_session():
-        yield session
+# Alias conservé pour compatibilité : c’est la même dépendance que
+# `get_session`, donc la même session pour toute la requête.
+get_db = get_session
 
 
 async def get_current_user(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_session),
     access_token: str | None = Cookie(default=None, alias="access_token"),
 ) -> User:
     """Récupère l’utilisateur courant à partir du cookie `access_token`.
@@ -67,4 +72,72 @@ async def require_admin(
     """Vérifie que l’utilisateur courant est administrateur."""
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin privileges required")
-    return current_user
\ No newline at end of file
+    return current_user
+
+
+async def get_accessible_account_ids(db: AsyncSession, user: User) -> list[int]:
+    """Identifiants des comptes possédés par l’utilisateur ou partagés avec lui."""
+    from sqlalchemy import select
+
+    q_owned = select(BankAccount.id).where(BankAccount.owner_id == user.id)
+    q_shared = select(AccountShare.account_id).where(AccountShare.user_id == user.id)
+    result = await db.execute(q_owned.union(q_shared))
+    return list(result.scalars().all())
+
+
+async def check_account_permission(
+    db: AsyncSession,
+    user: User,
+    account_ids: Iterable[int],
+    allowed: Callable[[User, PermissionLevel], bool],
+    detail: str,
+) -> None:
+    """Vérifie en une requête (compte et partage joints) que chaque compte
+    existe et que l’utilisateur en est propriétaire ou que `allowed` accepte
+    le niveau de son partage.
+
+    404 si un compte n’existe pas, 403 avec `detail` si un droit manque.
+    """
+    from sqlalchemy import and_, select
+    account_ids = set(account_ids)
+    result = await db.execute(
+        select(BankAccount.id, BankAccount.owner_id, AccountShare.permission)
+        .outerjoin(
+            AccountShare,
+            and_(AccountShare.account_id == BankAccount.id, AccountShare.user_id == user.id),
+        )
+        .where(BankAccount.id.in_(account_ids))
+    )
+    permitted = {
+        acc_id: owner_id == user.id or (permission is not None and allowed(user, permission))
+        for acc_id, owner_id, permission in result
+    }
+    if set(permitted) != account_ids:
+        raise HTTPException(status_code=404, detail="Account not found")
+    if not all(permitted.values()):
+        raise HTTPException(status_code=403, detail=detail)
+
+
+async def check_references(
+    db: AsyncSession,
+    category_ids: Iterable[int | None] = (),
+    payment_method_ids: Iterable[int | None] = (),
+) -> None:
+    """Vérifie catégories et moyens de paiement référencés, sans requête SQL
+    tant que le registre en mémoire est à jour (voir `core.reference`).
+
+    404 si un identifiant n’existe pas, 400 s’il désigne une ligne supprimée.
+    """
+    for table, ids in ((reference.categories, category_ids), (reference.payment_methods, payment_method_ids)):
+        ids = {row_id for row_id in ids if row_id is not None}
+        if not ids:
+            continue
+        missing, deleted = await reference.check(db, table, ids)
+        if missing:
+            raise HTTPException(
+                status_code=404, detail=f"{table.label} not found: {', '.join(map(str, missing))}"
+            )
+        if deleted:
+            raise HTTPException(
+                status_code=400, detail=f"{table.label} is deleted: {', '.join(map(str, deleted))}"
+            )
@@ -0,0 +1,166 @@
+"""Routes de prévision de trésorerie et de simulation « et si »."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.forecast import PlannedItem, add_operations, forecast_cache, horizon, project
+from ..core.money import from_cents
+from ..core.query_budget import query_budget
+from ..core.responses import FastJSONResponse
+from ..database import get_session
+from ..models.account import BankAccount
+from ..models.enums import OperationType
+from ..models.operation import Operation
+from ..models.recurring import RecurringItem
+from ..models.user import User
+from ..schemas.forecast import ForecastRead, ForecastScenario
+from .deps import get_accessible_account_ids, get_current_user
+
+
+router = APIRouter()
+
+
+@router.get("/forecast", response_model=ForecastRead)
+@query_budget(5)
+async def get_forecast(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+    months: int = Query(default=6, ge=1, le=12),
+    account_id: int | None = None,
+) -> FastJSONResponse:
+    """Projection quotidienne des soldes des comptes accessibles (ou d’un compte)."""
+    scenario = ForecastScenario(months=months, account_ids=[account_id] if account_id else None)
+    return await _forecast(db, current_user, scenario)
+
+
+@router.post("/forecast", response_model=ForecastRead)
+@query_budget(5)
+async def simulate_forecast(
+    scenario: ForecastScenario,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+) -> FastJSONResponse:
+    """Projection avec des items ajoutés, modifiés ou retirés et des opérations
+    ponctuelles hypothétiques. Rien n’est enregistré."""
+    return await _forecast(db, current_user, scenario)
+
+
+async def _forecast(db: AsyncSession, user: User, scenario: ForecastScenario) -> FastJSONResponse:
+    """Soldes de départ, items actifs et opérations futures : trois requêtes
+    pour tous les comptes, puis projection en mémoire (`core.forecast`)."""
+    from sqlalchemy import BigInteger, case, func, select, type_coerce
+    accessible = await get_accessible_account_ids(db, user)
+    # Les comptes visés par le scénario sont projetés avec ceux demandés
+    requested = set(scenario.account_ids or accessible)
+    requested.update(item.account_id for item in scenario.add)
+    requested.update(op.account_id for op in scenario.one_off)
+    if requested - set(accessible):
+        raise HTTPException(status_code=403, detail="Not authorized to view this account")
+    today = date.today()
+    first, days = horizon(today, scenario.months)
+    last = today.fromordinal(first.toordinal() + days - 1)
+    if not requested:
+        return FastJSONResponse({"start_date": first, "end_date": last, "accounts": []})
+    account_ids = sorted(requested)
+
+    accounts = BankAccount.__table__
+    ops = Operation.__table__
+    items = RecurringItem.__table__
+    cents = type_coerce(ops.c.amount, BigInteger)
+    movements = (
+        select(
+            ops.c.account_id,
+            func.sum(case((ops.c.type == OperationType.REVENU, cents), else_=-cents)).label("delta"),
+        )
+        .where(ops.c.account_id.in_(account_ids))
+        .where(ops.c.date <= today)
+        .group_by(ops.c.account_id)
+        .subquery()
+    )
+    openings = (
+        await db.execute(
+            select(
+                accounts.c.id,
+                accounts.c.name,
+                type_coerce(accounts.c.initial_balance, BigInteger)
+                + type_coerce(accounts.c.archived_balance, BigInteger)
+                + func.coalesce(movements.c.delta, 0),
+            )
+            .outerjoin(movements, movements.c.account_id == accounts.c.id)
+            .where(accounts.c.id.in_(account_ids))
+            .order_by(accounts.c.id)
+        )
+    ).all()
+    planned = await db.execute(
+        select(*(items.c[name] for name in PlannedItem._fields))
+        .where(items.c.account_id.in_(account_ids))
+        .where(items.c.active.is_(True))
+        .order_by(items.c.id)
+    )
+    future = await db.execute(
+        select(ops.c.account_id, ops.c.date, ops.c.type, ops.c.amount, ops.c.label)
+        .where(ops.c.account_id.in_(account_ids))
+        .where(ops.c.date > today)
+        .where(ops.c.date <= last)
+    )
+
+    # Appliquer le scénario aux items lus
+    by_account: dict[int, list[PlannedItem]] = {account_id: [] for account_id in account_ids}
+    changes = {change.id: change for change in scenario.change}
+    for row in planned:
+        item = PlannedItem(*row)
+        change = changes.pop(item.id, None)
+        if change is not None:
+            if change.active is False:
+                continue
+            item = item._replace(**change.model_dump(exclude_none=True, exclude={"id", "active"}))
+        by_account[item.account_id].append(item)
+    if changes:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Recurring item(s) not found: {', '.join(str(item_id) for item_id in changes)}",
+        )
+    for added in scenario.add:
+        by_account[added.account_id].append(
+            PlannedItem(
+                None,
+                added.account_id,
+                added.type,
+                added.label,
+                added.amount,
+                added.frequency,
+                added.moment,
+                added.start_date,
+                added.end_date,
+            )
+        )
+    operations: dict[int, list[tuple]] = {}
+    for account_id, day, kind, amount, label in future:
+        operations.setdefault(account_id, []).append((day, kind, amount, label))
+    for op in scenario.one_off:
+        operations.setdefault(op.account_id, []).append((op.date, op.type, op.amount, op.label))
+
+    lines = []
+    for account_id, name, opening in openings:
+        account_items = tuple(by_account[account_id])
+        deltas = forecast_cache.deltas(account_id, first, days, account_items)
+        add_operations(deltas, first, operations.get(account_id, ()), account_items)
+        projection = project(opening, deltas, first)
+        lowest, lowest_day = projection.lowest()
+        lines.append(
+            {
+                "account_id": account_id,
+                "name": name,
+                "opening_balance": from_cents(opening),
+                "min_balance": from_cents(lowest),
+                "min_balance_date": lowest_day,
+                "first_overdraft": projection.first_overdraft(),
+                "closing_balance": from_cents(projection.balances[-1]),
+                "balances": [from_cents(balance) for balance in projection.balances],
+            }
+        )
+    return FastJSONResponse({"start_date": first, "end_date": last, "accounts": lines})
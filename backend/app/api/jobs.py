@@ -0,0 +1,58 @@
+"""Routes pour soumettre et suivre les tâches de fond."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.query_budget import query_budget
+from ..database import get_session
+from ..jobs.queue import enqueue, get_task
+from ..models.job import Job
+from ..models.user import User
+from ..schemas.job import JobCreate, JobRead
+from .deps import get_current_user
+
+
+router = APIRouter()
+
+
+@router.post("/jobs", response_model=JobRead, status_code=status.HTTP_202_ACCEPTED)
+@query_budget(3)
+async def create_job(
+    job_in: JobCreate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+) -> Job:
+    """Place une tâche dans la file et retourne immédiatement (202).
+
+    L’avancement se suit ensuite via `GET /jobs/{job_id}`. Un payload non
+    conforme au schéma du type de tâche est refusé (422).
+    """
+    spec = get_task(job_in.kind)
+    if spec is None:
+        raise HTTPException(status_code=400, detail="Unknown job kind")
+    if spec.admin_only and not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin privileges required")
+    try:
+        return await enqueue(db, job_in.kind, job_in.payload, owner_id=current_user.id)
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", "payload", *error["loc"])} for error in exc.errors()]
+        ) from None
+
+
+@router.get("/jobs/{job_id}", response_model=JobRead)
+@query_budget(2)
+async def get_job(
+    job_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+) -> Job:
+    """Retourne l’état d’une tâche soumise par l’utilisateur courant."""
+    job = await db.get(Job, job_id)
+    if job is None or (job.owner_id != current_user.id and not current_user.is_admin):
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
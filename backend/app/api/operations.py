@@ -2,17 +2,41 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..core.audit import audit_log
+from ..core.budgets import Spending, record_spending
+from ..core.categorizer import categorizer
+from ..core.duplicates import find_duplicates, operation_fingerprint
+from ..core.responses import FastJSONResponse, rows_response
+from ..core.search import fts_match_clause, search_terms
+from ..core.query_budget import query_budget
 from ..database import get_session
+from ..jobs.statements import mark_stale
 from ..models.operation import Operation
 from ..models.account import BankAccount
-from ..models.share import AccountShare
-from ..models.enums import PermissionLevel, OperationType
+from ..models.category import Category
+from ..models.payment_method import PaymentMethod
+from ..models.snapshot import ArchivedOperation
+from ..models.enums import AuditAction, AuditEntity, PermissionLevel, OperationType
 from ..models.user import User
-from ..schemas.operation import OperationCreate, OperationRead
-from .deps import get_current_user
+from ..schemas.operation import (
+    CategorizeRequest,
+    CategorySuggestion,
+    DuplicateMatch,
+    DuplicatePolicy,
+    BatchAction,
+    OperationBatch,
+    OperationBatchResult,
+    OperationBulkCreate,
+    OperationBulkResult,
+    OperationCreate,
+    OperationExpandedRead,
+    OperationRead,
+    OperationUpdate,
+)
+from .deps import check_account_permission, check_references, get_accessible_account_ids, get_current_user
 
 
 router = APIRouter()
@@ -26,76 +50,187 @@ def _has_permission_to_add(user: User, permission: PermissionLevel) -> bool:
     )
 
 
-@router.get("/operations", response_model=list[OperationRead])
+def _has_permission_to_manage(user: User, permission: PermissionLevel) -> bool:
+    return permission == PermissionLevel.FULL_MANAGE
+
+
+# Colonnes d’une opération reprises dans le journal d’audit
+_AUDITED_FIELDS = ("type", "label", "amount", "date", "category_id", "payment_method_id", "comment")
+
+
+def _audit(user: User, action: AuditAction, account_id: int, operation_id: int, values) -> None:
+    """Dépose dans le journal d’audit les champs suivis de `values` (objet ou dict)."""
+    if not isinstance(values, dict):
+        values = {name: getattr(values, name) for name in _AUDITED_FIELDS if hasattr(values, name)}
+    changes = {name: value for name, value in values.items() if name in _AUDITED_FIELDS}
+    audit_log.record(account_id, user.id, AuditEntity.OPERATION, operation_id, action, changes)
+
+
+async def _resolve_account_filter(
+    db: AsyncSession, user: User, account_id: int | None
+) -> list[int]:
+    """Comptes à interroger : tous les comptes accessibles ou `account_id` s’il l’est."""
+    acc_ids = await get_accessible_account_ids(db, user)
+    if account_id:
+        if account_id not in acc_ids:
+            raise HTTPException(status_code=403, detail="Not authorized to view this account")
+        return [account_id]
+    return acc_ids
+
+
+EXPANSIONS = ("category", "payment_method", "account")
+
+
+def _parse_expand(expand: str | None) -> set[str]:
+    """Analyse le paramètre `expand` (liste séparée par des virgules)."""
+    if not expand:
+        return set()
+    requested = {part.strip() for part in expand.split(",") if part.strip()}
+    unknown = requested.difference(EXPANSIONS)
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown expand value(s): {', '.join(sorted(unknown))}"
+        )
+    return requested
+
+
+def expanded_operations_query(account_ids: list[int], expand: set[str], source=None):
+    """Requête Core retournant les colonnes de lecture et les noms liés demandés.
+
+    Les jointures externes remplacent le chargement paresseux des relations
+    ORM (N+1 requêtes, interdit en asynchrone) ; les lignes obtenues sont
+    directement sérialisées sans instancier d’objets `Operation`. `source`
+    permet d’interroger la table d’archive plutôt que `operations`.
+    """
+    from sqlalchemy import select
+    ops = Operation.__table__ if source is None else source
+    stmt = select(
+        ops.c.id,
+        ops.c.type,
+        ops.c.label,
+        ops.c.amount,
+        ops.c.date,
+        ops.c.account_id,
+        ops.c.category_id,
+        ops.c.payment_method_id,
+        ops.c.comment,
+    ).where(ops.c.account_id.in_(account_ids))
+    if "category" in expand:
+        categories = Category.__table__
+        stmt = stmt.add_columns(categories.c.name.label("category_name")).outerjoin(
+            categories, categories.c.id == ops.c.category_id
+        )
+    if "payment_method" in expand:
+        methods = PaymentMethod.__table__
+        stmt = stmt.add_columns(methods.c.name.label("payment_method_name")).outerjoin(
+            methods, methods.c.id == ops.c.payment_method_id
+        )
+    if "account" in expand:
+        accounts = BankAccount.__table__
+        stmt = stmt.add_columns(accounts.c.name.label("account_name")).outerjoin(
+            accounts, accounts.c.id == ops.c.account_id
+        )
+    return stmt
+
+
+@router.get("/operations", response_model=list[OperationExpandedRead])
+@query_budget(3)
 async def list_operations(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_session),
     account_id: int | None = None,
+    expand: str | None = Query(
+        default=None, description="Noms liés à inclure : category, payment_method, account"
+    ),
+    include_archive: bool = False,
+) -> FastJSONResponse:
+    """Liste les opérations visibles par l’utilisateur. Optionnellement filtré par compte.
+
+    Avec `?expand=category,payment_method,account`, chaque opération inclut
+    les noms correspondants (`category_name`, …), obtenus par jointure.
+    Avec `?include_archive=true`, les opérations archivées sont ajoutées.
+    Les lignes sont encodées directement en JSON, sans objets ORM.
+    """
+    from sqlalchemy import union_all
+    requested = _parse_expand(expand)
+    acc_filter = await _resolve_account_filter(db, current_user, account_id)
+    if not acc_filter:
+        return FastJSONResponse([])
+    stmt = expanded_operations_query(acc_filter, requested)
+    if include_archive:
+        stmt = union_all(
+            stmt, expanded_operations_query(acc_filter, requested, ArchivedOperation.__table__)
+        )
+    result = await db.execute(stmt)
+    return rows_response(result)
+
+
+@router.get("/operations/search", response_model=list[OperationRead])
+@query_budget(3)
+async def search_operations(
+    q: str = Query(..., min_length=1, max_length=200),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+    account_id: int | None = None,
+    limit: int = Query(default=50, ge=1, le=200),
+    offset: int = Query(default=0, ge=0),
 ) -> list[Operation]:
-    """Liste les opérations visibles par l’utilisateur. Optionnellement filtré par compte."""
-    # Récupérer les comptes accessibles
-    acc_ids = []
+    """Recherche plein texte dans les libellés et commentaires des opérations.
+
+    Chaque mot est recherché par préfixe et sans tenir compte des accents
+    (« electricite » trouve « Électricité »). Les résultats sont limités aux
+    comptes accessibles et triés du plus récent au plus ancien.
+    """
     from sqlalchemy import select
-    # Récupérer les comptes dont l'utilisateur est propriétaire
-    q_owned = select(BankAccount).where(BankAccount.owner_id == current_user.id)
-    res_owned = await db.execute(q_owned)
-    acc_ids += [acc.id for acc in res_owned.scalars().all()]
-    # Récupérer les comptes partagés
-    q_shared = (
-        select(BankAccount)
-        .join(AccountShare, BankAccount.id == AccountShare.account_id)
-        .where(AccountShare.user_id == current_user.id)
-    )
-    res_shared = await db.execute(q_shared)
-    acc_ids += [acc.id for acc in res_shared.scalars().all()]
-    acc_ids = list(set(acc_ids))
-    if account_id:
-        if account_id not in acc_ids:
-            raise HTTPException(status_code=403, detail="Not authorized to view this account")
-        acc_filter = [account_id]
-    else:
-        acc_filter = acc_ids
+    terms = search_terms(q)
+    if not terms:
+        return []
+    acc_filter = await _resolve_account_filter(db, current_user, account_id)
     if not acc_filter:
         return []
-    result = await db.execute(select(Operation).where(Operation.account_id.in_(acc_filter)))
+    dialect = db.bind.dialect.name
+    result = await db.execute(
+        select(Operation)
+        .where(Operation.account_id.in_(acc_filter))
+        .where(fts_match_clause(dialect, terms))
+        .order_by(Operation.date.desc(), Operation.id.desc())
+        .limit(limit)
+        .offset(offset)
+    )
     return result.scalars().all()
 
 
 @router.post("/operations", response_model=OperationRead, status_code=201)
+@query_budget(10)
 async def create_operation(
     op_in: OperationCreate,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_session),
+    on_duplicate: DuplicatePolicy = DuplicatePolicy.FLAG,
 ) -> Operation:
     """Crée une opération courante.
 
     L’utilisateur doit être propriétaire du compte ou disposer d’un droit suffisant.
     L’administrateur ne peut pas créer d’opération.
+
+    Si une opération identique existe déjà à quelques jours près, elle est
+    signalée dans l’en-tête `X-Possible-Duplicate-Of` (`on_duplicate=flag`)
+    ou la création est refusée avec un code 409 (`on_duplicate=skip`).
     """
     if current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin cannot create operations")
-    # Vérifier que le compte existe
-    from sqlalchemy import select
-    result_acc = await db.execute(select(BankAccount).where(BankAccount.id == op_in.account_id))
-    account = result_acc.scalars().first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
-    # Vérifier la propriété ou le partage
-    allowed = False
-    if account.owner_id == current_user.id:
-        allowed = True
-    else:
-        # Vérifier le partage
-        result_share = await db.execute(
-            select(AccountShare)
-            .where(AccountShare.account_id == op_in.account_id)
-            .where(AccountShare.user_id == current_user.id)
-        )
-        share = result_share.scalars().first()
-        if share and _has_permission_to_add(current_user, share.permission):
-            allowed = True
-    if not allowed:
-        raise HTTPException(status_code=403, detail="Insufficient permission to add operation")
+    await _check_can_add(db, current_user, {op_in.account_id})
+    await check_references(db, [op_in.category_id], [op_in.payment_method_id])
+    fingerprint = operation_fingerprint(op_in.account_id, op_in.type, op_in.amount, op_in.label)
+    duplicate_of = (await find_duplicates(db, [(fingerprint, op_in.date)]))[0]
+    if duplicate_of:
+        if on_duplicate == DuplicatePolicy.SKIP:
+            raise HTTPException(
+                status_code=409,
+                detail={"message": "Probable duplicate operation", "duplicate_of": duplicate_of},
+            )
+        response.headers["X-Possible-Duplicate-Of"] = ",".join(map(str, duplicate_of))
     operation = Operation(
         type=op_in.type,
         label=op_in.label,
@@ -107,6 +242,268 @@ async def create_operation(
         comment=op_in.comment,
     )
     db.add(operation)
+    await db.flush()
+    await record_spending(db, added=[Spending.of(operation)])
+    await mark_stale(db, [(operation.account_id, operation.date)])
     await db.commit()
     await db.refresh(operation)
-    return operation
\ No newline at end of file
+    _audit(current_user, AuditAction.CREATE, operation.account_id, operation.id, operation)
+    categorizer.learn(
+        operation.account_id, operation.label, operation.category_id, operation.payment_method_id
+    )
+    return operation
+
+
+async def _check_can_add(db: AsyncSession, user: User, account_ids: set[int]) -> None:
+    """Vérifie en une requête le droit d’ajout sur chacun des comptes donnés."""
+    await check_account_permission(
+        db, user, account_ids, _has_permission_to_add, "Insufficient permission to add operation"
+    )
+
+
+async def _check_can_manage(db: AsyncSession, user: User, account_ids: set[int]) -> None:
+    """Vérifie en une requête le droit de modifier ou supprimer les opérations
+    existantes (propriétaire ou partage `FULL_MANAGE`) sur chacun des comptes."""
+    await check_account_permission(
+        db, user, account_ids, _has_permission_to_manage, "Insufficient permission to modify operation"
+    )
+
+
+@router.post("/operations/bulk", response_model=OperationBulkResult, status_code=201)
+@query_budget(9)
+async def create_operations_bulk(
+    bulk_in: OperationBulkCreate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+) -> OperationBulkResult:
+    """Crée un lot d’opérations (import), en détectant les doublons probables.
+
+    Les permissions sont vérifiées une fois par compte et les doublons sont
+    recherchés en une seule requête pour tout le lot. Avec `on_duplicate=skip`
+    (par défaut) les doublons ne sont pas créés ; avec `flag` ils le sont mais
+    restent signalés dans `duplicates`.
+    """
+    if current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin cannot create operations")
+    if not bulk_in.operations:
+        return OperationBulkResult(created=[], duplicates=[])
+    await _check_can_add(db, current_user, {op_in.account_id for op_in in bulk_in.operations})
+    await check_references(
+        db,
+        (op_in.category_id for op_in in bulk_in.operations),
+        (op_in.payment_method_id for op_in in bulk_in.operations),
+    )
+    candidates = [
+        (operation_fingerprint(op_in.account_id, op_in.type, op_in.amount, op_in.label), op_in.date)
+        for op_in in bulk_in.operations
+    ]
+    matches = await find_duplicates(db, candidates)
+    skip = bulk_in.on_duplicate == DuplicatePolicy.SKIP
+    rows: list[dict] = []
+    duplicates: list[DuplicateMatch] = []
+    for index, (op_in, (fingerprint, _), duplicate_of) in enumerate(zip(bulk_in.operations, candidates, matches)):
+        if duplicate_of:
+            duplicates.append(DuplicateMatch(index=index, duplicate_of=duplicate_of, skipped=skip))
+            if skip:
+                continue
+        rows.append({**op_in.model_dump(), "fingerprint": fingerprint})
+    created = []
+    if rows:
+        # Une seule instruction `INSERT … VALUES (…), (…) RETURNING` par paquet de
+        # lignes au lieu d’un INSERT par objet ORM. Les identifiants sont attribués
+        # dans l’ordre des lignes : le tri par id restitue l’ordre du lot.
+        from sqlalchemy import insert
+        ops = Operation.__table__
+        result = await db.execute(insert(ops).returning(*ops.c), rows)
+        created = sorted(
+            (OperationRead.model_validate(row) for row in result.mappings()), key=lambda op: op.id
+        )
+        await record_spending(db, added=[Spending.of(operation) for operation in created])
+        await mark_stale(db, [(operation.account_id, operation.date) for operation in created])
+    await db.commit()
+    for operation in created:
+        _audit(current_user, AuditAction.CREATE, operation.account_id, operation.id, operation)
+        categorizer.learn(
+            operation.account_id, operation.label, operation.category_id, operation.payment_method_id
+        )
+    return OperationBulkResult(created=created, duplicates=duplicates)
+
+
+# Colonnes obligatoires : une modification ne peut pas les mettre à `null`
+_REQUIRED_FIELDS = ("type", "label", "amount", "date", "category_id")
+# Colonnes entrant dans l’empreinte de doublon (voir `core.duplicates`)
+_FINGERPRINT_FIELDS = ("type", "amount", "label")
+
+
+def _clean_changes(changes: dict) -> dict:
+    nulls = [name for name in _REQUIRED_FIELDS if name in changes and changes[name] is None]
+    if nulls:
+        raise HTTPException(status_code=422, detail=f"Field(s) cannot be null: {', '.join(nulls)}")
+    return changes
+
+
+async def _operations_of(db: AsyncSession, operation_ids: list[int]) -> dict[int, Spending]:
+    """Compte, catégorie, type, montant et date de chaque opération demandée ;
+    404 si l’une d’elles n’existe pas."""
+    from sqlalchemy import select
+    ops = Operation.__table__
+    result = await db.execute(
+        select(ops.c.id, *(ops.c[name] for name in Spending._fields)).where(ops.c.id.in_(operation_ids))
+    )
+    operations = {row[0]: Spending(*row[1:]) for row in result}
+    if len(operations) != len(set(operation_ids)):
+        raise HTTPException(status_code=404, detail="Operation not found")
+    return operations
+
+
+@router.patch("/operations/{operation_id}", response_model=OperationRead)
+@query_budget(9)
+async def update_operation(
+    operation_id: int,
+    op_in: OperationUpdate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+) -> dict:
+    """Modifie partiellement une opération, en une seule instruction `UPDATE`.
+
+    Seuls les champs transmis sont écrits. L’empreinte de doublon est
+    recalculée si le type, le montant ou le libellé change ; l’index plein
+    texte est tenu à jour par ses triggers.
+    """
+    from sqlalchemy import select, update
+    if current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin cannot modify operations")
+    ops = Operation.__table__
+    result = await db.execute(
+        select(ops.c.account_id, ops.c.type, ops.c.amount, ops.c.label, ops.c.category_id, ops.c.date).where(
+            ops.c.id == operation_id
+        )
+    )
+    current = result.first()
+    if current is None:
+        raise HTTPException(status_code=404, detail="Operation not found")
+    await _check_can_manage(db, current_user, {current.account_id})
+    changes = _clean_changes(op_in.model_dump(exclude_unset=True))
+    await check_references(db, [changes.get("category_id")], [changes.get("payment_method_id")])
+    if any(name in changes for name in _FINGERPRINT_FIELDS):
+        merged = {**current._asdict(), **changes}
+        changes["fingerprint"] = operation_fingerprint(
+            current.account_id, merged["type"], merged["amount"], merged["label"]
+        )
+    columns = [getattr(ops.c, name) for name in OperationRead.model_fields]
+    if not changes:
+        row = (await db.execute(select(*columns).where(ops.c.id == operation_id))).one()
+        return row._asdict()
+    row = (
+        await db.execute(update(ops).where(ops.c.id == operation_id).values(**changes).returning(*columns))
+    ).one()
+    if {"type", "amount", "date", "category_id"} & changes.keys():
+        await record_spending(db, added=[Spending.of(row)], removed=[Spending.of(current)])
+        await mark_stale(db, [(current.account_id, current.date), (row.account_id, row.date)])
+    await db.commit()
+    _audit(current_user, AuditAction.UPDATE, current.account_id, operation_id, changes)
+    if {"label", "category_id", "payment_method_id"} & changes.keys():
+        categorizer.forget(current.account_id)
+    return row._asdict()
+
+
+@router.delete("/operations/{operation_id}", status_code=204)
+@query_budget(8)
+async def delete_operation(
+    operation_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+) -> Response:
+    """Supprime une opération."""
+    from sqlalchemy import delete
+    if current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin cannot modify operations")
+    operations = await _operations_of(db, [operation_id])
+    await _check_can_manage(db, current_user, {operations[operation_id].account_id})
+    await db.execute(delete(Operation.__table__).where(Operation.__table__.c.id == operation_id))
+    await record_spending(db, removed=operations.values())
+    await mark_stale(db, [(operation.account_id, operation.date) for operation in operations.values()])
+    await db.commit()
+    operation = operations[operation_id]
+    _audit(current_user, AuditAction.DELETE, operation.account_id, operation_id, operation)
+    categorizer.forget(operation.account_id)
+    return Response(status_code=204)
+
+
+@router.post("/operations/batch", response_model=OperationBatchResult)
+@query_budget(9)
+async def batch_operations(
+    batch_in: OperationBatch,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+) -> OperationBatchResult:
+    """Modifie ou supprime une sélection d’opérations en une seule instruction.
+
+    Les droits sont vérifiés une fois par compte concerné, puis un unique
+    `UPDATE … WHERE id IN (…)` ou `DELETE … WHERE id IN (…)` est exécuté.
+    Les modifications en masse se limitent à la date, la catégorie, le moyen
+    de paiement et le commentaire (recatégorisation d’une sélection, etc.).
+    """
+    from sqlalchemy import delete, update
+    if current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin cannot modify operations")
+    ids = sorted(set(batch_in.ids))
+    operations = await _operations_of(db, ids)
+    accounts = {operation.account_id for operation in operations.values()}
+    await _check_can_manage(db, current_user, accounts)
+    ops = Operation.__table__
+    changes: dict = {}
+    if batch_in.action == BatchAction.DELETE:
+        result = await db.execute(delete(ops).where(ops.c.id.in_(ids)))
+        await record_spending(db, removed=operations.values())
+        await mark_stale(db, [(operation.account_id, operation.date) for operation in operations.values()])
+    else:
+        changes = _clean_changes(
+            batch_in.changes.model_dump(exclude_unset=True) if batch_in.changes else {}
+        )
+        if not changes:
+            raise HTTPException(status_code=422, detail="No changes to apply")
+        await check_references(db, [changes.get("category_id")], [changes.get("payment_method_id")])
+        result = await db.execute(update(ops).where(ops.c.id.in_(ids)).values(**changes))
+        moved = {name: changes[name] for name in ("category_id", "date") if name in changes}
+        if moved:
+            added = [operation._replace(**moved) for operation in operations.values()]
+            await record_spending(db, added=added, removed=operations.values())
+            await mark_stale(
+                db, [(operation.account_id, operation.date) for operation in [*operations.values(), *added]]
+            )
+    await db.commit()
+    for operation_id, operation in operations.items():
+        if batch_in.action == BatchAction.DELETE:
+            _audit(current_user, AuditAction.DELETE, operation.account_id, operation_id, operation)
+        else:
+            _audit(current_user, AuditAction.UPDATE, operation.account_id, operation_id, changes)
+    if batch_in.action == BatchAction.DELETE or {"category_id", "payment_method_id"} & changes.keys():
+        for account_id in accounts:
+            categorizer.forget(account_id)
+    return OperationBatchResult(action=batch_in.action, count=result.rowcount)
+
+
+@router.post("/operations/categorize", response_model=list[CategorySuggestion])
+@query_budget(3)
+async def categorize_operations(
+    request: CategorizeRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session),
+) -> list[CategorySuggestion]:
+    """Suggère catégorie et moyen de paiement pour une liste de libellés.
+
+    Les suggestions s’appuient sur l’historique du compte, appris en mémoire ;
+    destiné aux imports, l’appel accepte jusqu’à 10 000 libellés.
+    """
+    await _resolve_account_filter(db, current_user, request.account_id)
+    suggestions = await categorizer.suggest_many(db, request.account_id, request.labels)
+    return [
+        CategorySuggestion(
+            label=label,
+            category_id=s.category_id,
+            payment_method_id=s.payment_method_id,
+            confidence=s.confidence,
+        )
+        for label, s in zip(request.labels, suggestions)
+    ]
\ No newline at end of file
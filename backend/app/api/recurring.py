@@ -5,14 +5,16 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..core.audit import audit_log
+from ..core.forecast import forecast_cache
+from ..core.responses import FastJSONResponse, rows_response
+from ..core.query_budget import query_budget
 from ..database import get_session
 from ..models.recurring import RecurringItem
-from ..models.account import BankAccount
-from ..models.share import AccountShare
-from ..models.enums import PermissionLevel
+from ..models.enums import AuditAction, AuditEntity, PermissionLevel
 from ..models.user import User
 from ..schemas.recurring import RecurringCreate, RecurringRead
-from .deps import get_current_user
+from .deps import check_account_permission, check_references, get_accessible_account_ids, get_current_user
 
 
 router = APIRouter()
@@ -26,26 +28,19 @@ def _has_permission_to_add_recurring(user: User, permission: PermissionLevel) ->
 
 
 @router.get("/recurring", response_model=list[RecurringRead])
+@query_budget(3)
 async def list_recurring(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_session),
     account_id: int | None = None,
-) -> list[RecurringItem]:
-    """Liste les items récurrents visibles par l’utilisateur."""
-    # Déterminer les comptes accessibles
-    acc_ids = []
+) -> FastJSONResponse:
+    """Liste les items récurrents visibles par l’utilisateur.
+
+    Seules les colonnes exposées sont lues et les lignes sont encodées
+    directement en JSON, sans objets ORM.
+    """
     from sqlalchemy import select
-    res_owned = await db.execute(
-        select(BankAccount).where(BankAccount.owner_id == current_user.id)
-    )
-    acc_ids += [acc.id for acc in res_owned.scalars().all()]
-    res_shared = await db.execute(
-        select(BankAccount)
-        .join(AccountShare, BankAccount.id == AccountShare.account_id)
-        .where(AccountShare.user_id == current_user.id)
-    )
-    acc_ids += [acc.id for acc in res_shared.scalars().all()]
-    acc_ids = list(set(acc_ids))
+    acc_ids = await get_accessible_account_ids(db, current_user)
     if account_id:
         if account_id not in acc_ids:
             raise HTTPException(status_code=403, detail="Not authorized to view this account")
@@ -53,14 +48,18 @@ async def list_recurring(
     else:
         acc_filter = acc_ids
     if not acc_filter:
-        return []
+        return FastJSONResponse([])
+    items = RecurringItem.__table__
     result = await db.execute(
-        select(RecurringItem).where(RecurringItem.account_id.in_(acc_filter))
+        select(*(items.c[name] for name in RecurringRead.model_fields)).where(
+            items.c.account_id.in_(acc_filter)
+        )
     )
-    return result.scalars().all()
+    return rows_response(result)
 
 
 @router.post("/recurring", response_model=RecurringRead, status_code=201)
+@query_budget(5)
 async def create_recurring(
     rec_in: RecurringCreate,
     current_user: User = Depends(get_current_user),
@@ -73,29 +72,14 @@ async def create_recurring(
     """
     if current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin cannot create recurring items")
-    # Vérifier que le compte existe
-    from sqlalchemy import select
-    res_acc = await db.execute(
-        select(BankAccount).where(BankAccount.id == rec_in.account_id)
+    await check_account_permission(
+        db,
+        current_user,
+        [rec_in.account_id],
+        _has_permission_to_add_recurring,
+        "Insufficient permission to add recurring item",
     )
-    account = res_acc.scalars().first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
-    # Vérifier permission
-    allowed = False
-    if account.owner_id == current_user.id:
-        allowed = True
-    else:
-        res_share = await db.execute(
-            select(AccountShare)
-            .where(AccountShare.account_id == rec_in.account_id)
-            .where(AccountShare.user_id == current_user.id)
-        )
-        share = res_share.scalars().first()
-        if share and _has_permission_to_add_recurring(current_user, share.permission):
-            allowed = True
-    if not allowed:
-        raise HTTPException(status_code=403, detail="Insufficient permission to add recurring item")
+    await check_references(db, [rec_in.category_id], [rec_in.payment_method_id])
     item = RecurringItem(
         type=rec_in.type,
         label=rec_in.label,
@@ -113,4 +97,13 @@ async def create_recurring(
     db.add(item)
     await db.commit()
     await db.refresh(item)
+    audit_log.record(
+        item.account_id,
+        current_user.id,
+        AuditEntity.RECURRING,
+        item.id,
+        AuditAction.CREATE,
+        rec_in.model_dump(exclude={"account_id"}, exclude_none=True),
+    )
+    forecast_cache.invalidate(item.account_id)
     return item
\ No newline at end of file
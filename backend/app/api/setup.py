@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, Field
 
+from ..core.query_budget import query_budget
 from ..database import get_session
 from ..models.config import GlobalConfig
 
@@ -20,6 +21,7 @@ class SetupRequest(BaseModel):
 
 # Utilise un code 201 (Created) pour éviter l'assertion de FastAPI (204 sans corps)
 @router.post("/setup", status_code=201)
+@query_budget(2)
 async def setup_app(data: SetupRequest, db: AsyncSession = Depends(get_session)) -> None:
     """Initialise la devise et le fuseau horaire globaux.
 
@@ -28,8 +30,10 @@ async def setup_app(data: SetupRequest, db: AsyncSession = Depends(get_session))
     verrouillée.
     """
     # Récupérer la configuration (il n’y a qu’une seule ligne)
-    result = await db.execute(GlobalConfig.__table__.select())
-    config = result.scalar_one_or_none()
+    from sqlalchemy import select
+
+    result = await db.execute(select(GlobalConfig))
+    config = result.scalars().first()
     if not config:
         # Si aucune config, en créer une
         config = GlobalConfig(currency=data.currency.upper(), timezone=data.timezone, initialized=True)
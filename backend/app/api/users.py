@@ -2,29 +2,104 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..core.query_budget import query_budget
 from ..database import get_session
+from ..models.account import BankAccount
+from ..models.operation import Operation
 from ..models.user import User
+from ..core.responses import FastJSONResponse, rows_to_dicts
 from ..core.security import get_password_hash
-from ..schemas.user import UserCreate, UserRead, UserUpdate
+from ..schemas.user import UserAdminRead, UserCreate, UserRead, UserUpdate
 from .deps import require_admin
 
 
 router = APIRouter()
 
 
-@router.get("/users", response_model=list[UserRead])
-async def list_users(db: AsyncSession = Depends(get_session), current_admin: User = Depends(require_admin)) -> list[UserRead]:
-    """Renvoie la liste de tous les utilisateurs."""
-    from sqlalchemy import select
-    result = await db.execute(select(User))
-    users = result.scalars().all()
-    return users
+def _prefix_bounds(prefix: str) -> tuple[str, str]:
+    """Bornes `[low, high)` des chaînes commençant par `prefix`.
+
+    Une comparaison par intervalle exploite l’index `ix_users_username` sur
+    tous les moteurs, contrairement à `LIKE` sous SQLite.
+    """
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+@router.get("/users", response_model=list[UserAdminRead])
+@query_budget(3)
+async def list_users(
+    db: AsyncSession = Depends(get_session),
+    current_admin: User = Depends(require_admin),
+    q: str | None = Query(default=None, max_length=100, description="Début du nom d’utilisateur"),
+    disabled: bool | None = None,
+    is_admin: bool | None = None,
+    limit: int = Query(default=50, ge=1, le=200),
+    offset: int = Query(default=0, ge=0),
+) -> FastJSONResponse:
+    """Liste paginée des utilisateurs, triée par nom, avec leurs compteurs.
+
+    `q` filtre sur le début du nom (sensible à la casse). Chaque utilisateur
+    inclut son nombre de comptes possédés et d’opérations sur ces comptes,
+    calculés par une seule sous-requête groupée limitée à la page. Le nombre
+    total d’utilisateurs correspondant aux filtres est renvoyé dans l’en-tête
+    `X-Total-Count`.
+    """
+    from sqlalchemy import func, select
+    users = User.__table__
+    filters = []
+    if q:
+        low, high = _prefix_bounds(q)
+        filters += [users.c.username >= low, users.c.username < high]
+    if disabled is not None:
+        filters.append(func.coalesce(users.c.disabled, False) == disabled)
+    if is_admin is not None:
+        filters.append(func.coalesce(users.c.is_admin, False) == is_admin)
+    total = (await db.execute(select(func.count()).select_from(users).where(*filters))).scalar_one()
+    page = (
+        select(users.c.id, users.c.username, users.c.disabled, users.c.is_admin)
+        .where(*filters)
+        .order_by(users.c.username)
+        .limit(limit)
+        .offset(offset)
+        .subquery()
+    )
+    accounts = BankAccount.__table__
+    ops = Operation.__table__
+    counts = (
+        select(
+            accounts.c.owner_id,
+            func.count(func.distinct(accounts.c.id)).label("account_count"),
+            func.count(ops.c.id).label("operation_count"),
+        )
+        .outerjoin(ops, ops.c.account_id == accounts.c.id)
+        .where(accounts.c.owner_id.in_(select(page.c.id)))
+        .group_by(accounts.c.owner_id)
+        .subquery()
+    )
+    result = await db.execute(
+        select(
+            page.c.id,
+            page.c.username,
+            func.coalesce(page.c.disabled, False).label("disabled"),
+            func.coalesce(page.c.is_admin, False).label("is_admin"),
+            func.coalesce(counts.c.account_count, 0).label("account_count"),
+            func.coalesce(counts.c.operation_count, 0).label("operation_count"),
+        )
+        .outerjoin(counts, counts.c.owner_id == page.c.id)
+        .order_by(page.c.username)
+    )
+    rows = rows_to_dicts(result)
+    for row in rows:
+        row["disabled"] = bool(row["disabled"])
+        row["is_admin"] = bool(row["is_admin"])
+    return FastJSONResponse(rows, headers={"X-Total-Count": str(total)})
 
 
 @router.post("/users", response_model=UserRead, status_code=201)
+@query_budget(4)
 async def create_user(
     user_in: UserCreate,
     db: AsyncSession = Depends(get_session),
@@ -48,6 +123,7 @@ async def create_user(
 
 
 @router.put("/users/{user_id}", response_model=UserRead)
+@query_budget(4)
 async def update_user(
     user_id: int,
     user_in: UserUpdate,
@@ -0,0 +1,120 @@
+"""Journal d’audit des opérations, items récurrents et partages.
+
+Les routes n’écrivent pas elles-mêmes le journal : après leur `commit`, elles
+déposent des événements compacts dans le tampon du processus,
+
+    audit_log.record(account_id, user.id, AuditEntity.OPERATION, op.id,
+                     AuditAction.UPDATE, {"amount": Decimal("12.00")})
+
+puis la boucle `jobs.audit` les insère par lots (une instruction `INSERT`
+multi-lignes) toutes les `AUDIT_FLUSH_INTERVAL_MS` millisecondes ou dès
+`AUDIT_BATCH_SIZE` événements en attente. Le tampon est vidé à l’arrêt du
+worker ; un arrêt brutal perd au plus les événements d’un intervalle.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.audit import AuditEvent
+from ..models.enums import AuditAction, AuditEntity
+from .config import settings
+
+
+def _compact(value):
+    """Valeur enregistrable en JSON : montants et dates en texte."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+class AuditLog:
+    """Tampon d’événements d’audit du processus, vidé par lots."""
+
+    def __init__(self, batch_size: int, max_pending: int) -> None:
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.dropped = 0
+        self._pending: list[dict] = []
+        self._full: asyncio.Event | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def _event(self) -> asyncio.Event:
+        if self._full is None:
+            self._full = asyncio.Event()
+        return self._full
+
+    def record(
+        self,
+        account_id: int,
+        user_id: int,
+        entity: AuditEntity,
+        entity_id: int,
+        action: AuditAction,
+        changes: dict | None = None,
+    ) -> None:
+        """Met un événement en attente (sans accès à la base)."""
+        self._pending.append(
+            {
+                "account_id": account_id,
+                "user_id": user_id,
+                "entity": entity,
+                "entity_id": entity_id,
+                "action": action,
+                "changes": {name: _compact(value) for name, value in changes.items()} if changes else None,
+                "created_at": datetime.utcnow(),
+            }
+        )
+        overflow = len(self._pending) - self.max_pending
+        if overflow > 0:
+            del self._pending[:overflow]
+            self.dropped += overflow
+        if len(self._pending) >= self.batch_size:
+            self._event().set()
+
+    async def wait(self, timeout: float) -> None:
+        """Attend `timeout` secondes ou qu’un lot complet soit en attente."""
+        try:
+            await asyncio.wait_for(self._event().wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def flush(self, session: AsyncSession) -> int:
+        """Insère les événements en attente et valide ; retourne leur nombre.
+
+        En cas d’échec, les événements sont remis en tête du tampon.
+        """
+        events, self._pending = self._pending, []
+        self._event().clear()
+        if not events:
+            return 0
+        try:
+            for start in range(0, len(events), self.batch_size):
+                await session.execute(insert(AuditEvent.__table__), events[start:start + self.batch_size])
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            self._pending[:0] = events
+            raise
+        return len(events)
+
+    def clear(self) -> None:
+        """Abandonne les événements en attente (tests)."""
+        self._pending.clear()
+        self._full = None
+
+
+# Tampon partagé par les routes du processus.
+audit_log = AuditLog(settings.audit_batch_size, settings.audit_max_pending)
@@ -0,0 +1,181 @@
+"""Compteurs de consommation des budgets, tenus à jour à l’écriture.
+
+Chaque budget (catégorie, compte ou comptes de l’utilisateur, période) a une
+ligne `budget_counters` par période : les dépenses cumulées. Les routes qui
+écrivent des opérations et le matérialiseur appellent `record_spending` avec
+les opérations ajoutées et retirées, dans leur transaction : une requête
+trouve les budgets touchés, un upsert ajoute les écarts aux compteurs et
+renvoie leurs nouvelles valeurs, d’où les franchissements de seuil
+(`budget_events`). L’état d’un budget (`GET /budgets/status`) se lit ainsi
+sur une ligne de compteur, sans réagréger l’historique.
+
+Seules les dépenses comptent. Les compteurs démarrent au début de la période
+de création du budget (`Budget.since`) et sont initialisés par
+`open_counters`, seule lecture des opérations existantes.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Iterable, NamedTuple
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.account import BankAccount
+from ..models.budget import Budget, BudgetCounter, BudgetEvent
+from ..models.enums import BudgetPeriod, OperationType
+from ..models.operation import Operation
+from .money import from_cents, to_cents
+
+
+def period_start(period: BudgetPeriod, day: date) -> date:
+    """Premier jour de la période contenant `day`."""
+    if period == BudgetPeriod.WEEKLY:
+        return day - timedelta(days=day.weekday())
+    if period == BudgetPeriod.YEARLY:
+        return day.replace(month=1, day=1)
+    return day.replace(day=1)
+
+
+def period_end(period: BudgetPeriod, start: date) -> date:
+    """Dernier jour de la période commençant à `start`."""
+    if period == BudgetPeriod.WEEKLY:
+        return start + timedelta(days=6)
+    if period == BudgetPeriod.YEARLY:
+        return start.replace(month=12, day=31)
+    return (start.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+
+
+class Spending(NamedTuple):
+    """Opération vue par les budgets."""
+
+    account_id: int
+    category_id: int
+    type: OperationType
+    amount: Decimal
+    date: date
+
+    @classmethod
+    def of(cls, operation) -> "Spending":
+        """Depuis un objet ORM, un schéma ou une ligne `Row` d’opération."""
+        return cls(*(getattr(operation, name) for name in cls._fields))
+
+
+def _insert(session: AsyncSession):
+    if session.bind.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
+async def record_spending(
+    session: AsyncSession,
+    added: Iterable[Spending] = (),
+    removed: Iterable[Spending] = (),
+) -> list[dict]:
+    """Reporte des opérations ajoutées ou retirées sur les compteurs des budgets.
+
+    Retourne les événements de franchissement de seuil émis.
+    """
+    movements = [(spending, 1) for spending in added] + [(spending, -1) for spending in removed]
+    movements = [(spending, sign) for spending, sign in movements if spending.type == OperationType.DEPENSE]
+    if not movements:
+        return []
+    budgets = Budget.__table__
+    accounts = BankAccount.__table__
+    result = await session.execute(
+        select(
+            budgets.c.id,
+            budgets.c.category_id,
+            budgets.c.period,
+            budgets.c.since,
+            budgets.c.limit_amount,
+            budgets.c.alert_percent,
+            accounts.c.id.label("scope_account_id"),
+        )
+        .join(
+            accounts,
+            or_(
+                budgets.c.account_id == accounts.c.id,
+                and_(budgets.c.account_id.is_(None), budgets.c.user_id == accounts.c.owner_id),
+            ),
+        )
+        .where(accounts.c.id.in_({spending.account_id for spending, _ in movements}))
+        .where(budgets.c.category_id.in_({spending.category_id for spending, _ in movements}))
+    )
+    matching: dict[tuple[int, int], list] = defaultdict(list)
+    for row in result:
+        matching[(row.scope_account_id, row.category_id)].append(row)
+    if not matching:
+        return []
+    deltas: dict[tuple[int, date], int] = defaultdict(int)
+    touched = {}
+    for spending, sign in movements:
+        for budget in matching.get((spending.account_id, spending.category_id), ()):
+            start = period_start(budget.period, spending.date)
+            if start >= budget.since:
+                deltas[(budget.id, start)] += sign * to_cents(spending.amount)
+                touched[budget.id] = budget
+    return await _add_to_counters(session, {key: delta for key, delta in deltas.items() if delta}, touched)
+
+
+async def open_counters(session: AsyncSession, budget: Budget) -> list[dict]:
+    """Initialise les compteurs d’un nouveau budget depuis `budget.since`.
+
+    Seules les opérations de la période en cours (et celles déjà saisies à
+    une date future) sont lues.
+    """
+    ops = Operation.__table__
+    if budget.account_id is not None:
+        scope = ops.c.account_id == budget.account_id
+    else:
+        scope = ops.c.account_id.in_(select(BankAccount.id).where(BankAccount.owner_id == budget.user_id))
+    result = await session.execute(
+        select(ops.c.date, ops.c.amount)
+        .where(scope)
+        .where(ops.c.category_id == budget.category_id)
+        .where(ops.c.type == OperationType.DEPENSE)
+        .where(ops.c.date >= budget.since)
+    )
+    deltas: dict[tuple[int, date], int] = defaultdict(int)
+    for day, amount in result:
+        deltas[(budget.id, period_start(budget.period, day))] += to_cents(amount)
+    return await _add_to_counters(session, deltas, {budget.id: budget})
+
+
+async def _add_to_counters(session: AsyncSession, deltas: dict[tuple[int, date], int], budgets: dict) -> list[dict]:
+    """Upsert des écarts (centimes) et événements pour les seuils franchis à la hausse."""
+    if not deltas:
+        return []
+    insert = _insert(session)
+    counters = BudgetCounter.__table__
+    stmt = insert(counters).values(
+        [
+            {"budget_id": budget_id, "period_start": start, "spent": from_cents(delta)}
+            for (budget_id, start), delta in deltas.items()
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["budget_id", "period_start"],
+        set_={"spent": counters.c.spent + stmt.excluded.spent},
+    ).returning(counters.c.budget_id, counters.c.period_start, counters.c.spent)
+    events = []
+    for budget_id, start, spent in await session.execute(stmt):
+        budget = budgets[budget_id]
+        limit = to_cents(budget.limit_amount)
+        new = to_cents(spent)
+        old = new - deltas[(budget_id, start)]
+        for threshold in sorted({budget.alert_percent, 100}):
+            if old * 100 < threshold * limit <= new * 100:
+                events.append({"budget_id": budget_id, "period_start": start, "threshold": threshold, "spent": spent})
+    if events:
+        await session.execute(
+            insert(BudgetEvent.__table__)
+            .values(events)
+            .on_conflict_do_nothing(index_elements=["budget_id", "period_start", "threshold"])
+        )
+    return events
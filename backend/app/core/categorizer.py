@@ -0,0 +1,168 @@
+"""Suggestion automatique de catégorie et de moyen de paiement.
+
+Pour chaque compte, un petit modèle en mémoire compte les associations
+« libellé normalisé → catégorie » et « mot → catégorie » (idem pour les moyens
+de paiement). Il est chargé une seule fois depuis l’historique du compte, puis
+mis à jour incrémentalement à chaque création d’opération : les suggestions
+ne relisent jamais la table `operations`.
+
+Les modèles sont propres à chaque processus et bornés en nombre (LRU). Une
+écriture faite par un autre processus n’est prise en compte qu’au prochain
+chargement du compte ; les suggestions restent de simples aides à la saisie.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, OrderedDict, defaultdict
+from typing import Iterable, NamedTuple, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.operation import Operation
+from .config import settings
+from .text import label_tokens
+
+
+class Suggestion(NamedTuple):
+    category_id: Optional[int]
+    payment_method_id: Optional[int]
+    confidence: float
+
+
+_EMPTY = Suggestion(None, None, 0.0)
+# Suggestions mémorisées par compte (LRU)
+MEMO_SIZE = 512
+
+
+def _best(counter: Counter) -> tuple[Optional[int], float]:
+    if not counter:
+        return None, 0.0
+    value, count = counter.most_common(1)[0]
+    return value, count / sum(counter.values())
+
+
+def _vote(tables: Iterable[Counter]) -> tuple[Optional[int], float]:
+    """Vote pondéré : chaque mot apporte sa distribution normalisée."""
+    scores: dict[int, float] = defaultdict(float)
+    voters = 0
+    for counter in tables:
+        total = sum(counter.values())
+        voters += 1
+        for value, count in counter.items():
+            scores[value] += count / total
+    if not scores:
+        return None, 0.0
+    value = max(scores, key=scores.__getitem__)
+    return value, scores[value] / voters
+
+
+class AccountModel:
+    """Compteurs d’associations pour un compte bancaire."""
+
+    __slots__ = ("labels", "tokens", "label_payments", "token_payments", "_memo")
+
+    def __init__(self) -> None:
+        self.labels: dict[tuple[str, ...], Counter] = defaultdict(Counter)
+        self.tokens: dict[str, Counter] = defaultdict(Counter)
+        self.label_payments: dict[tuple[str, ...], Counter] = defaultdict(Counter)
+        self.token_payments: dict[str, Counter] = defaultdict(Counter)
+        # Suggestions déjà calculées (au plus `MEMO_SIZE`), invalidées à
+        # chaque apprentissage
+        self._memo: OrderedDict[tuple[str, ...], Suggestion] = OrderedDict()
+
+    def learn(self, label: str, category_id: int | None, payment_method_id: int | None) -> None:
+        tokens = label_tokens(label)
+        if not tokens:
+            return
+        self._memo.clear()
+        if category_id is not None:
+            self.labels[tokens][category_id] += 1
+            for token in tokens:
+                self.tokens[token][category_id] += 1
+        if payment_method_id is not None:
+            self.label_payments[tokens][payment_method_id] += 1
+            for token in tokens:
+                self.token_payments[token][payment_method_id] += 1
+
+    def suggest(self, label: str) -> Suggestion:
+        tokens = label_tokens(label)
+        if not tokens:
+            return _EMPTY
+        memo = self._memo.get(tokens)
+        if memo is not None:
+            self._memo.move_to_end(tokens)
+            return memo
+        # Libellé déjà vu : association directe, sinon vote des mots connus
+        if tokens in self.labels:
+            category_id, confidence = _best(self.labels[tokens])
+        else:
+            category_id, confidence = _vote(self.tokens[t] for t in tokens if t in self.tokens)
+        if tokens in self.label_payments:
+            payment_method_id, _ = _best(self.label_payments[tokens])
+        else:
+            payment_method_id, _ = _vote(
+                self.token_payments[t] for t in tokens if t in self.token_payments
+            )
+        suggestion = Suggestion(category_id, payment_method_id, round(confidence, 3))
+        self._memo[tokens] = suggestion
+        if len(self._memo) > MEMO_SIZE:
+            self._memo.popitem(last=False)
+        return suggestion
+
+
+class Categorizer:
+    """Registre des modèles par compte, borné à `max_accounts` entrées."""
+
+    def __init__(self, max_accounts: int = 256) -> None:
+        self.max_accounts = max_accounts
+        self._models: OrderedDict[int, AccountModel] = OrderedDict()
+
+    async def model_for(self, session: AsyncSession, account_id: int) -> AccountModel:
+        """Retourne le modèle du compte, en le chargeant depuis l’historique si besoin."""
+        model = self._models.get(account_id)
+        if model is not None:
+            self._models.move_to_end(account_id)
+            return model
+        result = await session.execute(
+            select(Operation.label, Operation.category_id, Operation.payment_method_id).where(
+                Operation.account_id == account_id
+            )
+        )
+        model = AccountModel()
+        for label, category_id, payment_method_id in result:
+            model.learn(label, category_id, payment_method_id)
+        self._models[account_id] = model
+        while len(self._models) > self.max_accounts:
+            self._models.popitem(last=False)
+        return model
+
+    def learn(
+        self, account_id: int, label: str, category_id: int | None, payment_method_id: int | None
+    ) -> None:
+        """Met à jour le modèle d’un compte déjà chargé (sans effet sinon)."""
+        model = self._models.get(account_id)
+        if model is not None:
+            model.learn(label, category_id, payment_method_id)
+
+    def forget(self, account_id: int) -> None:
+        """Oublie le modèle d’un compte ; il sera rechargé à la prochaine demande."""
+        self._models.pop(account_id, None)
+
+    async def suggest_many(
+        self, session: AsyncSession, account_id: int, labels: list[str]
+    ) -> list[Suggestion]:
+        """Suggestions pour une liste de libellés (les doublons ne sont calculés qu’une fois)."""
+        model = await self.model_for(session, account_id)
+        cache: dict[str, Suggestion] = {}
+        out = []
+        for label in labels:
+            suggestion = cache.get(label)
+            if suggestion is None:
+                suggestion = cache[label] = model.suggest(label)
+            out.append(suggestion)
+        return out
+
+
+# Instance partagée par les routes et les tâches du processus.
+categorizer = Categorizer(settings.categorizer_max_accounts)
@@ -0,0 +1,212 @@
+"""Compression des réponses de l’API (gzip, Brotli et zstd si disponibles).
+
+Le middleware négocie l’encodage avec `Accept-Encoding` et ne compresse que
+les réponses dont le type figure dans la liste autorisée (JSON, CSV, texte).
+Une réponse complète plus petite que le seuil est envoyée telle quelle ; une
+réponse en flux (`StreamingResponse`, exports) est compressée morceau par
+morceau, chaque morceau étant vidé (`flush`) pour que le client le reçoive
+sans attendre la fin.
+
+Seules les routes sous les préfixes configurés (`/api` par défaut) sont
+concernées : le frontend est servi avec des variantes précompressées (voir
+`core.static`).
+"""
+
+from __future__ import annotations
+
+import zlib
+from typing import Callable
+
+from .config import settings
+
+try:  # optionnel
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:  # optionnel
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+
+class _Gzip:
+    def __init__(self, level: int) -> None:
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, flush: bool = True) -> bytes:
+        out = self._obj.compress(data)
+        return out + self._obj.flush(zlib.Z_SYNC_FLUSH) if flush else out
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+class _Brotli:
+    def __init__(self, level: int) -> None:
+        self._obj = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes, flush: bool = True) -> bytes:
+        out = self._obj.process(data)
+        return out + self._obj.flush() if flush else out
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class _Zstd:
+    def __init__(self, level: int) -> None:
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes, flush: bool = True) -> bytes:
+        out = self._obj.compress(data)
+        return out + self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK) if flush else out
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+def available_encodings() -> dict[str, Callable[[int], object]]:
+    """Encodages utilisables, par ordre de préférence du serveur."""
+    encodings: dict[str, Callable[[int], object]] = {}
+    if brotli is not None:
+        encodings["br"] = _Brotli
+    if zstandard is not None:
+        encodings["zstd"] = _Zstd
+    encodings["gzip"] = _Gzip
+    return encodings
+
+
+def compress(data: bytes, encoding: str, level: int) -> bytes:
+    """Compresse un corps complet (utilisé aussi par les benchmarks)."""
+    stream = available_encodings()[encoding](level)
+    return stream.compress(data, flush=False) + stream.finish()
+
+
+def _quality(params: str) -> float:
+    """Poids `q` des paramètres d’un encodage (1 par défaut, 0 si illisible)."""
+    for param in params.split(";"):
+        key, _, value = param.partition("=")
+        if key.strip() == "q":
+            try:
+                return float(value.strip())
+            except ValueError:
+                return 0.0
+    return 1.0
+
+
+def accepted_encodings(headers) -> set[str]:
+    """Encodages acceptés d’après l’en-tête `Accept-Encoding` des `headers` ASGI.
+
+    Un encodage de poids nul (`br;q=0`, `br; q=0.0`) est refusé.
+    """
+    for name, value in headers:
+        if name == b"accept-encoding":
+            accepted = set()
+            for part in value.decode("latin-1").lower().split(","):
+                coding, _, params = part.partition(";")
+                if coding.strip() and _quality(params) > 0:
+                    accepted.add(coding.strip())
+            return accepted
+    return set()
+
+
+class CompressionMiddleware:
+    """Middleware ASGI de compression des réponses."""
+
+    def __init__(
+        self,
+        app,
+        minimum_size: int | None = None,
+        levels: dict[str, int] | None = None,
+        media_types: list[str] | None = None,
+        paths: list[str] | None = None,
+    ) -> None:
+        self.app = app
+        self.minimum_size = settings.compression_min_size if minimum_size is None else minimum_size
+        self.levels = {
+            "gzip": settings.compression_gzip_level,
+            "br": settings.compression_brotli_level,
+            "zstd": settings.compression_zstd_level,
+            **(levels or {}),
+        }
+        self.media_types = tuple(media_types or settings.compression_media_types)
+        self.paths = tuple(paths or settings.compression_paths)
+        self.encodings = available_encodings()
+
+    def _choose(self, scope) -> str | None:
+        accepted = accepted_encodings(scope.get("headers", ()))
+        for encoding in self.encodings:
+            if encoding in accepted:
+                return encoding
+        return None
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD" or not scope["path"].startswith(self.paths):
+            await self.app(scope, receive, send)
+            return
+        encoding = self._choose(scope)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: dict | None = None
+        stream = None
+        passthrough = False
+
+        async def send_compressed(message) -> None:
+            nonlocal start, stream, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                headers = message.get("headers", ())
+                content_type = b""
+                for name, value in headers:
+                    if name == b"content-encoding":
+                        passthrough = True
+                    elif name == b"content-type":
+                        content_type = value
+                if not content_type.decode("latin-1").startswith(self.media_types):
+                    passthrough = True
+                if passthrough:
+                    await send(message)
+                else:
+                    start = message  # en attente du premier morceau
+                return
+            if message["type"] != "http.response.body":  # pragma: no cover
+                await send(message)
+                return
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if stream is None:
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+                stream = self.encodings[encoding](self.levels[encoding])
+                vary = [b"Accept-Encoding"]
+                headers = []
+                for name, value in start.get("headers", ()):
+                    if name == b"vary":
+                        vary.insert(0, value)
+                    elif name != b"content-length":
+                        headers.append((name, value))
+                if more_body:
+                    payload = stream.compress(body)
+                else:
+                    payload = stream.compress(body, flush=False) + stream.finish()
+                headers.append((b"content-encoding", encoding.encode()))
+                headers.append((b"vary", b", ".join(vary)))
+                if not more_body:
+                    headers.append((b"content-length", str(len(payload)).encode()))
+                await send({**start, "headers": headers})
+                await send({"type": "http.response.body", "body": payload, "more_body": more_body})
+                return
+            payload = stream.compress(body) if body else b""
+            if not more_body:
+                payload += stream.finish()
+            await send({"type": "http.response.body", "body": payload, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
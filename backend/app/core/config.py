@@ -43,6 +43,96 @@ class Settings(BaseSettings):
     admin_username: str = Field(default="admin", env="ADMIN_USERNAME")
     admin_password: str | None = Field(default=None, env="ADMIN_PASSWORD")
 
+    # Exécuter les tâches de fond dans le processus de l’API. À désactiver
+    # lorsque `python -m app.jobs.worker` tourne dans un processus séparé.
+    run_jobs_in_api: bool = Field(default=True, env="RUN_JOBS_IN_API")
+
+    # File d’attente des tâches : nombre de tâches exécutées en parallèle,
+    # intervalle de scrutation, durée du bail et politique de nouvelle tentative.
+    job_concurrency: int = Field(default=2, env="JOB_CONCURRENCY")
+    job_poll_interval_seconds: float = Field(default=1.0, env="JOB_POLL_INTERVAL_SECONDS")
+    job_lease_seconds: int = Field(default=300, env="JOB_LEASE_SECONDS")
+    job_max_attempts: int = Field(default=3, env="JOB_MAX_ATTEMPTS")
+    job_retry_backoff_seconds: float = Field(default=5.0, env="JOB_RETRY_BACKOFF_SECONDS")
+
+    # Nombre maximal de comptes dont le modèle de catégorisation reste en mémoire.
+    categorizer_max_accounts: int = Field(default=256, env="CATEGORIZER_MAX_ACCOUNTS")
+
+    # Écart maximal (en jours) entre deux opérations identiques considérées comme doublons.
+    duplicate_window_days: int = Field(default=3, env="DUPLICATE_WINDOW_DAYS")
+
+    # Ancienneté (en années) au-delà de laquelle les opérations sont archivées (0 = désactivé).
+    archive_after_years: int = Field(default=0, env="ARCHIVE_AFTER_YEARS")
+
+    # Limitation de débit (voir `core.ratelimit`) : budgets « requêtes/secondes »
+    # par préfixe de route, budget commun aux autres routes `/api`, nombre
+    # maximal de seaux en mémoire et stockage (`memory` ou `sqlite:///fichier`).
+    rate_limit_enabled: bool = Field(default=True, env="RATE_LIMIT_ENABLED")
+    rate_limit_rules: dict[str, str] = Field(
+        default={
+            "POST /api/login": "10/60",
+            "GET /api/operations/operations": "120/60",
+            "GET /api/users/users": "60/60",
+            "POST /api/operations/operations/bulk": "20/60",
+        },
+        env="RATE_LIMIT_RULES",
+    )
+    rate_limit_default: str = Field(default="600/60", env="RATE_LIMIT_DEFAULT")
+    rate_limit_max_keys: int = Field(default=10000, env="RATE_LIMIT_MAX_KEYS")
+    rate_limit_backend: str = Field(default="memory", env="RATE_LIMIT_BACKEND")
+
+    # Compression des réponses de l’API (voir `core.compression`) : taille
+    # minimale en octets, niveaux par algorithme, types et préfixes concernés.
+    compression_enabled: bool = Field(default=True, env="COMPRESSION_ENABLED")
+    compression_min_size: int = Field(default=1024, env="COMPRESSION_MIN_SIZE")
+    compression_gzip_level: int = Field(default=6, env="COMPRESSION_GZIP_LEVEL")
+    compression_brotli_level: int = Field(default=4, env="COMPRESSION_BROTLI_LEVEL")
+    compression_zstd_level: int = Field(default=3, env="COMPRESSION_ZSTD_LEVEL")
+    compression_media_types: list[str] = Field(
+        default=["application/json", "text/", "application/x-ndjson"], env="COMPRESSION_MEDIA_TYPES"
+    )
+    compression_paths: list[str] = Field(default=["/api"], env="COMPRESSION_PATHS")
+
+    # Serveur de production (`python -m app.server`) : adresse d’écoute, nombre
+    # de processus workers, connexions simultanées maximales par worker (au-delà :
+    # 503), délai de keep-alive HTTP et délai de grâce à l’arrêt (requêtes en
+    # cours et tâches de fond), en secondes.
+    web_host: str = Field(default="0.0.0.0", env="WEB_HOST")
+    web_port: int = Field(default=8000, env="WEB_PORT")
+    web_concurrency: int = Field(default=1, env="WEB_CONCURRENCY")
+    web_limit_concurrency: int | None = Field(default=None, env="WEB_LIMIT_CONCURRENCY")
+    web_keep_alive_seconds: int = Field(default=5, env="WEB_KEEP_ALIVE_SECONDS")
+    web_graceful_timeout_seconds: int = Field(default=30, env="WEB_GRACEFUL_TIMEOUT_SECONDS")
+
+    # Fichier de verrou désignant le worker leader (boucles périodiques).
+    leader_lock_path: str = Field(default="./data/leader.lock", env="LEADER_LOCK_PATH")
+    # Intervalle entre deux tentatives d’élection des workers non leaders.
+    leader_retry_seconds: float = Field(default=5, env="LEADER_RETRY_SECONDS")
+
+    # Jeton de version des catégories et moyens de paiement, réécrit à chaque
+    # modification pour que les autres workers rechargent leur registre.
+    reference_version_path: str = Field(default="./data/reference.version", env="REFERENCE_VERSION_PATH")
+    # Délai minimal entre deux rechargements du registre provoqués par un
+    # identifiant inconnu (catégorie ou moyen de paiement créé hors des routes).
+    reference_reload_interval_seconds: float = Field(default=10, env="REFERENCE_RELOAD_INTERVAL_SECONDS")
+
+    # Jeton de version des taux de change, réécrit par chaque import (y compris
+    # depuis `python -m app.jobs.fx_import`) pour que les workers les rechargent.
+    fx_version_path: str = Field(default="./data/fx.version", env="FX_VERSION_PATH")
+
+    # Journal d’audit (voir `core.audit`) : événements écrits par lots toutes les
+    # N millisecondes ou dès M événements en attente ; au-delà du plafond (base
+    # indisponible), les plus anciens sont abandonnés.
+    audit_flush_interval_ms: int = Field(default=500, env="AUDIT_FLUSH_INTERVAL_MS")
+    audit_batch_size: int = Field(default=200, env="AUDIT_BATCH_SIZE")
+    audit_max_pending: int = Field(default=10000, env="AUDIT_MAX_PENDING")
+
+    # Budgets de requêtes SQL par route (voir `core.query_budget`) : `off`
+    # (production), `warn` (rapport sur la sortie d’erreur) ou `raise` (erreur
+    # 500, tests) ; budget des routes qui n’en déclarent pas.
+    query_budget_mode: str = Field(default="off", env="QUERY_BUDGET_MODE")
+    query_budget_default: int = Field(default=10, env="QUERY_BUDGET_DEFAULT")
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -0,0 +1,105 @@
+"""Détection des opérations probablement en double.
+
+Chaque opération porte une empreinte (`Operation.fingerprint`) calculée à
+partir du compte, du type, du montant au centime près et du libellé
+normalisé. Deux opérations de même empreinte dont les dates sont distantes de
+moins de `settings.duplicate_window_days` jours sont considérées comme des
+doublons probables (import bancaire chevauchant une saisie manuelle, etc.).
+
+La recherche se fait en une seule requête indexée par lot :
+`fingerprint IN (…) AND date BETWEEN …`, le filtrage fin restant en mémoire.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Iterable, Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .config import settings
+from .money import to_cents
+from .text import normalize_label
+
+
+def operation_fingerprint(account_id: int, type_: str, amount, label: str) -> str:
+    """Empreinte hexadécimale (32 caractères) d’une opération."""
+    kind = getattr(type_, "value", type_)
+    raw = f"{account_id}|{kind}|{to_cents(amount)}|{normalize_label(label)}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _window() -> timedelta:
+    return timedelta(days=settings.duplicate_window_days)
+
+
+async def find_duplicates(
+    session: AsyncSession, candidates: Sequence[tuple[str, date]]
+) -> list[list[int]]:
+    """Pour chaque `(empreinte, date)` candidate, liste les opérations existantes en double.
+
+    Une seule requête est émise quel que soit le nombre de candidats.
+    """
+    from ..models.operation import Operation
+
+    if not candidates:
+        return []
+    window = _window()
+    fingerprints = {fp for fp, _ in candidates}
+    start = min(d for _, d in candidates) - window
+    end = max(d for _, d in candidates) + window
+    result = await session.execute(
+        select(Operation.id, Operation.fingerprint, Operation.date)
+        .where(Operation.fingerprint.in_(fingerprints))
+        .where(Operation.date.between(start, end))
+    )
+    existing: dict[str, list[tuple[int, date]]] = defaultdict(list)
+    for op_id, fp, op_date in result:
+        existing[fp].append((op_id, op_date))
+    return [
+        [op_id for op_id, op_date in existing.get(fp, ()) if abs(op_date - d) <= window]
+        for fp, d in candidates
+    ]
+
+
+def group_duplicates(rows: Iterable) -> list[list]:
+    """Regroupe des opérations triées par (empreinte, date) en grappes de doublons.
+
+    Deux opérations consécutives de même empreinte appartiennent à la même
+    grappe si leurs dates sont distantes d’au plus la fenêtre configurée.
+    """
+    window = _window()
+    groups: list[list] = []
+    current: list = []
+    for row in rows:
+        if current and current[-1].fingerprint == row.fingerprint and row.date - current[-1].date <= window:
+            current.append(row)
+            continue
+        if len(current) > 1:
+            groups.append(current)
+        current = [row]
+    if len(current) > 1:
+        groups.append(current)
+    return groups
+
+
+async def account_duplicates(session: AsyncSession, account_id: int) -> list[list]:
+    """Grappes de doublons probables d’un compte."""
+    from ..models.operation import Operation
+
+    repeated = (
+        select(Operation.fingerprint)
+        .where(Operation.account_id == account_id)
+        .group_by(Operation.fingerprint)
+        .having(func.count() > 1)
+    )
+    result = await session.execute(
+        select(Operation)
+        .where(Operation.account_id == account_id)
+        .where(Operation.fingerprint.in_(repeated))
+        .order_by(Operation.fingerprint, Operation.date, Operation.id)
+    )
+    return group_duplicates(result.scalars().all())
@@ -0,0 +1,196 @@
+"""Prévisions de trésorerie : projection jour par jour des items récurrents.
+
+La période projetée (de demain à 6 ou 12 mois) est représentée, pour chaque
+compte, par un tableau dense `array('q')` de mouvements quotidiens en
+centimes, une case par jour. Chaque item récurrent ajoute son montant signé
+aux jours où il s’exécute ; les opérations déjà saisies à une date future et
+les opérations ponctuelles d’un scénario s’y ajoutent de la même façon. Les
+soldes de fin de journée sont la somme cumulée de ce tableau, d’où le solde
+minimal et la date du premier découvert.
+
+Les jours d’exécution suivent la règle du matérialiseur
+(`jobs.recurring._is_due`) : la prévision annonce les opérations qui seront
+effectivement créées. Les fréquences mensuelles et au-delà s’exécutent donc
+chaque mois au jour `moment` (ramené au dernier jour des mois plus courts).
+
+Le tableau des items d’un compte est gardé dans `forecast_cache`, sous une clé
+contenant les items eux-mêmes : toute modification d’un item (ou d’un
+scénario) change la clé et provoque le recalcul, y compris dans les autres
+workers ; `invalidate()` libère en plus les entrées périmées du processus.
+"""
+
+from __future__ import annotations
+
+import calendar
+from array import array
+from collections import OrderedDict
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Iterable, Iterator, NamedTuple
+
+from .money import running_balance, to_cents
+
+
+class PlannedItem(NamedTuple):
+    """Item récurrent projeté (ligne de `recurring_items` ou item d’un scénario)."""
+
+    id: int | None
+    account_id: int
+    type: str
+    label: str
+    amount: Decimal
+    frequency: str
+    moment: int
+    start_date: date | None
+    end_date: date | None
+
+
+class Projection(NamedTuple):
+    """Soldes de fin de journée d’un compte, à partir de `first_day`."""
+
+    first_day: date
+    # Solde (centimes) la veille du premier jour projeté
+    opening: int
+    balances: array
+
+    @property
+    def last_day(self) -> date:
+        return self.first_day + timedelta(days=len(self.balances) - 1)
+
+    def lowest(self) -> tuple[int, date]:
+        """Solde minimal et premier jour où il est atteint."""
+        lowest = min(self.balances)
+        return lowest, self.first_day + timedelta(days=self.balances.index(lowest))
+
+    def first_overdraft(self) -> date | None:
+        """Premier jour terminé avec un solde négatif, ou `None`."""
+        for index, balance in enumerate(self.balances):
+            if balance < 0:
+                return self.first_day + timedelta(days=index)
+        return None
+
+
+def horizon(today: date, months: int) -> tuple[date, int]:
+    """Premier jour projeté (demain) et nombre de jours jusqu’à `today` + `months` mois."""
+    month = today.month - 1 + months
+    year, month = today.year + month // 12, month % 12 + 1
+    end = date(year, month, min(today.day, calendar.monthrange(year, month)[1]))
+    return today + timedelta(days=1), (end - today).days
+
+
+def signed(kind, amount) -> int:
+    """Centimes signés : revenus positifs, dépenses négatives."""
+    cents = to_cents(amount)
+    return cents if getattr(kind, "value", kind) == "REVENU" else -cents
+
+
+def occurrences(item: PlannedItem, first: date, last: date) -> Iterator[int]:
+    """Jours d’exécution (ordinaux) de l’item entre `first` et `last` inclus."""
+    if item.start_date and item.start_date > first:
+        first = item.start_date
+    if item.end_date and item.end_date < last:
+        last = item.end_date
+    lo, hi = first.toordinal(), last.toordinal()
+    if lo > hi:
+        return
+    frequency = getattr(item.frequency, "value", item.frequency)
+    if frequency == "DAILY":
+        yield from range(lo, hi + 1)
+    elif frequency == "WEEKLY":
+        # moment : 1=lundi…7=dimanche
+        if 1 <= item.moment <= 7:
+            yield from range(lo + (item.moment - first.isoweekday()) % 7, hi + 1, 7)
+    elif item.moment >= 1:
+        year, month = first.year, first.month
+        while (year, month) <= (last.year, last.month):
+            day = min(item.moment, calendar.monthrange(year, month)[1])
+            ordinal = date(year, month, day).toordinal()
+            if lo <= ordinal <= hi:
+                yield ordinal
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def item_deltas(items: Iterable[PlannedItem], first: date, days: int) -> array:
+    """Mouvements quotidiens (centimes) produits par les items sur `days` jours."""
+    deltas = array("q", bytes(8 * days))
+    base = first.toordinal()
+    last = first + timedelta(days=days - 1)
+    for item in items:
+        cents = signed(item.type, item.amount)
+        for ordinal in occurrences(item, first, last):
+            deltas[ordinal - base] += cents
+    return deltas
+
+
+def add_operations(
+    deltas: array,
+    first: date,
+    operations: Iterable[tuple[date, object, object, str]],
+    items: Iterable[PlannedItem] = (),
+) -> None:
+    """Ajoute des opérations `(date, type, montant, libellé)` au tableau de mouvements.
+
+    Comme le matérialiseur, un item n’est pas exécuté le jour où une opération
+    de même libellé existe déjà : sa contribution est alors retirée.
+    """
+    by_label: dict[str, list[PlannedItem]] = {}
+    for item in items:
+        by_label.setdefault(item.label, []).append(item)
+    base = first.toordinal()
+    replaced: set[tuple[int, str]] = set()
+    for day, kind, amount, label in operations:
+        index = day.toordinal() - base
+        if not 0 <= index < len(deltas):
+            continue
+        deltas[index] += signed(kind, amount)
+        if (index, label) in replaced:
+            continue
+        replaced.add((index, label))
+        for item in by_label.get(label, ()):
+            if any(occurrences(item, day, day)):
+                deltas[index] -= signed(item.type, item.amount)
+
+
+def project(opening: int, deltas: array, first: date) -> Projection:
+    """Soldes de fin de journée à partir du solde d’ouverture (centimes)."""
+    return Projection(first, opening, running_balance(opening, deltas))
+
+
+class ForecastCache:
+    """Tableaux de mouvements des items récurrents, par compte (éviction LRU)."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        # (compte, premier jour, nombre de jours, items) -> mouvements
+        self._entries: OrderedDict[tuple, array] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def deltas(self, account_id: int, first: date, days: int, items: tuple[PlannedItem, ...]) -> array:
+        """Copie des mouvements des `items` du compte, calculés au premier appel."""
+        key = (account_id, first.toordinal(), days, items)
+        cached = self._entries.get(key)
+        if cached is None:
+            self.misses += 1
+            cached = self._entries[key] = item_deltas(items, first, days)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return array("q", cached)
+
+    def invalidate(self, account_id: int | None = None) -> None:
+        """Oublie les mouvements d’un compte (ou de tous les comptes)."""
+        if account_id is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == account_id]:
+            del self._entries[key]
+
+
+# Cache partagé par les routes du processus.
+forecast_cache = ForecastCache()
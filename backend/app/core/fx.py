@@ -0,0 +1,185 @@
+"""Taux de change locaux et conversion en masse vers la devise de l’instance.
+
+Les taux proviennent d’un fichier CSV chargé dans la table `fx_rates` (aucun
+service distant). Ils sont ensuite gardés en mémoire, par devise, sous forme
+de deux tableaux triés : dates (ordinaux) et taux en unités de 10⁻⁸. La
+recherche du taux applicable à une date est un `bisect` ; la conversion d’un
+jeu de résultats complet se fait en une passe, les lignes étant regroupées par
+devise.
+
+`import_fx_rates` peut tourner dans un autre processus que l’API
+(`python -m app.jobs.fx_import`) : il écrit alors un nouveau jeton dans
+`FX_VERSION_PATH`, et chaque worker recharge ses taux au prochain usage.
+"""
+
+from __future__ import annotations
+
+import csv
+from array import array
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from typing import Iterable, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.fx_rate import FxRate
+from .config import settings
+from .version_token import VersionToken
+
+RATE_SCALE = 10**8
+# Lignes par instruction d’import : 3 paramètres par ligne, sous la limite
+# historique de 999 variables liées de SQLite
+IMPORT_CHUNK = 300
+
+
+def _scaled(rate) -> int:
+    return int((Decimal(str(rate)) * RATE_SCALE).to_integral_value())
+
+
+def _apply(cents: int, scaled_rate: int) -> int:
+    """Multiplie des centimes par un taux mis à l’échelle (arrondi au plus proche)."""
+    product = cents * scaled_rate
+    half = RATE_SCALE // 2
+    return (product + half) // RATE_SCALE if product >= 0 else -((-product + half) // RATE_SCALE)
+
+
+class FxRateCache:
+    """Taux en mémoire indexés par devise puis par date."""
+
+    def __init__(self, version_path: str | None = None) -> None:
+        self._dates: dict[str, array] = {}
+        self._rates: dict[str, array] = {}
+        self.loaded = False
+        # Sans fichier de version, seul `invalidate()` force un rechargement
+        self.version = VersionToken(version_path) if version_path else None
+        self._version = ""
+
+    def load_rows(self, rows: Iterable[tuple[str, date, object]]) -> None:
+        """Remplace le contenu du cache par les lignes `(devise, date, taux)`."""
+        grouped: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        for currency, day, rate in rows:
+            grouped[currency.upper()].append((day.toordinal(), _scaled(rate)))
+        self._dates.clear()
+        self._rates.clear()
+        for currency, points in grouped.items():
+            points.sort()
+            self._dates[currency] = array("l", (d for d, _ in points))
+            self._rates[currency] = array("q", (r for _, r in points))
+        self.loaded = True
+
+    async def ensure_loaded(self, session: AsyncSession) -> None:
+        """Charge la table `fx_rates` au premier usage ou après un import,
+        y compris un import fait par un autre processus."""
+        version = self.version.read() if self.version else ""
+        if self.loaded and version == self._version:
+            return
+        result = await session.execute(select(FxRate.currency, FxRate.date, FxRate.rate))
+        self.load_rows(result.all())
+        self._version = version
+
+    def invalidate(self) -> None:
+        """Force le rechargement au prochain usage, dans ce processus seulement."""
+        self.loaded = False
+
+    def bump(self) -> None:
+        """Signale un import : rechargement ici et dans les autres processus."""
+        self.invalidate()
+        if self.version:
+            self.version.bump()
+
+    def scaled_rate(self, currency: str, day: date) -> int | None:
+        """Dernier taux connu à `day` (inclus), mis à l’échelle, ou `None`."""
+        dates = self._dates.get(currency)
+        if not dates:
+            return None
+        index = bisect_right(dates, day.toordinal()) - 1
+        if index < 0:
+            return None
+        return self._rates[currency][index]
+
+    def rate(self, currency: str, day: date) -> Decimal | None:
+        scaled = self.scaled_rate(currency, day)
+        return None if scaled is None else Decimal(scaled) / RATE_SCALE
+
+    def convert_cents(
+        self,
+        currencies: Sequence[str],
+        cents: Sequence[int],
+        days: Sequence[date] | date,
+        base_currency: str,
+    ) -> list[int | None]:
+        """Convertit des montants (centimes) vers `base_currency`.
+
+        `days` est soit une date unique (taux du jour pour toutes les lignes),
+        soit une date par ligne. Les lignes sans taux connu valent `None`.
+        """
+        out: list[int | None] = list(cents)
+        by_currency: dict[str, list[int]] = defaultdict(list)
+        for index, currency in enumerate(currencies):
+            if currency != base_currency:
+                by_currency[currency].append(index)
+        single_day = days if isinstance(days, date) else None
+        for currency, indexes in by_currency.items():
+            if single_day is not None:
+                scaled = self.scaled_rate(currency, single_day)
+                for index in indexes:
+                    out[index] = None if scaled is None else _apply(cents[index], scaled)
+                continue
+            dates = self._dates.get(currency)
+            rates = self._rates.get(currency)
+            for index in indexes:
+                position = bisect_right(dates, days[index].toordinal()) - 1 if dates else -1
+                out[index] = None if position < 0 else _apply(cents[index], rates[position])
+        return out
+
+
+def read_fx_file(path: str | Path) -> list[tuple[str, date, Decimal]]:
+    """Lit un fichier CSV `date,currency,rate` (en-tête obligatoire)."""
+    rows = []
+    with open(path, newline="", encoding="utf-8") as handle:
+        for record in csv.DictReader(handle):
+            rows.append(
+                (
+                    record["currency"].strip().upper(),
+                    date.fromisoformat(record["date"].strip()),
+                    Decimal(record["rate"].strip()),
+                )
+            )
+    return rows
+
+
+def _upsert_rates(dialect: str, rows: list[dict]):
+    """`INSERT … ON CONFLICT (currency, date) DO UPDATE` pour `dialect`."""
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    stmt = insert(FxRate.__table__).values(rows)
+    return stmt.on_conflict_do_update(index_elements=["currency", "date"], set_={"rate": stmt.excluded.rate})
+
+
+async def import_fx_rates(session: AsyncSession, rows: list[tuple[str, date, Decimal]]) -> int:
+    """Enregistre les taux (remplace ceux des mêmes devise et date) et invalide
+    le cache de tous les processus.
+
+    Une devise et une date répétées dans `rows` : la dernière ligne l’emporte.
+    Retourne le nombre de taux distincts enregistrés.
+    """
+    latest = {(currency, day): rate for currency, day, rate in rows}
+    if not latest:
+        return 0
+    values = [{"currency": currency, "date": day, "rate": rate} for (currency, day), rate in latest.items()]
+    dialect = session.bind.dialect.name
+    for start in range(0, len(values), IMPORT_CHUNK):
+        await session.execute(_upsert_rates(dialect, values[start : start + IMPORT_CHUNK]))
+    await session.commit()
+    fx_cache.bump()
+    return len(values)
+
+
+# Cache partagé par les routes du processus.
+fx_cache = FxRateCache(settings.fx_version_path)
@@ -0,0 +1,83 @@
+"""Coordination des processus workers d’un même hôte (verrous de fichier).
+
+Avec plusieurs workers (`python -m app.server --workers N`), chaque processus
+exécute l’événement de démarrage de l’application :
+
+* `startup_lock()` sérialise le travail d’initialisation (administrateur,
+  configuration globale, valeurs par défaut) : les workers l’exécutent l’un
+  après l’autre et les suivants trouvent les lignes déjà créées. L’attente se
+  fait par sondage sans bloquer la boucle d’événements ;
+* `acquire_leadership()` élit un seul processus pour les boucles périodiques
+  (récurrences, relevés). Le verrou est conservé jusqu’à la fin du processus ;
+  le système le libère si le leader meurt, et les autres workers, qui retentent
+  l’élection à intervalle régulier (`jobs.leadership`), prennent le relais.
+
+Les verrous reposent sur `flock` ; sans `fcntl` (Windows), chaque processus
+se considère seul et obtient les deux verrous.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator
+
+try:  # optionnel : absent hors POSIX
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+from .config import settings
+
+# Descripteurs maintenus ouverts : fermer le fichier libérerait le verrou.
+_held: dict[str, int] = {}
+
+
+def _open(path: str) -> int:
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    return os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+
+
+@asynccontextmanager
+async def startup_lock(path: str | None = None, poll: float = 0.05) -> AsyncIterator[None]:
+    """Verrou exclusif autour du travail d’initialisation, attendu par sondage."""
+    if fcntl is None:  # pragma: no cover
+        yield
+        return
+    fd = _open(path or settings.leader_lock_path + ".startup")
+    try:
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                await asyncio.sleep(poll)
+        yield
+    finally:
+        os.close(fd)  # libère aussi le verrou
+
+
+def acquire_leadership(path: str | None = None) -> bool:
+    """Tente (sans attendre) de devenir le processus leader ; idempotent."""
+    path = path or settings.leader_lock_path
+    if path in _held or fcntl is None:
+        return True
+    fd = _open(path)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return False
+    os.ftruncate(fd, 0)
+    os.write(fd, str(os.getpid()).encode())
+    _held[path] = fd
+    return True
+
+
+def release_leadership(path: str | None = None) -> None:
+    """Abandonne la place de leader (arrêt du processus, tests)."""
+    fd = _held.pop(path or settings.leader_lock_path, None)
+    if fd is not None:
+        os.close(fd)
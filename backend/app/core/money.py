@@ -0,0 +1,77 @@
+"""Arithmétique monétaire exacte.
+
+Les montants sont stockés en base sous forme d’entiers en centimes (type
+`Money`) et exposés à Python en `Decimal` à deux décimales. Les agrégations
+(`SUM`) se font donc en arithmétique entière côté SQL, sans l’affinité
+flottante de SQLite, et les calculs en mémoire (soldes, prévisions) manipulent
+des tableaux d’entiers (`array('q')`) plutôt que des listes de `Decimal`.
+"""
+
+from __future__ import annotations
+
+from array import array
+from decimal import ROUND_HALF_UP, Decimal
+from itertools import accumulate
+from typing import Iterable
+
+from sqlalchemy import BigInteger
+from sqlalchemy.types import TypeDecorator
+
+CENT = Decimal("0.01")
+
+
+def to_cents(value) -> int:
+    """Convertit un montant (`Decimal`, `int`, `float`, `str`) en centimes entiers."""
+    if isinstance(value, int):
+        return value * 100
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    return int((value * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def from_cents(cents: int) -> Decimal:
+    """Convertit des centimes entiers en `Decimal` à deux décimales."""
+    return (Decimal(cents) / 100).quantize(CENT)
+
+
+class Money(TypeDecorator):
+    """Montant stocké en centimes (`BIGINT`) et manipulé en `Decimal`."""
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return to_cents(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return from_cents(int(value))
+
+
+def cents_array(amounts: Iterable) -> array:
+    """Tableau compact (`int64`) des montants en centimes."""
+    return array("q", (to_cents(amount) for amount in amounts))
+
+
+def signed_cents(items: Iterable[tuple[object, object]]) -> array:
+    """Centimes signés pour des couples `(type, montant)` : revenus positifs, dépenses négatives."""
+    return array(
+        "q",
+        (
+            to_cents(amount) if getattr(kind, "value", kind) == "REVENU" else -to_cents(amount)
+            for kind, amount in items
+        ),
+    )
+
+
+def total(cents: array) -> Decimal:
+    """Somme exacte d’un tableau de centimes."""
+    return from_cents(sum(cents))
+
+
+def running_balance(initial_cents: int, deltas: array) -> array:
+    """Solde cumulé après chaque mouvement, en centimes."""
+    return array("q", accumulate(deltas, initial=initial_cents))[1:]
@@ -0,0 +1,170 @@
+"""Budgets de requêtes SQL par route (détection des N+1).
+
+Chaque route déclare le nombre maximal d’instructions SQL qu’elle peut émettre :
+
+    @router.get("/accounts")
+    @query_budget(3)
+    async def list_accounts(...): ...
+
+Une route sans décorateur dispose de `Settings.query_budget_default`.
+Lorsque `QUERY_BUDGET_MODE` vaut `warn` ou `raise` (développement, tests), un
+écouteur `before_cursor_execute` enregistre les instructions de la requête
+HTTP en cours (variable de contexte) et `QueryBudgetMiddleware` compare leur
+nombre au budget avant l’envoi de la réponse. Un dépassement affiche un
+rapport regroupant les instructions identiques (`warn`) ou remplace la
+réponse par une erreur 500 contenant ce rapport (`raise`). En production
+(`off`, par défaut), rien n’est installé.
+
+Le même mécanisme s’applique hors requête HTTP (tâches de fond, tests) :
+
+    with query_log(budget=2) as log:
+        await materialize_once(session, day)
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .config import settings
+
+F = TypeVar("F", bound=Callable)
+
+# Instructions de contrôle de transaction, hors budget
+_CONTROL = ("SAVEPOINT", "RELEASE", "ROLLBACK", "BEGIN", "COMMIT")
+_SPACES = re.compile(r"\s+")
+
+_current: ContextVar["QueryLog | None"] = ContextVar("query_log", default=None)
+_installed = False
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Nombre d’instructions SQL supérieur au budget déclaré."""
+
+
+class QueryLog:
+    """Instructions SQL émises dans un contexte (requête HTTP, bloc de code)."""
+
+    def __init__(self, label: str, budget: int | None = None) -> None:
+        self.label = label
+        self.budget = budget
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def exceeded(self) -> bool:
+        return self.budget is not None and self.count > self.budget
+
+    def report(self) -> str:
+        """Rapport lisible : instructions identiques regroupées, les plus répétées d’abord."""
+        lines = [f"{self.label}: {self.count} SQL statements (budget {self.budget})"]
+        for statement, times in Counter(self.statements).most_common():
+            prefix = f"{times:>4} × " if times > 1 else "       "
+            lines.append(prefix + (statement if len(statement) <= 300 else statement[:297] + "..."))
+        return "\n".join(lines)
+
+    def check(self) -> None:
+        """Signale un dépassement selon `Settings.query_budget_mode`."""
+        if not self.exceeded or settings.query_budget_mode == "off":
+            return
+        if settings.query_budget_mode == "raise":
+            raise QueryBudgetExceeded(self.report())
+        print(f"[QUERY BUDGET] {self.report()}", file=sys.stderr, flush=True)
+
+
+def _on_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    log = _current.get()
+    if log is not None and not statement.lstrip().upper().startswith(_CONTROL):
+        log.statements.append(_SPACES.sub(" ", statement).strip())
+
+
+def install() -> None:
+    """Branche l’écouteur sur tous les moteurs (idempotent)."""
+    global _installed
+    if not _installed:
+        event.listen(Engine, "before_cursor_execute", _on_execute)
+        _installed = True
+
+
+@contextmanager
+def query_log(label: str = "block", budget: int | None = None) -> Iterator[QueryLog]:
+    """Enregistre les instructions du bloc et vérifie le budget à sa sortie."""
+    install()
+    log = QueryLog(label, budget)
+    token = _current.set(log)
+    try:
+        yield log
+    finally:
+        _current.reset(token)
+    log.check()
+
+
+def query_budget(max_statements: int) -> Callable[[F], F]:
+    """Déclare le budget d’instructions SQL d’une route (à placer sous `@router.xxx`)."""
+
+    def decorator(endpoint: F) -> F:
+        endpoint.__query_budget__ = max_statements
+        return endpoint
+
+    return decorator
+
+
+def budget_of(endpoint) -> int:
+    return getattr(endpoint, "__query_budget__", settings.query_budget_default)
+
+
+class QueryBudgetMiddleware:
+    """Middleware ASGI vérifiant le budget de la route avant l’envoi de la réponse."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+        install()
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        log = QueryLog(f"{scope['method']} {scope['path']}")
+        token = _current.set(log)
+        replaced = False
+
+        async def send_checked(message) -> None:
+            nonlocal replaced
+            if replaced:
+                return  # corps de la réponse d’origine, remplacée par le rapport
+            if message["type"] == "http.response.start" and "endpoint" in scope:
+                route = scope.get("route")
+                log.label = f"{scope['method']} {getattr(route, 'path', scope['path'])}"
+                log.budget = budget_of(scope["endpoint"])
+                try:
+                    log.check()
+                except QueryBudgetExceeded as exc:
+                    replaced = True
+                    body = str(exc).encode()
+                    message = {
+                        "type": "http.response.start",
+                        "status": 500,
+                        "headers": [
+                            (b"content-type", b"text/plain; charset=utf-8"),
+                            (b"content-length", str(len(body)).encode()),
+                        ],
+                    }
+                    await send(message)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_checked)
+        finally:
+            _current.reset(token)
@@ -0,0 +1,261 @@
+"""Limitation de débit par seau à jetons (token bucket).
+
+Chaque couple (règle, identité) dispose d’un seau de `capacity` jetons,
+rechargé de `capacity / period` jetons par seconde ; une requête consomme un
+jeton. L’identité est l’utilisateur authentifié (cookie `access_token`) ou, à
+défaut, l’adresse IP du client.
+
+Les règles sont définies dans `Settings.rate_limit_rules` sous la forme
+`{"POST /api/login": "10/60"}` (10 requêtes par 60 s, préfixe de chemin, la
+règle la plus spécifique l’emporte) ; les autres routes `/api` partagent
+`Settings.rate_limit_default`.
+
+L’état est conservé en mémoire dans un LRU borné (`MemoryBackend`, O(1) par
+requête). Pour que les limites tiennent entre plusieurs workers d’un même
+hôte, `RATE_LIMIT_BACKEND=sqlite:///chemin/fichier` utilise un fichier SQLite
+partagé, mis à jour par une seule instruction atomique par requête.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from http.cookies import SimpleCookie
+from typing import NamedTuple, Protocol
+
+from .config import settings
+from .responses import dumps
+from .security import decode_token
+
+
+@dataclass(frozen=True)
+class Rule:
+    """Budget d’une route : `capacity` requêtes par `period` secondes."""
+
+    name: str
+    method: str | None
+    prefix: str
+    capacity: int
+    period: float
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / self.period
+
+
+class Decision(NamedTuple):
+    allowed: bool
+    remaining: int
+    # Secondes avant qu’un jeton soit disponible (0 si la requête passe)
+    retry_after: float
+    # Secondes avant que le seau soit de nouveau plein
+    reset: float
+
+
+def parse_budget(value: str) -> tuple[int, float]:
+    """Analyse un budget `"requêtes/secondes"` (par ex. `"10/60"`)."""
+    count, _, period = value.partition("/")
+    capacity, seconds = int(count), float(period or 1)
+    if capacity <= 0 or seconds <= 0:
+        raise ValueError(f"Invalid rate limit budget: {value!r}")
+    return capacity, seconds
+
+
+def parse_rules(rules: dict[str, str], default: str) -> list[Rule]:
+    """Construit les règles triées de la plus spécifique à la plus générale."""
+    parsed = []
+    for pattern, budget in rules.items():
+        method, _, prefix = pattern.strip().rpartition(" ")
+        capacity, period = parse_budget(budget)
+        parsed.append(Rule(pattern, method.upper() or None, prefix, capacity, period))
+    parsed.sort(key=lambda rule: (len(rule.prefix), rule.method is not None), reverse=True)
+    capacity, period = parse_budget(default)
+    parsed.append(Rule("default", None, "/api", capacity, period))
+    return parsed
+
+
+def match_rule(rules: list[Rule], method: str, path: str) -> Rule | None:
+    for rule in rules:
+        if (rule.method is None or rule.method == method) and path.startswith(rule.prefix):
+            return rule
+    return None
+
+
+def _decide(tokens: float, rule: Rule, cost: float = 1.0) -> Decision:
+    """Décision pour un seau contenant `tokens` jetons avant consommation."""
+    if tokens >= cost:
+        left = tokens - cost
+        return Decision(True, int(left), 0.0, (rule.capacity - left) / rule.rate)
+    return Decision(False, 0, (cost - tokens) / rule.rate, (rule.capacity - tokens) / rule.rate)
+
+
+class RateLimitBackend(Protocol):
+    async def hit(self, key: str, rule: Rule) -> Decision:  # pragma: no cover
+        ...
+
+
+class MemoryBackend:
+    """Seaux en mémoire du processus, bornés à `max_keys` (éviction LRU)."""
+
+    def __init__(self, max_keys: int = 10000) -> None:
+        self.max_keys = max_keys
+        # clé -> (jetons, horodatage de la dernière mise à jour)
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    async def hit(self, key: str, rule: Rule, now: float | None = None) -> Decision:
+        now = time.monotonic() if now is None else now
+        state = self._buckets.get(key)
+        if state is None:
+            tokens = float(rule.capacity)
+        else:
+            tokens = min(rule.capacity, state[0] + (now - state[1]) * rule.rate)
+            self._buckets.move_to_end(key)
+        decision = _decide(tokens, rule)
+        self._buckets[key] = (tokens - 1 if decision.allowed else tokens, now)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return decision
+
+
+class SQLiteBackend:
+    """Seaux partagés entre processus dans un fichier SQLite local.
+
+    Chaque requête exécute un seul upsert `… RETURNING` calculant le
+    rechargement et la consommation côté SQLite, ce qui garantit l’atomicité
+    entre workers. Les seaux inactifs sont purgés périodiquement.
+    """
+
+    _UPSERT = """
+        INSERT INTO rate_limit_buckets (key, tokens, ts, allowed) VALUES (:key, :capacity - 1, :now, 1)
+        ON CONFLICT(key) DO UPDATE SET
+            tokens = CASE
+                WHEN min(:capacity, tokens + (:now - ts) * :rate) >= 1
+                THEN min(:capacity, tokens + (:now - ts) * :rate) - 1
+                ELSE min(:capacity, tokens + (:now - ts) * :rate)
+            END,
+            allowed = min(:capacity, tokens + (:now - ts) * :rate) >= 1,
+            ts = :now
+        RETURNING tokens, allowed
+    """
+
+    def __init__(self, path: str, max_idle_seconds: float = 3600.0) -> None:
+        self.path = path
+        self.max_idle_seconds = max_idle_seconds
+        self._conn: sqlite3.Connection | None = None
+        self._calls = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_buckets "
+                "(key TEXT PRIMARY KEY, tokens REAL NOT NULL, ts REAL NOT NULL, allowed INTEGER NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def _hit(self, key: str, rule: Rule, now: float) -> Decision:
+        conn = self._connection()
+        params = {"key": key, "capacity": rule.capacity, "rate": rule.rate, "now": now}
+        tokens, allowed = conn.execute(self._UPSERT, params).fetchone()
+        self._calls += 1
+        if self._calls % 1000 == 0:
+            conn.execute("DELETE FROM rate_limit_buckets WHERE ts < ?", (now - self.max_idle_seconds,))
+        if allowed:
+            return Decision(True, int(tokens), 0.0, (rule.capacity - tokens) / rule.rate)
+        return _decide(tokens, rule)
+
+    async def hit(self, key: str, rule: Rule, now: float | None = None) -> Decision:
+        # Horloge murale : elle doit être commune à tous les processus
+        return await asyncio.to_thread(self._hit, key, rule, time.time() if now is None else now)
+
+
+def create_backend(url: str, max_keys: int) -> RateLimitBackend:
+    """`memory` (défaut) ou `sqlite:///chemin/vers/fichier`."""
+    if url.startswith("sqlite:///"):
+        return SQLiteBackend(url[len("sqlite:///"):])
+    if url != "memory":
+        raise ValueError(f"Unknown rate limit backend: {url!r}")
+    return MemoryBackend(max_keys)
+
+
+def _identity(scope) -> str:
+    for name, value in scope.get("headers", ()):
+        if name == b"cookie":
+            cookie = SimpleCookie()
+            cookie.load(value.decode("latin-1"))
+            morsel = cookie.get("access_token")
+            payload = decode_token(morsel.value) if morsel else None
+            if payload and "sub" in payload:
+                return f"user:{payload['sub']}"
+            break
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+def _headers(rule: Rule, decision: Decision) -> list[tuple[bytes, bytes]]:
+    headers = [
+        (b"x-ratelimit-limit", str(rule.capacity).encode()),
+        (b"x-ratelimit-remaining", str(decision.remaining).encode()),
+        (b"x-ratelimit-reset", str(math.ceil(decision.reset)).encode()),
+    ]
+    if not decision.allowed:
+        headers.append((b"retry-after", str(max(1, math.ceil(decision.retry_after))).encode()))
+    return headers
+
+
+class RateLimitMiddleware:
+    """Middleware ASGI appliquant les règles aux requêtes HTTP de l’API."""
+
+    def __init__(
+        self,
+        app,
+        rules: list[Rule] | None = None,
+        backend: RateLimitBackend | None = None,
+    ) -> None:
+        self.app = app
+        self.rules = rules if rules is not None else parse_rules(
+            settings.rate_limit_rules, settings.rate_limit_default
+        )
+        self.backend = backend or create_backend(settings.rate_limit_backend, settings.rate_limit_max_keys)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        rule = match_rule(self.rules, scope["method"], scope["path"])
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+        decision = await self.backend.hit(f"{rule.name}|{_identity(scope)}", rule)
+        headers = _headers(rule, decision)
+        if not decision.allowed:
+            body = dumps({"detail": "Too many requests"})
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 429,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(body)).encode()),
+                        *headers,
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        async def send_with_headers(message) -> None:
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": [*message.get("headers", ()), *headers]}
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
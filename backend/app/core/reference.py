@@ -0,0 +1,131 @@
+"""Registre en mémoire des catégories et des moyens de paiement.
+
+Ces deux tables de référence sont petites et consultées à chaque création
+d’opération ou d’item récurrent. Le registre les charge en une requête, puis
+répond sans accès à la base :
+
+    await reference.ensure_loaded(db)
+    reference.categories.id_of("Alimentation")   # nom -> id
+    reference.categories.get(3)                  # id -> (nom, supprimée)
+
+Chaque écriture sur ces tables appelle `reference.bump()` : le registre du
+processus est rechargé au prochain usage et un nouveau jeton de version est
+écrit dans `REFERENCE_VERSION_PATH`. Les autres workers comparent ce jeton
+(lecture d’un fichier, sans requête SQL) à celui de leur dernier chargement
+et se rechargent s’il a changé. Un identifiant inconnu provoque aussi un
+rechargement avant d’être refusé (ligne créée hors des routes), au plus une
+fois toutes les `REFERENCE_RELOAD_INTERVAL_SECONDS` secondes : un client qui
+répète un identifiant invalide n’entraîne pas une relecture à chaque requête.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Iterable
+
+from sqlalchemy import literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.category import Category
+from ..models.payment_method import PaymentMethod
+from .config import settings
+from .version_token import VersionToken
+
+
+class ReferenceTable:
+    """Lignes d’une table de référence, indexées par id et par nom."""
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self._by_id: dict[int, tuple[str, bool]] = {}
+        self._by_name: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def load(self, rows: Iterable[tuple[int, str, bool]]) -> None:
+        self._by_id = {row_id: (name, bool(deleted)) for row_id, name, deleted in rows}
+        self._by_name = {name: row_id for row_id, (name, _) in self._by_id.items()}
+
+    def get(self, row_id: int) -> tuple[str, bool] | None:
+        """Nom et indicateur de suppression, ou `None` si l’id est inconnu."""
+        return self._by_id.get(row_id)
+
+    def id_of(self, name: str) -> int | None:
+        """Identifiant de la ligne portant ce nom (supprimée ou non)."""
+        return self._by_name.get(name)
+
+    def items(self) -> list[tuple[int, str, bool]]:
+        """Lignes `(id, nom, supprimée)` triées par id."""
+        return [(row_id, name, deleted) for row_id, (name, deleted) in sorted(self._by_id.items())]
+
+    def problems(self, ids: Iterable[int]) -> tuple[list[int], list[int]]:
+        """Identifiants inconnus et identifiants de lignes supprimées, triés."""
+        missing, deleted = [], []
+        for row_id in sorted(set(ids)):
+            row = self._by_id.get(row_id)
+            if row is None:
+                missing.append(row_id)
+            elif row[1]:
+                deleted.append(row_id)
+        return missing, deleted
+
+
+class ReferenceRegistry:
+    """Catégories et moyens de paiement du processus, versionnés entre workers."""
+
+    def __init__(self, version_path: str) -> None:
+        self.version = VersionToken(version_path)
+        self.categories = ReferenceTable("Category")
+        self.payment_methods = ReferenceTable("Payment method")
+        self.loaded = False
+        self._version = ""
+        # Instant (horloge monotone) du dernier chargement
+        self._loaded_at = float("-inf")
+
+    async def ensure_loaded(self, session: AsyncSession) -> None:
+        """Charge les deux tables au premier usage ou après un changement de version."""
+        version = self.version.read()
+        if self.loaded and version == self._version:
+            return
+        categories = Category.__table__
+        methods = PaymentMethod.__table__
+        result = await session.execute(
+            select(literal(True), categories.c.id, categories.c.name, categories.c.deleted).union_all(
+                select(literal(False), methods.c.id, methods.c.name, methods.c.deleted)
+            )
+        )
+        rows = result.all()
+        self.categories.load(row[1:] for row in rows if row[0])
+        self.payment_methods.load(row[1:] for row in rows if not row[0])
+        self.loaded = True
+        self._version = version
+        self._loaded_at = time.monotonic()
+
+    async def check(
+        self, session: AsyncSession, table: ReferenceTable, ids: Iterable[int]
+    ) -> tuple[list[int], list[int]]:
+        """Identifiants inconnus et supprimés de `table`, après un rechargement
+        si certains sont inconnus du registre et que le dernier chargement date
+        d’au moins `REFERENCE_RELOAD_INTERVAL_SECONDS`."""
+        ids = list(ids)
+        await self.ensure_loaded(session)
+        missing, deleted = table.problems(ids)
+        if missing and time.monotonic() - self._loaded_at >= settings.reference_reload_interval_seconds:
+            self.invalidate()
+            await self.ensure_loaded(session)
+            missing, deleted = table.problems(ids)
+        return missing, deleted
+
+    def invalidate(self) -> None:
+        """Force le rechargement au prochain usage, dans ce processus seulement."""
+        self.loaded = False
+
+    def bump(self) -> None:
+        """Signale une écriture : rechargement ici et dans les autres workers."""
+        self.invalidate()
+        self.version.bump()
+
+
+# Registre partagé par les routes du processus.
+reference = ReferenceRegistry(settings.reference_version_path)
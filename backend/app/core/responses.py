@@ -0,0 +1,48 @@
+"""Réponses JSON rapides pour les listes volumineuses.
+
+Les routes de liste sélectionnent uniquement les colonnes utiles (tuples
+`Row`, sans objets ORM ni identity map) et les encodent directement avec
+orjson, sans passer par la validation Pydantic `from_attributes` ligne à
+ligne. Le format produit est identique à celui des schémas de lecture :
+montants `Decimal` en chaîne (« 12.50 »), dates ISO 8601, énumérations par
+valeur.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any, Iterable
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.engine import Result
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Encode `content` en JSON (octets) avec la gestion des `Decimal`."""
+    return orjson.dumps(content, default=_default)
+
+
+class FastJSONResponse(ORJSONResponse):
+    """`ORJSONResponse` sachant encoder les montants `Decimal`."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def rows_to_dicts(result: Result) -> list[dict[str, Any]]:
+    """Convertit un résultat Core en liste de dictionnaires (clé = libellé de colonne)."""
+    # `str()` : orjson refuse les sous-classes de `str` (libellés SQLAlchemy)
+    keys = tuple(str(key) for key in result.keys())
+    return [dict(zip(keys, row)) for row in result]
+
+
+def rows_response(result: Result, status_code: int = 200) -> FastJSONResponse:
+    """Réponse JSON construite directement depuis les lignes d’un résultat Core."""
+    return FastJSONResponse(rows_to_dicts(result), status_code=status_code)
@@ -0,0 +1,142 @@
+"""Index plein texte sur les libellés et commentaires des opérations.
+
+SQLite utilise une table virtuelle FTS5 externe (`operations_fts`) dont le
+tokenizer `unicode61 remove_diacritics 2` rend la recherche insensible aux
+accents ; PostgreSQL utilise une colonne `search_vector` (tsvector + unaccent)
+indexée en GIN. Dans les deux cas l’index est maintenu par des triggers, de
+sorte que les écritures ORM comme les `UPDATE`/`DELETE` en masse restent
+synchronisées.
+
+Les instructions DDL sont partagées entre la migration Alembic et
+`Base.metadata.create_all` (tests) via un écouteur `after_create`.
+"""
+
+from __future__ import annotations
+
+import re
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql.elements import TextClause
+
+
+SQLITE_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS operations_fts USING fts5(
+        label, comment,
+        content='operations', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS operations_fts_ai AFTER INSERT ON operations BEGIN
+        INSERT INTO operations_fts(rowid, label, comment)
+        VALUES (new.id, new.label, coalesce(new.comment, ''));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS operations_fts_ad AFTER DELETE ON operations BEGIN
+        INSERT INTO operations_fts(operations_fts, rowid, label, comment)
+        VALUES ('delete', old.id, old.label, coalesce(old.comment, ''));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS operations_fts_au AFTER UPDATE OF label, comment ON operations BEGIN
+        INSERT INTO operations_fts(operations_fts, rowid, label, comment)
+        VALUES ('delete', old.id, old.label, coalesce(old.comment, ''));
+        INSERT INTO operations_fts(rowid, label, comment)
+        VALUES (new.id, new.label, coalesce(new.comment, ''));
+    END
+    """,
+    "INSERT INTO operations_fts(operations_fts) VALUES ('rebuild')",
+]
+
+SQLITE_FTS_DROP = [
+    "DROP TRIGGER IF EXISTS operations_fts_au",
+    "DROP TRIGGER IF EXISTS operations_fts_ad",
+    "DROP TRIGGER IF EXISTS operations_fts_ai",
+    "DROP TABLE IF EXISTS operations_fts",
+]
+
+POSTGRES_FTS_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    "ALTER TABLE operations ADD COLUMN IF NOT EXISTS search_vector tsvector",
+    """
+    CREATE OR REPLACE FUNCTION operations_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := to_tsvector(
+            'simple', unaccent(coalesce(NEW.label, '') || ' ' || coalesce(NEW.comment, ''))
+        );
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER operations_search_vector_trg
+    BEFORE INSERT OR UPDATE OF label, comment ON operations
+    FOR EACH ROW EXECUTE FUNCTION operations_search_vector_update()
+    """,
+    """
+    UPDATE operations SET search_vector = to_tsvector(
+        'simple', unaccent(coalesce(label, '') || ' ' || coalesce(comment, ''))
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_operations_search_vector ON operations USING gin (search_vector)",
+]
+
+POSTGRES_FTS_DROP = [
+    "DROP INDEX IF EXISTS ix_operations_search_vector",
+    "DROP TRIGGER IF EXISTS operations_search_vector_trg ON operations",
+    "DROP FUNCTION IF EXISTS operations_search_vector_update()",
+    "ALTER TABLE operations DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def fts_ddl(dialect: str, drop: bool = False) -> list[str]:
+    """Retourne les instructions de création (ou suppression) de l’index pour `dialect`."""
+    if dialect == "sqlite":
+        return SQLITE_FTS_DROP if drop else SQLITE_FTS_DDL
+    if dialect == "postgresql":
+        return POSTGRES_FTS_DROP if drop else POSTGRES_FTS_DDL
+    return []
+
+
+def create_fts(target, connection: Connection, **kw) -> None:
+    """Écouteur `after_create` de la table `operations` (voir `models.operation`)."""
+    for statement in fts_ddl(connection.dialect.name):
+        connection.execute(text(statement))
+
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def search_terms(query: str) -> list[str]:
+    """Découpe la saisie utilisateur en termes sûrs (lettres et chiffres)."""
+    return _TOKEN_RE.findall(query)[:16]
+
+
+def fts_match_clause(dialect: str, terms: list[str]) -> TextClause:
+    """Construit le filtre SQL « l’opération correspond à tous les termes ».
+
+    Chaque terme est recherché par préfixe : « carr » trouve « Carrefour ».
+    """
+    if dialect == "sqlite":
+        expr = " ".join(f'"{term}"*' for term in terms)
+        return text(
+            "operations.id IN (SELECT rowid FROM operations_fts WHERE operations_fts MATCH :fts_q)"
+        ).bindparams(fts_q=expr)
+    if dialect == "postgresql":
+        expr = " & ".join(f"{term}:*" for term in terms)
+        return text(
+            "operations.search_vector @@ to_tsquery('simple', unaccent(:fts_q))"
+        ).bindparams(fts_q=expr)
+    # Repli générique (sans index) : tous les termes doivent apparaître
+    clauses = []
+    params = {}
+    for n, term in enumerate(terms):
+        clauses.append(
+            f"(lower(operations.label) LIKE :fts_{n} OR lower(coalesce(operations.comment, '')) LIKE :fts_{n})"
+        )
+        params[f"fts_{n}"] = f"%{term.lower()}%"
+    return text(" AND ".join(clauses)).bindparams(**params)
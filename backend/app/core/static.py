@@ -0,0 +1,201 @@
+"""Service des fichiers statiques du frontend (build Vite).
+
+Au démarrage, le dossier est parcouru une seule fois pour construire un
+manifeste en mémoire : type MIME, taille, ETag (empreinte du contenu) et
+variantes précompressées (`.br`, `.gz`) de chaque fichier. Chaque variante a
+son propre ETag (`"<empreinte>-br"`, `"<empreinte>-gzip"`) : deux
+représentations d’octets différents ne partagent jamais un validateur fort. Une requête ne fait
+ensuite qu’une recherche dans ce dictionnaire, une négociation
+`Accept-Encoding` et, si le serveur ASGI la propose, un envoi zéro-copie
+(`http.response.pathsend`) via `FileResponse`.
+
+Les fichiers nommés avec une empreinte par Vite (`assets/index-3f9a1c2b.js`)
+sont servis avec `Cache-Control: immutable` ; `index.html` et les autres
+fichiers sont revalidés (`no-cache`) grâce à l’ETag.
+
+Les variantes sont produites à la construction de l’image :
+
+    python -m app.core.static ./static
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from starlette.responses import FileResponse, PlainTextResponse, Response
+
+from .compression import accepted_encodings
+
+try:  # optionnel : variantes Brotli si le paquet `brotli` est installé
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+# Fichier produit par Vite avec une empreinte : `assets/nom-<hash>.ext`
+_HASHED_RE = re.compile(r"^assets/.+-[A-Za-z0-9_-]{8,}\.[a-z0-9]+$")
+# Extensions qu’il est utile de compresser
+COMPRESSIBLE = {".html", ".js", ".mjs", ".css", ".json", ".svg", ".txt", ".map", ".xml", ".ico", ".webmanifest"}
+MIN_COMPRESS_SIZE = 512
+# Ordre de préférence des encodages et suffixe des fichiers correspondants
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+@dataclass
+class Variant:
+    path: Path
+    stat: os.stat_result
+    etag: str
+
+
+@dataclass
+class Asset:
+    path: Path
+    stat: os.stat_result
+    media_type: str
+    etag: str
+    cache_control: str
+    variants: dict[str, Variant] = field(default_factory=dict)
+
+
+def _etag(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=12)
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 16), b""):
+            digest.update(chunk)
+    return f'"{digest.hexdigest()}"'
+
+
+def build_manifest(directory: Path) -> dict[str, Asset]:
+    """Indexe les fichiers servis (clé : chemin relatif URL, sans `/` initial)."""
+    manifest: dict[str, Asset] = {}
+    for path in sorted(directory.rglob("*")):
+        if not path.is_file() or path.suffix in (".br", ".gz"):
+            continue
+        key = path.relative_to(directory).as_posix()
+        media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        if media_type.startswith("text/") or media_type in ("application/javascript", "image/svg+xml"):
+            media_type += "; charset=utf-8"
+        asset = Asset(
+            path=path,
+            stat=path.stat(),
+            media_type=media_type,
+            etag=_etag(path),
+            cache_control=IMMUTABLE if _HASHED_RE.match(key) else REVALIDATE,
+        )
+        for encoding, suffix in ENCODINGS:
+            variant = path.with_name(path.name + suffix)
+            if variant.is_file():
+                asset.variants[encoding] = Variant(variant, variant.stat(), f'{asset.etag[:-1]}-{encoding}"')
+        manifest[key] = asset
+    return manifest
+
+
+def _if_none_match(scope) -> str | None:
+    for name, value in scope.get("headers", ()):
+        if name == b"if-none-match":
+            return value.decode("latin-1")
+    return None
+
+
+class StaticFrontend:
+    """Application ASGI servant le frontend depuis un manifeste en mémoire.
+
+    Les chemins inconnus sans extension renvoient `index.html` (routage côté
+    client) ; les chemins sous `/api` ne sont jamais servis.
+    """
+
+    def __init__(self, directory: str | Path, index: str = "index.html") -> None:
+        self.directory = Path(directory)
+        self.index = index
+        self.manifest = build_manifest(self.directory)
+
+    def lookup(self, path: str) -> Asset | None:
+        key = path.lstrip("/")
+        if key == "" or key.endswith("/"):
+            key += self.index
+        asset = self.manifest.get(key)
+        if asset is None and "." not in key.rsplit("/", 1)[-1]:
+            asset = self.manifest.get(self.index)
+        return asset
+
+    def response(self, scope, asset: Asset) -> Response:
+        headers = {"cache-control": asset.cache_control}
+        if asset.variants:
+            headers["vary"] = "Accept-Encoding"
+        accepted = accepted_encodings(scope.get("headers", ()))
+        chosen: Variant | None = None
+        for encoding, _ in ENCODINGS:
+            variant = asset.variants.get(encoding)
+            if variant is not None and encoding in accepted:
+                chosen = variant
+                headers["content-encoding"] = encoding
+                break
+        headers["etag"] = chosen.etag if chosen else asset.etag
+        match = _if_none_match(scope)
+        # Comparaison faible (RFC 9110) : le préfixe `W/` est ignoré
+        tags = {tag.strip().removeprefix("W/") for tag in match.split(",")} if match else set()
+        if match == "*" or headers["etag"] in tags:
+            headers.pop("content-encoding", None)
+            return Response(status_code=304, headers=headers)
+        if chosen is not None:
+            return FileResponse(chosen.path, headers=headers, media_type=asset.media_type, stat_result=chosen.stat)
+        return FileResponse(asset.path, headers=headers, media_type=asset.media_type, stat_result=asset.stat)
+
+    async def __call__(self, scope, receive, send) -> None:
+        assert scope["type"] == "http"
+        path = scope["path"]
+        if scope["method"] not in ("GET", "HEAD"):
+            response: Response = PlainTextResponse("Method Not Allowed", status_code=405)
+        elif path == "/api" or path.startswith("/api/"):
+            response = PlainTextResponse("Not Found", status_code=404)
+        else:
+            asset = self.lookup(path)
+            response = self.response(scope, asset) if asset else PlainTextResponse("Not Found", status_code=404)
+        await response(scope, receive, send)
+
+
+def precompress(directory: str | Path, level: int = 9) -> int:
+    """Écrit les variantes `.gz` (et `.br` si disponible) des fichiers compressibles.
+
+    Une variante n’est conservée que si elle est plus petite que l’original.
+    Retourne le nombre de variantes écrites.
+    """
+    written = 0
+    for path in Path(directory).rglob("*"):
+        if not path.is_file() or path.suffix not in COMPRESSIBLE:
+            continue
+        data = path.read_bytes()
+        if len(data) < MIN_COMPRESS_SIZE:
+            continue
+        candidates = [(".gz", gzip.compress(data, compresslevel=level, mtime=0))]
+        if brotli is not None:
+            candidates.append((".br", brotli.compress(data, quality=11)))
+        for suffix, compressed in candidates:
+            if len(compressed) < len(data):
+                path.with_name(path.name + suffix).write_bytes(compressed)
+                written += 1
+    return written
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.core.static", description="Précompresse les fichiers du frontend."
+    )
+    parser.add_argument("directory", help="Dossier du build (ex. ./static)")
+    args = parser.parse_args(argv)
+    count = precompress(args.directory)
+    print(f"[STATIC] {count} variante(s) précompressée(s) dans {args.directory}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""Normalisation des libellés d’opérations.
+
+Les libellés bancaires varient pour une même contrepartie (casse, accents,
+dates et références : « CB CARREFOUR 12/01 », « Carrefour »). Les fonctions
+ci-dessous produisent une forme canonique partagée par la catégorisation
+automatique et la détection de doublons.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from functools import lru_cache
+
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+
+@lru_cache(maxsize=65536)
+def label_tokens(label: str) -> tuple[str, ...]:
+    """Mots significatifs d’un libellé : minuscules, sans accents ni chiffres."""
+    decomposed = unicodedata.normalize("NFKD", label.casefold())
+    ascii_only = decomposed.encode("ascii", "ignore").decode("ascii")
+    return tuple(word for word in _WORD_RE.findall(ascii_only) if len(word) > 1)
+
+
+def normalize_label(label: str) -> str:
+    """Forme canonique d’un libellé (mots significatifs séparés par une espace)."""
+    return " ".join(label_tokens(label))
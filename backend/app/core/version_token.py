@@ -0,0 +1,33 @@
+"""Jeton de version partagé entre processus au moyen d’un fichier.
+
+Un cache de processus retient le jeton lu lors de son dernier chargement et
+le compare au jeton courant (lecture d’un fichier, sans requête SQL) ; le
+processus qui modifie les données sous-jacentes écrit un nouveau jeton, par
+remplacement atomique du fichier.
+"""
+
+from __future__ import annotations
+
+import os
+import uuid
+from pathlib import Path
+
+
+class VersionToken:
+    """Jeton stocké dans `path` (vide tant que le fichier n’existe pas)."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+
+    def read(self) -> str:
+        try:
+            return self.path.read_text(encoding="ascii")
+        except FileNotFoundError:
+            return ""
+
+    def bump(self) -> None:
+        """Écrit un nouveau jeton."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(uuid.uuid4().hex, encoding="ascii")
+        os.replace(tmp, self.path)
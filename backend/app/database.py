@@ -4,7 +4,10 @@ Ce module configure le moteur SQLAlchemy asynchrone pour SQLite et
 expose un générateur de session utilisable comme dépendance FastAPI.
 """
 
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from __future__ import annotations
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
 from .core.config import settings
@@ -14,19 +17,90 @@ class Base(DeclarativeBase):
     """Base déclarative pour l’ensemble des modèles ORM."""
 
 
-# Création du moteur asynchrone. L’option « future=True » active l’API 2.0.
+class PoolStats:
+    """Compteurs d’utilisation du pool de connexions d’un moteur."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        self.checkouts += 1
+        self.in_use += 1
+        self.peak_in_use = max(self.peak_in_use, self.in_use)
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        self.checkins += 1
+        self.in_use = max(0, self.in_use - 1)
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "in_use": self.in_use,
+            "peak_in_use": self.peak_in_use,
+        }
+
+
+def track_pool(target: AsyncEngine) -> PoolStats:
+    """Branche des compteurs sur les événements du pool de `target`."""
+    stats = PoolStats()
+    sync_engine = target.sync_engine
+    event.listen(sync_engine, "connect", stats._on_connect)
+    event.listen(sync_engine, "checkout", stats._on_checkout)
+    event.listen(sync_engine, "checkin", stats._on_checkin)
+    return stats
+
+
+def enforce_foreign_keys(target: AsyncEngine) -> None:
+    """Active le contrôle des clés étrangères, désactivé par défaut sous SQLite.
+
+    Le pragma est sans effet dans une transaction ouverte : il est donc émis
+    à l’ouverture de chaque connexion du pool.
+    """
+    if target.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(target.sync_engine, "connect")
+    def _foreign_keys(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+# Création du moteur asynchrone. L’option « future=True » active l’API 2.0.
 engine = create_async_engine(settings.database_url, echo=False, future=True)
+enforce_foreign_keys(engine)
+pool_stats = track_pool(engine)
 
 # Création d’un fabriquant de sessions asynchrones.
 async_session = async_sessionmaker(engine, expire_on_commit=False)
 
 
 async def get_session():
-    """Dépendance FastAPI fournissant une session de base de données.
+    """Dépendance FastAPI fournissant la session (unité de travail) de la requête.
+
+    FastAPI met en cache une dépendance pour toute la durée d’une requête :
+    l’authentification (`get_current_user`), les contrôles d’accès et la route
+    reçoivent donc la même session, et une seule connexion est empruntée au
+    pool. Une transaction laissée ouverte par une erreur est annulée.
 
-    Usage :
-        async with get_session() as session:
-            ...
+    Usage :
+        db: AsyncSession = Depends(get_session)
     """
     async with async_session() as session:
-        yield session
\ No newline at end of file
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
@@ -1,3 +1,8 @@
 """Package pour les tâches asynchrones périodiques."""
 
-from .recurring import start_recurring_materializer  # noqa: F401
\ No newline at end of file
+from .recurring import start_recurring_materializer  # noqa: F401
+from .statements import start_statements_loop  # noqa: F401
+from .audit import flush_audit_log, start_audit_flusher  # noqa: F401
+from .leadership import start_leader_election  # noqa: F401
+from .queue import enqueue, register_task, start_job_workers  # noqa: F401
+from . import tasks  # noqa: F401  (enregistre les tâches disponibles)
@@ -0,0 +1,36 @@
+"""Écriture par lots du journal d’audit (voir `core.audit`).
+
+La boucle tourne dans chaque worker de l’API, chacun ayant son propre tampon.
+"""
+
+from __future__ import annotations
+
+from ..core.audit import audit_log
+from ..core.config import settings
+from ..database import async_session
+from .lifecycle import spawn, stopping
+
+
+async def flush_audit_log() -> int:
+    """Vide le tampon d’audit dans sa propre session."""
+    async with async_session() as session:
+        return await audit_log.flush(session)
+
+
+async def audit_loop() -> None:
+    """Vide le tampon toutes les `AUDIT_FLUSH_INTERVAL_MS` ms ou dès qu’un lot est complet,
+    puis une dernière fois à l’arrêt."""
+    while True:
+        await audit_log.wait(settings.audit_flush_interval_ms / 1000)
+        try:
+            await flush_audit_log()
+        except Exception:  # pragma: no cover
+            # On logguerait l’erreur ici ; les événements restent en attente
+            pass
+        if stopping():
+            break
+
+
+def start_audit_flusher() -> None:
+    """Démarre l’écriture périodique du journal d’audit (depuis l’API)."""
+    spawn(audit_loop())
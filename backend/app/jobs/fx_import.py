@@ -0,0 +1,35 @@
+"""Import des taux de change depuis un fichier CSV.
+
+    python -m app.jobs.fx_import taux.csv
+
+Le fichier contient une ligne d’en-tête `date,currency,rate` ; `rate` est la
+valeur d’une unité de `currency` dans la devise de l’instance.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from ..core.fx import import_fx_rates, read_fx_file
+from ..database import async_session, engine
+
+
+async def _main(path: str) -> int:
+    try:
+        async with async_session() as session:
+            return await import_fx_rates(session, read_fx_file(path))
+    finally:
+        await engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.jobs.fx_import", description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="Fichier CSV date,currency,rate")
+    args = parser.parse_args(argv)
+    count = asyncio.run(_main(args.path))
+    print(f"[FX] {count} taux importé(s) depuis {args.path}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
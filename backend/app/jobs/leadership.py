@@ -0,0 +1,38 @@
+"""Élection continue du worker leader des boucles périodiques.
+
+Chaque worker de l’API lance `start_leader_election()` au démarrage : celui
+qui obtient le verrou (`core.leader`) démarre les boucles périodiques, les
+autres retentent toutes les `LEADER_RETRY_SECONDS` secondes. Si le leader
+meurt, le système libère son verrou et un survivant le remplace sans qu’un
+nouveau processus soit nécessaire.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from ..core.config import settings
+from ..core.leader import acquire_leadership
+from .lifecycle import sleep_or_stop, spawn, stopping
+
+
+async def campaign(
+    on_elected: Callable[[], None], path: str | None = None, interval: float | None = None
+) -> bool:
+    """Retente l’élection jusqu’à l’obtenir, puis appelle `on_elected` une fois.
+
+    Retourne False si l’arrêt est demandé avant l’élection.
+    """
+    interval = settings.leader_retry_seconds if interval is None else interval
+    while not stopping():
+        if acquire_leadership(path):
+            on_elected()
+            return True
+        if await sleep_or_stop(interval):
+            break
+    return False
+
+
+def start_leader_election(on_elected: Callable[[], None]) -> None:
+    """Démarre la candidature en tâche de fond (depuis l’API)."""
+    spawn(campaign(on_elected))
@@ -0,0 +1,77 @@
+"""Cycle de vie des tâches de fond : démarrage suivi et arrêt gracieux.
+
+Les boucles périodiques et le pool de workers sont lancés avec `spawn()`, qui
+conserve une référence sur chaque tâche. À l’arrêt (SIGTERM reçu par le
+serveur ou le worker dédié), `shutdown()` signale l’arrêt : les boucles
+sortent de leur attente, les workers terminent la tâche en cours sans en
+réclamer de nouvelle, puis les tâches encore actives après le délai de grâce
+sont annulées (leur bail expirera et une autre instance les reprendra).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Coroutine
+
+_tasks: set[asyncio.Task] = set()
+_stopping: asyncio.Event | None = None
+
+
+def _event() -> asyncio.Event:
+    global _stopping
+    if _stopping is None:
+        _stopping = asyncio.Event()
+    return _stopping
+
+
+def spawn(coro: Coroutine) -> asyncio.Task:
+    """Lance `coro` en tâche de fond suivie jusqu’à l’arrêt."""
+    task = asyncio.create_task(coro)
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return task
+
+
+def stopping() -> bool:
+    """Indique si l’arrêt a été demandé."""
+    return _stopping is not None and _stopping.is_set()
+
+
+def request_stop() -> None:
+    """Demande l’arrêt des boucles sans attendre (gestionnaire de signal)."""
+    _event().set()
+
+
+async def wait_for_stop() -> None:
+    """Attend la demande d’arrêt."""
+    await _event().wait()
+
+
+async def sleep_or_stop(seconds: float) -> bool:
+    """Attend `seconds` secondes ; retourne True si l’arrêt a été demandé entre-temps."""
+    try:
+        await asyncio.wait_for(_event().wait(), timeout=seconds)
+    except asyncio.TimeoutError:
+        return False
+    return True
+
+
+async def shutdown(timeout: float) -> int:
+    """Arrête les tâches de fond ; retourne le nombre de tâches annulées de force."""
+    request_stop()
+    pending = set(_tasks)
+    if pending:
+        _, pending = await asyncio.wait(pending, timeout=timeout)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+    reset()
+    return len(pending)
+
+
+def reset() -> None:
+    """Réinitialise l’état pour un redémarrage (nouvelle boucle d’événements)."""
+    global _stopping
+    _tasks.clear()
+    _stopping = None
@@ -0,0 +1,313 @@
+"""File d’attente durable des tâches de fond, stockée dans la table `jobs`.
+
+Les routes enregistrent une tâche avec `enqueue()` et répondent immédiatement
+(202). Un pool de workers, lancé dans l’API ou dans `python -m app.jobs.worker`,
+réclame les tâches une à une grâce à un bail (`lease_expires_at`) : une tâche
+dont le worker a disparu redevient disponible à l’expiration du bail. Pendant
+l’exécution d’un handler, le bail est renouvelé à intervalle régulier par une
+tâche annexe : un handler long n’a pas à signaler son avancement pour garder
+sa tâche.
+
+Un type de tâche peut déclarer le schéma Pydantic de son payload ; `enqueue()`
+le valide avant d’enregistrer la tâche (422 depuis l’API).
+
+Sous PostgreSQL la réclamation utilise `SELECT … FOR UPDATE SKIP LOCKED`. Les
+autres moteurs (SQLite) utilisent un `UPDATE` conditionnel optimiste : seul le
+worker dont la mise à jour touche effectivement la ligne obtient la tâche.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+from pydantic import BaseModel
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..core.config import settings
+from ..database import async_session
+from ..models.enums import JobStatus
+from ..models.job import Job
+from .lifecycle import sleep_or_stop, spawn, stopping
+
+
+TaskHandler = Callable[[AsyncSession, Job], Awaitable[Optional[dict[str, Any]]]]
+
+
+@dataclass(frozen=True)
+class TaskSpec:
+    """Description d’un type de tâche exécutable par les workers."""
+
+    kind: str
+    handler: TaskHandler
+    admin_only: bool = False
+    # Schéma du payload, validé par `enqueue()` (aucune validation si absent)
+    payload: type[BaseModel] | None = None
+
+
+_registry: dict[str, TaskSpec] = {}
+
+
+def register_task(
+    kind: str, *, admin_only: bool = False, payload: type[BaseModel] | None = None
+) -> Callable[[TaskHandler], TaskHandler]:
+    """Décorateur enregistrant `handler` pour les tâches de type `kind`.
+
+    Le handler reçoit la session du worker et la tâche ; il peut retourner un
+    dictionnaire JSON stocké dans `Job.result`.
+    """
+
+    def decorator(handler: TaskHandler) -> TaskHandler:
+        _registry[kind] = TaskSpec(kind=kind, handler=handler, admin_only=admin_only, payload=payload)
+        return handler
+
+    return decorator
+
+
+def get_task(kind: str) -> TaskSpec | None:
+    """Retourne la description d’un type de tâche ou `None` s’il est inconnu."""
+    return _registry.get(kind)
+
+
+async def enqueue(
+    session: AsyncSession,
+    kind: str,
+    payload: dict[str, Any] | None = None,
+    owner_id: int | None = None,
+    max_attempts: int | None = None,
+) -> Job:
+    """Ajoute une tâche à la file et la persiste immédiatement.
+
+    Lève `pydantic.ValidationError` si le payload ne respecte pas le schéma
+    déclaré pour `kind`.
+    """
+    spec = get_task(kind)
+    if spec is not None and spec.payload is not None:
+        spec.payload.model_validate(payload or {})
+    job = Job(
+        kind=kind,
+        payload=payload or {},
+        status=JobStatus.PENDING,
+        attempts=0,
+        max_attempts=max_attempts or settings.job_max_attempts,
+        run_after=datetime.utcnow(),
+        owner_id=owner_id,
+    )
+    session.add(job)
+    await session.commit()
+    await session.refresh(job)
+    return job
+
+
+def _claimable(now: datetime):
+    """Condition SQL des tâches pouvant être prises par un worker.
+
+    Une tâche dont le bail a expiré (worker tué, bloqué…) n’est reprise que
+    s’il lui reste des tentatives ; sinon `fail_expired_jobs` la clôt.
+    """
+    return or_(
+        and_(Job.status == JobStatus.PENDING, Job.run_after <= now),
+        and_(
+            Job.status == JobStatus.RUNNING,
+            Job.lease_expires_at < now,
+            Job.attempts < Job.max_attempts,
+        ),
+    )
+
+
+async def fail_expired_jobs(session: AsyncSession) -> int:
+    """Marque en échec définitif les tâches dont le bail a expiré après leur
+    dernière tentative ; retourne leur nombre."""
+    now = datetime.utcnow()
+    result = await session.execute(
+        update(Job)
+        .where(Job.status == JobStatus.RUNNING)
+        .where(Job.lease_expires_at < now)
+        .where(Job.attempts >= Job.max_attempts)
+        .values(
+            status=JobStatus.FAILED,
+            error="Lease expired on the last attempt",
+            locked_by=None,
+            lease_expires_at=None,
+            updated_at=now,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+    return result.rowcount
+
+
+async def claim_job(session: AsyncSession, worker_id: str) -> Job | None:
+    """Réclame la prochaine tâche disponible pour `worker_id`.
+
+    Retourne `None` lorsqu’aucune tâche n’est prête.
+    """
+    now = datetime.utcnow()
+    lease = now + timedelta(seconds=settings.job_lease_seconds)
+    if session.bind.dialect.name == "postgresql":
+        result = await session.execute(
+            select(Job)
+            .where(_claimable(now))
+            .order_by(Job.run_after, Job.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        job = result.scalars().first()
+        if job is None:
+            await session.commit()
+            return None
+        job.status = JobStatus.RUNNING
+        job.locked_by = worker_id
+        job.lease_expires_at = lease
+        job.attempts += 1
+        await session.commit()
+        return job
+
+    # Repli SQLite : on retente si un autre worker a pris la tâche entre-temps
+    for _ in range(3):
+        result = await session.execute(
+            select(Job.id).where(_claimable(now)).order_by(Job.run_after, Job.id).limit(1)
+        )
+        job_id = result.scalar_one_or_none()
+        if job_id is None:
+            return None
+        claimed = await session.execute(
+            update(Job)
+            .where(Job.id == job_id)
+            .where(_claimable(now))
+            .values(
+                status=JobStatus.RUNNING,
+                locked_by=worker_id,
+                lease_expires_at=lease,
+                attempts=Job.attempts + 1,
+                updated_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        if claimed.rowcount == 1:
+            return await session.get(Job, job_id, populate_existing=True)
+    return None
+
+
+async def set_progress(session: AsyncSession, job: Job, progress: int) -> None:
+    """Met à jour l’avancement (0–100) d’une tâche en cours (et prolonge son bail)."""
+    job.progress = max(0, min(100, int(progress)))
+    job.lease_expires_at = datetime.utcnow() + timedelta(seconds=settings.job_lease_seconds)
+    await session.commit()
+
+
+async def complete_job(session: AsyncSession, job: Job, result: dict[str, Any] | None) -> None:
+    """Marque une tâche comme réussie."""
+    job.status = JobStatus.SUCCEEDED
+    job.progress = 100
+    job.result = result
+    job.error = None
+    job.locked_by = None
+    job.lease_expires_at = None
+    await session.commit()
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Délai avant nouvelle tentative (backoff exponentiel)."""
+    return timedelta(seconds=settings.job_retry_backoff_seconds * (2 ** max(0, attempts - 1)))
+
+
+async def fail_job(session: AsyncSession, job: Job, error: str) -> None:
+    """Enregistre un échec : replanifie la tâche ou la marque en échec définitif."""
+    job.error = error
+    job.locked_by = None
+    job.lease_expires_at = None
+    if job.attempts < job.max_attempts:
+        job.status = JobStatus.PENDING
+        job.run_after = datetime.utcnow() + retry_delay(job.attempts)
+    else:
+        job.status = JobStatus.FAILED
+    await session.commit()
+
+
+async def _renew_lease(sessions: async_sessionmaker, job_id: int, worker_id: str | None) -> None:
+    interval = settings.job_lease_seconds / 3
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with sessions() as session:
+                await session.execute(
+                    update(Job)
+                    .where(Job.id == job_id, Job.locked_by == worker_id, Job.status == JobStatus.RUNNING)
+                    .values(lease_expires_at=datetime.utcnow() + timedelta(seconds=settings.job_lease_seconds))
+                    .execution_options(synchronize_session=False)
+                )
+                await session.commit()
+        except Exception:  # pragma: no cover
+            # On logguerait l’erreur ici ; nouvel essai au prochain battement
+            pass
+
+
+@asynccontextmanager
+async def lease_heartbeat(session: AsyncSession, job: Job) -> AsyncIterator[None]:
+    """Renouvelle le bail de `job` tous les tiers de bail pendant le bloc.
+
+    Le renouvellement passe par sa propre session (même base que `session`),
+    utilisable pendant que le handler se sert de la sienne.
+    """
+    sessions = async_sessionmaker(session.bind, expire_on_commit=False)
+    task = asyncio.create_task(_renew_lease(sessions, job.id, job.locked_by))
+    try:
+        yield
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+async def run_job(session: AsyncSession, job: Job) -> None:
+    """Exécute une tâche réclamée et enregistre son issue."""
+    job_id = job.id
+    spec = get_task(job.kind)
+    try:
+        if spec is None:
+            raise LookupError(f"Unknown job kind: {job.kind}")
+        async with lease_heartbeat(session, job):
+            result = await spec.handler(session, job)
+    except Exception as exc:
+        await session.rollback()
+        job = await session.get(Job, job_id, populate_existing=True)
+        await fail_job(session, job, f"{type(exc).__name__}: {exc}")
+    else:
+        await complete_job(session, job, result)
+
+
+async def _worker(worker_id: str) -> None:
+    # La tâche en cours est menée à terme ; aucune autre n’est réclamée après
+    # la demande d’arrêt.
+    while not stopping():
+        job = None
+        try:
+            async with async_session() as session:
+                await fail_expired_jobs(session)
+                job = await claim_job(session, worker_id)
+                if job is not None:
+                    await run_job(session, job)
+        except Exception:  # pragma: no cover
+            # On logguerait l’erreur ici ; le bail expirera si la tâche est bloquée
+            pass
+        if job is None:
+            await sleep_or_stop(settings.job_poll_interval_seconds)
+
+
+async def run_worker_pool(concurrency: int | None = None) -> None:
+    """Lance `concurrency` workers concurrents jusqu’à interruption."""
+    size = concurrency or settings.job_concurrency
+    prefix = f"{socket.gethostname()}:{os.getpid()}"
+    await asyncio.gather(*(_worker(f"{prefix}:{n}") for n in range(size)))
+
+
+def start_job_workers() -> None:
+    """Démarre le pool de workers en tâche de fond (depuis l’API)."""
+    spawn(run_worker_pool())
@@ -2,16 +2,49 @@
 
 from __future__ import annotations
 
-import asyncio
+import calendar
 from datetime import date, timedelta
 from typing import Optional
 
-from sqlalchemy import select, and_
+from sqlalchemy import and_, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..core.budgets import Spending, record_spending
+from ..core.categorizer import categorizer
+from ..core.duplicates import operation_fingerprint
 from ..database import get_session
 from ..models.recurring import RecurringItem
 from ..models.operation import Operation
+from .lifecycle import sleep_or_stop, spawn, stopping
+from .statements import mark_stale
+
+
+def _is_due(item: RecurringItem, target_date: date) -> bool:
+    """Indique si l’item doit produire une opération à `target_date`."""
+    # Déterminer si l’item doit être exécuté ce jour
+    should_execute = False
+    if item.frequency == "DAILY":
+        should_execute = True
+    elif item.frequency == "WEEKLY":
+        # moment: 1=lundi…7=dimanche
+        if target_date.isoweekday() == item.moment:
+            should_execute = True
+    else:
+        # cas mensuel et autres : comparer le jour du mois (report si fin de mois manquant)
+        day = item.moment
+        # ajustement si le jour n’existe pas ce mois-ci
+        last_day = calendar.monthrange(target_date.year, target_date.month)[1]
+        effective_day = min(day, last_day)
+        if target_date.day == effective_day:
+            should_execute = True
+    if not should_execute:
+        return False
+    # Vérifier que l’item est dans sa période (si définie)
+    if item.start_date and target_date < item.start_date:
+        return False
+    if item.end_date and target_date > item.end_date:
+        return False
+    return True
 
 
 async def materialize_once(session: AsyncSession, target_date: date) -> None:
@@ -25,57 +58,65 @@ async def materialize_once(session: AsyncSession, target_date: date) -> None:
     # Récupérer les items actifs sans conditions de période (simplifié)
     result = await session.execute(select(RecurringItem).where(RecurringItem.active.is_(True)))
     items = result.scalars().all()
-    for item in items:
-        # Déterminer si l’item doit être exécuté aujourd’hui
-        should_execute = False
-        if item.frequency == "DAILY":
-            should_execute = True
-        elif item.frequency == "WEEKLY":
-            # moment: 1=lundi…7=dimanche
-            if target_date.isoweekday() == item.moment:
-                should_execute = True
-        else:
-            # cas mensuel et autres : comparer le jour du mois (report si fin de mois manquant)
-            day = item.moment
-            # ajustement si le jour n’existe pas ce mois-ci
-            last_day = (target_date.replace(day=28) + timedelta(days=4)).day
-            effective_day = min(day, last_day)
-            if target_date.day == effective_day:
-                should_execute = True
-        if not should_execute:
-            continue
-        # Vérifier que l’item est dans sa période (si définie)
-        if item.start_date and target_date < item.start_date:
+    due = [item for item in items if _is_due(item, target_date)]
+    if not due:
+        return
+    # Opérations déjà matérialisées ce jour-là : une seule requête pour tous les items
+    res = await session.execute(
+        select(Operation.account_id, Operation.label)
+        .where(Operation.date == target_date)
+        .where(Operation.account_id.in_({item.account_id for item in due}))
+    )
+    existing = {(account_id, label) for account_id, label in res}
+    rows = []
+    for item in due:
+        key = (item.account_id, item.label)
+        if key in existing:
             continue
-        if item.end_date and target_date > item.end_date:
-            continue
-        # Vérifier si déjà matérialisé
-        res = await session.execute(
-            select(Operation)
-            .where(Operation.account_id == item.account_id)
-            .where(Operation.date == target_date)
-            .where(Operation.label == item.label)
+        existing.add(key)
+        # Opération à créer (insérées ensemble en une instruction)
+        rows.append(
+            {
+                "type": item.type,
+                "label": item.label,
+                "amount": item.amount,
+                "date": target_date,
+                "account_id": item.account_id,
+                "category_id": item.category_id,
+                "payment_method_id": item.payment_method_id,
+                "comment": item.comment,
+                "fingerprint": operation_fingerprint(item.account_id, item.type, item.amount, item.label),
+            }
         )
-        if res.scalar_one_or_none():
-            continue
-        # Créer l’opération
-        op = Operation(
-            type=item.type,
-            label=item.label,
-            amount=item.amount,
-            date=target_date,
-            account_id=item.account_id,
-            category_id=item.category_id,
-            payment_method_id=item.payment_method_id,
-            comment=item.comment,
+        categorizer.learn(item.account_id, item.label, item.category_id, item.payment_method_id)
+    if rows:
+        await session.execute(insert(Operation), rows)
+        await record_spending(
+            session,
+            added=[Spending(*(row[name] for name in Spending._fields)) for row in rows],
         )
-        session.add(op)
+        await mark_stale(session, [(row["account_id"], row["date"]) for row in rows])
     await session.commit()
 
 
+async def materialize_range(session: AsyncSession, start: date, end: date) -> int:
+    """Matérialise les items récurrents pour chaque jour de `start` à `end` inclus.
+
+    Utilisé pour le rattrapage (backfill) depuis le worker. Retourne le nombre
+    de jours traités.
+    """
+    days = 0
+    current = start
+    while current <= end:
+        await materialize_once(session, current)
+        current += timedelta(days=1)
+        days += 1
+    return days
+
+
 async def recurring_materializer_loop() -> None:
     """Boucle infinie qui matérialise quotidiennement les items récurrents."""
-    while True:
+    while not stopping():
         try:
             async for db in get_session():
                 await materialize_once(db, date.today())
@@ -83,8 +124,9 @@ async def recurring_materializer_loop() -> None:
         except Exception as exc:  # pragma: no cover
             # On logguerait l’erreur ici
             pass
-        # Attendre jusqu’au lendemain (simplifié : 24 h)
-        await asyncio.sleep(60 * 60 * 24)
+        # Attendre jusqu’au lendemain (simplifié : 24 h), ou l’arrêt
+        if await sleep_or_stop(60 * 60 * 24):
+            break
 
 
 def start_recurring_materializer() -> None:
@@ -93,4 +135,4 @@ def start_recurring_materializer() -> None:
     À appeler depuis un événement de démarrage FastAPI. La fonction retourne
     immédiatement et laisse la boucle tourner en arrière‑plan.
     """
-    asyncio.create_task(recurring_materializer_loop())
\ No newline at end of file
+    spawn(recurring_materializer_loop())
\ No newline at end of file
@@ -0,0 +1,277 @@
+"""Relevés mensuels figés et archivage de l’historique ancien.
+
+À chaque fin de mois, `snapshot_month` fige pour chaque compte les totaux par
+catégorie et le solde de clôture (tables `account_snapshots` et
+`category_snapshots`). Un mois déjà figé n’est recalculé que si ses relevés
+ont été marqués périmés (voir plus bas).
+
+Si `ARCHIVE_AFTER_YEARS` est positif, `archive_operations` déplace ensuite les
+opérations antérieures à ce délai vers `operations_archive` : la table chaude
+et ses index restent de taille bornée, tandis que l’historique reste
+consultable à la demande. Le solde net des opérations déplacées est reporté
+dans `bank_accounts.archived_balance` afin que les soldes restent exacts.
+
+Une écriture d’opération datée d’un mois échu (création, modification,
+suppression) appelle `mark_stale` : les relevés du compte à partir de ce mois
+(le solde de clôture des mois suivants change aussi) sont marqués périmés et
+`close_months` les recalcule à son prochain passage.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Iterable
+
+from sqlalchemy import (
+    BigInteger,
+    and_,
+    bindparam,
+    case,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    type_coerce,
+    union_all,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..core.money import from_cents
+from ..database import async_session
+from ..models.account import BankAccount
+from ..models.enums import OperationType
+from ..models.operation import Operation
+from ..models.snapshot import AccountSnapshot, ArchivedOperation, CategorySnapshot
+from .lifecycle import sleep_or_stop, spawn, stopping
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def next_month(month: date) -> date:
+    return (month.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def previous_month(month: date) -> date:
+    return (month.replace(day=1) - timedelta(days=1)).replace(day=1)
+
+
+def _signed_cents(ops=None):
+    ops = Operation.__table__ if ops is None else ops
+    cents = type_coerce(ops.c.amount, BigInteger)
+    return case((ops.c.type == OperationType.REVENU, cents), else_=-cents)
+
+
+def _ledger(until: date):
+    """Opérations chaudes et archivées antérieures à `until`, réunies.
+
+    Un mois déjà archivé peut être recalculé (relevé périmé) : ses opérations
+    sont alors dans `operations_archive`, et une écriture tardive dans
+    `operations`.
+    """
+    columns = ("account_id", "category_id", "type", "amount", "date")
+    return union_all(
+        *(
+            select(*(table.c[name] for name in columns)).where(table.c.date < until)
+            for table in (Operation.__table__, ArchivedOperation.__table__)
+        )
+    ).subquery("ledger")
+
+
+async def snapshot_month(session: AsyncSession, month: date) -> int:
+    """Fige le mois `month` pour les comptes sans relevé ou dont le relevé est périmé.
+
+    Quelques requêtes groupées quel que soit le nombre de comptes : suppression
+    des relevés périmés, relevés existants, totaux par compte et catégorie,
+    soldes de clôture, calculés sur `operations` et `operations_archive`.
+    Retourne le nombre de relevés créés.
+    """
+    month = month_start(month)
+    end = next_month(month)
+    if end > month_start(date.today()):
+        raise ValueError("Only closed months can be snapshotted")
+    accounts = BankAccount.__table__
+    ops = _ledger(end)
+    snapshots = AccountSnapshot.__table__
+    # Les relevés périmés du mois sont supprimés puis recalculés
+    stale = select(snapshots.c.account_id).where(snapshots.c.month == month, snapshots.c.stale)
+    await session.execute(
+        delete(CategorySnapshot.__table__).where(
+            CategorySnapshot.month == month, CategorySnapshot.account_id.in_(stale)
+        )
+    )
+    await session.execute(delete(snapshots).where(snapshots.c.month == month, snapshots.c.stale))
+    done = set(
+        (await session.execute(select(snapshots.c.account_id).where(snapshots.c.month == month))).scalars()
+    )
+    cents = type_coerce(ops.c.amount, BigInteger)
+    per_category = await session.execute(
+        select(
+            ops.c.account_id,
+            ops.c.category_id,
+            func.sum(case((ops.c.type == OperationType.REVENU, cents), else_=0)),
+            func.sum(case((ops.c.type == OperationType.DEPENSE, cents), else_=0)),
+            func.count(),
+        )
+        .where(ops.c.date >= month)
+        .group_by(ops.c.account_id, ops.c.category_id)
+    )
+    # Le solde de clôture part des opérations antérieures à la fin du mois,
+    # archivées comprises : `archived_balance` couvre aussi les mois suivants
+    movements = (
+        select(ops.c.account_id, func.sum(_signed_cents(ops)).label("delta"))
+        .group_by(ops.c.account_id)
+        .subquery()
+    )
+    closing = await session.execute(
+        select(
+            accounts.c.id,
+            type_coerce(accounts.c.initial_balance, BigInteger) + func.coalesce(movements.c.delta, 0),
+        ).outerjoin(movements, movements.c.account_id == accounts.c.id)
+    )
+    category_rows = []
+    totals: dict[int, list[int]] = defaultdict(lambda: [0, 0, 0])
+    for account_id, category_id, revenue, expense, count in per_category:
+        if account_id in done:
+            continue
+        category_rows.append(
+            {
+                "account_id": account_id,
+                "month": month,
+                "category_id": category_id,
+                "revenue": from_cents(revenue),
+                "expense": from_cents(expense),
+                "operation_count": count,
+            }
+        )
+        total = totals[account_id]
+        total[0] += revenue
+        total[1] += expense
+        total[2] += count
+    account_rows = [
+        {
+            "account_id": account_id,
+            "month": month,
+            "revenue": from_cents(totals[account_id][0]),
+            "expense": from_cents(totals[account_id][1]),
+            "operation_count": totals[account_id][2],
+            "closing_balance": from_cents(balance),
+        }
+        for account_id, balance in closing
+        if account_id not in done
+    ]
+    if account_rows:
+        await session.execute(insert(AccountSnapshot), account_rows)
+    if category_rows:
+        await session.execute(insert(CategorySnapshot), category_rows)
+    await session.commit()
+    return len(account_rows)
+
+
+async def archive_operations(session: AsyncSession, before: date) -> int:
+    """Déplace vers `operations_archive` les opérations antérieures au mois de `before`.
+
+    Les mois concernés sont d’abord figés, puis le solde net archivé de chaque
+    compte est reporté, les lignes copiées et supprimées de `operations`, le
+    tout dans une même transaction. Retourne le nombre d’opérations archivées.
+    """
+    cutoff = month_start(before)
+    if cutoff > month_start(date.today()):
+        raise ValueError("Cannot archive the current month")
+    ops = Operation.__table__
+    oldest = (await session.execute(select(func.min(ops.c.date)).where(ops.c.date < cutoff))).scalar()
+    if oldest is None:
+        return 0
+    month = month_start(oldest)
+    while month < cutoff:
+        await snapshot_month(session, month)
+        month = next_month(month)
+
+    deltas = await session.execute(
+        select(ops.c.account_id, func.sum(_signed_cents()))
+        .where(ops.c.date < cutoff)
+        .group_by(ops.c.account_id)
+    )
+    accounts = BankAccount.__table__
+    await session.execute(
+        update(accounts)
+        .where(accounts.c.id == bindparam("account"))
+        .values(
+            archived_balance=type_coerce(accounts.c.archived_balance, BigInteger)
+            + bindparam("delta", type_=BigInteger)
+        )
+        .execution_options(synchronize_session=False),
+        [{"account": account_id, "delta": delta} for account_id, delta in deltas],
+    )
+    archive = ArchivedOperation.__table__
+    columns = [name for name in archive.c.keys() if name in ops.c]
+    await session.execute(
+        insert(archive).from_select(
+            columns, select(*(ops.c[name] for name in columns)).where(ops.c.date < cutoff)
+        )
+    )
+    result = await session.execute(delete(ops).where(ops.c.date < cutoff))
+    await session.commit()
+    return result.rowcount
+
+
+async def mark_stale(session: AsyncSession, changes: Iterable[tuple[int, date]]) -> None:
+    """Marque périmés les relevés touchés par des opérations `(compte, date)`
+    écrites, modifiées ou supprimées, dans la transaction de l’écriture.
+
+    Aucune requête si toutes les dates sont dans le mois en cours.
+    """
+    current = month_start(date.today())
+    earliest: dict[int, date] = {}
+    for account_id, day in changes:
+        month = month_start(day)
+        if month < current and month < earliest.get(account_id, current):
+            earliest[account_id] = month
+    if not earliest:
+        return
+    snapshots = AccountSnapshot.__table__
+    affected = [
+        and_(snapshots.c.account_id == account_id, snapshots.c.month >= month)
+        for account_id, month in earliest.items()
+    ]
+    await session.execute(update(snapshots).where(or_(*affected)).values(stale=True))
+
+
+async def close_months(session: AsyncSession, today: date) -> dict[str, int]:
+    """Passe périodique : recalcule les relevés périmés, fige le mois précédent
+    et archive selon la configuration."""
+    snapshots = 0
+    stale = await session.execute(
+        select(AccountSnapshot.month).where(AccountSnapshot.stale).distinct().order_by(AccountSnapshot.month)
+    )
+    for month in stale.scalars().all():
+        snapshots += await snapshot_month(session, month)
+    snapshots += await snapshot_month(session, previous_month(month_start(today)))
+    archived = 0
+    if settings.archive_after_years > 0:
+        cutoff = date(today.year - settings.archive_after_years, today.month, 1)
+        archived = await archive_operations(session, cutoff)
+    return {"snapshots": snapshots, "archived": archived}
+
+
+async def statements_loop() -> None:
+    """Boucle quotidienne des relevés ; sans effet tant que le mois n’est pas clos."""
+    while not stopping():
+        try:
+            async with async_session() as session:
+                await close_months(session, date.today())
+        except Exception:  # pragma: no cover
+            # On logguerait l’erreur ici
+            pass
+        if await sleep_or_stop(60 * 60 * 24):
+            break
+
+
+def start_statements_loop() -> None:
+    """Démarre la boucle des relevés en tâche de fond (depuis l’API)."""
+    spawn(statements_loop())
@@ -0,0 +1,63 @@
+"""Tâches exécutables via la file d’attente `jobs`."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field, model_validator
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.job import Job
+from .queue import register_task, set_progress
+from .recurring import materialize_once
+from .statements import archive_operations, snapshot_month
+
+
+class MaterializePayload(BaseModel):
+    start: Optional[date] = Field(default=None, alias="from")
+    end: Optional[date] = Field(default=None, alias="to")
+
+    @model_validator(mode="after")
+    def _ordered(self) -> "MaterializePayload":
+        if self.start and self.end and self.end < self.start:
+            raise ValueError("'to' must be on or after 'from'")
+        return self
+
+
+class SnapshotPayload(BaseModel):
+    month: Optional[date] = None
+
+
+class ArchivePayload(BaseModel):
+    before: date
+
+
+@register_task("recurring.materialize", admin_only=True, payload=MaterializePayload)
+async def materialize_recurring(session: AsyncSession, job: Job) -> dict[str, Any]:
+    """Rattrapage des récurrences sur la période `{"from": …, "to": …}` du payload."""
+    payload = MaterializePayload.model_validate(job.payload)
+    start = payload.start or date.today()
+    end = payload.end or start
+    if end < start:
+        raise ValueError("'to' must be on or after 'from'")
+    total = (end - start).days + 1
+    for offset in range(total):
+        await materialize_once(session, start + timedelta(days=offset))
+        await set_progress(session, job, (offset + 1) * 100 // total)
+    return {"days": total}
+
+
+@register_task("statements.snapshot", admin_only=True, payload=SnapshotPayload)
+async def snapshot_statements(session: AsyncSession, job: Job) -> dict[str, Any]:
+    """Fige les relevés du mois `{"month": "AAAA-MM-JJ"}` (mois précédent par défaut)."""
+    month = SnapshotPayload.model_validate(job.payload).month
+    target = month or (date.today().replace(day=1) - timedelta(days=1))
+    return {"snapshots": await snapshot_month(session, target)}
+
+
+@register_task("operations.archive", admin_only=True, payload=ArchivePayload)
+async def archive_old_operations(session: AsyncSession, job: Job) -> dict[str, Any]:
+    """Archive les opérations antérieures au mois de `{"before": "AAAA-MM-JJ"}`."""
+    before = ArchivePayload.model_validate(job.payload).before
+    return {"archived": await archive_operations(session, before)}
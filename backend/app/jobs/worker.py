@@ -0,0 +1,115 @@
+"""Processus worker dédié aux tâches de fond.
+
+Ce module permet d’exécuter la matérialisation des récurrences, la clôture
+mensuelle des relevés et le pool de workers de la file `jobs` en dehors des
+workers uvicorn de l’API, dans un processus séparé disposant de son propre
+pool de connexions :
+
+    python -m app.jobs.worker                      # boucle permanente
+    python -m app.jobs.worker --once               # une passe pour aujourd’hui
+    python -m app.jobs.worker --once --from 2026-01-01 --to 2026-01-31
+
+Lorsque le worker est utilisé, la tâche intégrée à l’API peut être désactivée
+avec la variable d’environnement `RUN_JOBS_IN_API=false`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import signal
+from datetime import date
+
+from ..core.config import settings
+from ..database import async_session, engine
+from . import tasks  # noqa: F401  (enregistre les tâches disponibles)
+from .lifecycle import request_stop, shutdown, spawn, wait_for_stop
+from .queue import run_worker_pool
+from .recurring import materialize_range, recurring_materializer_loop
+from .statements import statements_loop
+
+
+def _parse_date(value: str) -> date:
+    try:
+        return date.fromisoformat(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"Date invalide : {value!r} (format AAAA-MM-JJ)") from exc
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.jobs.worker",
+        description="Exécute les tâches de fond de ChatBuild hors du processus de l’API.",
+    )
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Effectue une seule passe de matérialisation puis s’arrête.",
+    )
+    parser.add_argument(
+        "--from",
+        dest="start",
+        type=_parse_date,
+        default=None,
+        help="Premier jour à matérialiser (avec --once). Par défaut : aujourd’hui.",
+    )
+    parser.add_argument(
+        "--to",
+        dest="end",
+        type=_parse_date,
+        default=None,
+        help="Dernier jour à matérialiser (avec --once). Par défaut : --from.",
+    )
+    return parser
+
+
+async def run_once(start: date, end: date) -> int:
+    """Matérialise les récurrences sur l’intervalle `[start, end]`."""
+    async with async_session() as session:
+        return await materialize_range(session, start, end)
+
+
+async def run_forever() -> None:
+    """Lance les boucles de tâches périodiques jusqu’à SIGTERM/SIGINT.
+
+    Au signal, les boucles sortent de leur attente et les workers terminent la
+    tâche en cours ; passé `WEB_GRACEFUL_TIMEOUT_SECONDS`, elles sont annulées.
+    """
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, request_stop)
+    spawn(recurring_materializer_loop())
+    spawn(statements_loop())
+    spawn(run_worker_pool())
+    await wait_for_stop()
+    await shutdown(settings.web_graceful_timeout_seconds)
+
+
+async def _main(args: argparse.Namespace) -> None:
+    try:
+        if args.once:
+            start = args.start or date.today()
+            end = args.end or start
+            days = await run_once(start, end)
+            print(f"[WORKER] {days} jour(s) matérialisé(s) du {start} au {end}", flush=True)
+        else:
+            await run_forever()
+    finally:
+        await engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.once and (args.start or args.end):
+        parser.error("--from/--to ne sont utilisables qu’avec --once")
+    if args.start and args.end and args.end < args.start:
+        parser.error("--to doit être postérieur ou égal à --from")
+    try:
+        asyncio.run(_main(args))
+    except KeyboardInterrupt:  # pragma: no cover
+        pass
+
+
+if __name__ == "__main__":
+    main()
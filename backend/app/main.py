@@ -2,24 +2,40 @@
 
 from __future__ import annotations
 
+import os
 import secrets
 from pathlib import Path
 
-from fastapi import Depends, FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .api.api import api_router
-from .database import get_session
+from .api.deps import require_admin
+from .database import get_session, pool_stats
 from .models.user import User
 from .models.config import GlobalConfig
 from .models.category import Category
 from .models.payment_method import PaymentMethod
+from .core.compression import CompressionMiddleware
 from .core.config import settings
+from .core.query_budget import QueryBudgetMiddleware
+from .core.reference import reference
+from .core.leader import release_leadership, startup_lock
+from .core.ratelimit import RateLimitMiddleware
+from .core.static import StaticFrontend
 from .core.security import get_password_hash
-from .jobs import start_recurring_materializer
+from .jobs import (
+    flush_audit_log,
+    start_audit_flusher,
+    start_job_workers,
+    start_leader_election,
+    start_recurring_materializer,
+    start_statements_loop,
+)
+from .jobs.lifecycle import shutdown as shutdown_background
 
 # Définitions des valeurs par défaut
 DEFAULT_CATEGORIES = [
@@ -49,6 +65,19 @@ DEFAULT_PAYMENT_METHODS = [
 
 app = FastAPI(title="ChatBuild Budget API")
 
+# Budgets de requêtes SQL par route (développement et tests uniquement)
+if settings.query_budget_mode != "off":
+    app.add_middleware(QueryBudgetMiddleware)
+
+# Compression des réponses volumineuses de l’API
+if settings.compression_enabled:
+    app.add_middleware(CompressionMiddleware)
+
+# Limitation de débit par utilisateur (ou IP) et par route. Ajoutée avant CORS
+# pour que les réponses 429 portent aussi les en-têtes CORS.
+if settings.rate_limit_enabled:
+    app.add_middleware(RateLimitMiddleware)
+
 # CORS (configurable si besoin)
 app.add_middleware(
     CORSMiddleware,
@@ -60,27 +89,72 @@ app.add_middleware(
 
 app.include_router(api_router, prefix="/api")
 
-# Monter les fichiers statiques du frontend si disponibles
-static_path = Path(__file__).resolve().parents[1] / "static"
-if static_path.exists():
-    app.mount("/", StaticFiles(directory=str(static_path), html=True), name="static")
+
+@app.exception_handler(IntegrityError)
+async def integrity_error_handler(request: Request, exc: IntegrityError) -> JSONResponse:
+    """Contrainte violée à l’écriture : 400 pour une clé étrangère, 409 sinon.
+
+    Les routes valident les références avant d’écrire ; ce filet couvre les
+    lignes supprimées ou modifiées entre la validation et l’écriture. La
+    transaction a déjà été annulée par `get_session`.
+    """
+    if "foreign key" in str(exc.orig).lower():
+        return JSONResponse(status_code=400, content={"detail": "Referenced row does not exist"})
+    return JSONResponse(status_code=409, content={"detail": "Conflicts with existing data"})
 
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialise l’administrateur, la configuration globale et les valeurs par défaut."""
+    """Initialise l’administrateur, la configuration globale et les valeurs par défaut.
+
+    Avec plusieurs workers, l’initialisation est exécutée sous un verrou, un
+    worker après l’autre, et seul le worker leader lance les boucles périodiques ;
+    les autres restent candidats pour le remplacer.
+    """
+    async with startup_lock():
+        await _seed_defaults()
+
+    # Journal d’audit : chaque worker vide son propre tampon
+    start_audit_flusher()
+
+    # Démarrer les tâches de fond, sauf si un worker dédié
+    # (`python -m app.jobs.worker`) s’en charge. Le pool de la file `jobs` tourne
+    # dans chaque worker (réclamation par bail) ; les boucles périodiques
+    # uniquement dans le leader.
+    if settings.run_jobs_in_api:
+        start_leader_election(_start_periodic_jobs)
+        start_job_workers()
+
+
+def _start_periodic_jobs() -> None:
+    print(f"[INIT] Worker {os.getpid()} elected leader for periodic jobs", flush=True)
+    start_recurring_materializer()
+    start_statements_loop()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Laisse les tâches de fond terminer leur travail en cours, puis les arrête."""
+    await shutdown_background(settings.web_graceful_timeout_seconds)
+    try:
+        # Événements d’audit déposés par les dernières requêtes
+        await flush_audit_log()
+    finally:
+        release_leadership()
+
+
+async def _seed_defaults() -> None:
+    from sqlalchemy import select
+
     async for db in get_session():
         # Créer ou récupérer la configuration globale
-        result = await db.execute(GlobalConfig.__table__.select())
-        config = result.scalar_one_or_none()
+        config = (await db.execute(select(GlobalConfig))).scalars().first()
         if not config:
             config = GlobalConfig(currency="EUR", timezone="Europe/Paris", initialized=False)
             db.add(config)
             await db.commit()
         # Créer l’utilisateur administrateur s’il n’existe pas
-        res_admin = await db.execute(
-            User.__table__.select().where(User.username == settings.admin_username)
-        )
+        res_admin = await db.execute(select(User.id).where(User.username == settings.admin_username))
         admin = res_admin.scalar_one_or_none()
         if not admin:
             # Générer un mot de passe aléatoire si non fourni
@@ -96,26 +170,30 @@ async def startup_event():
             )
             db.add(admin)
             await db.commit()
-        # Pré-charger les catégories par défaut
-        for name in DEFAULT_CATEGORIES:
-            res = await db.execute(Category.__table__.select().where(Category.name == name))
-            if not res.scalar_one_or_none():
-                db.add(Category(name=name))
-        # Pré-charger les moyens de paiement par défaut
-        for name in DEFAULT_PAYMENT_METHODS:
-            res = await db.execute(
-                PaymentMethod.__table__.select().where(PaymentMethod.name == name)
-            )
-            if not res.scalar_one_or_none():
-                db.add(PaymentMethod(name=name))
+        # Pré-charger les catégories et moyens de paiement par défaut (une
+        # lecture des noms existants par table, pas une par nom)
+        for model, names in ((Category, DEFAULT_CATEGORIES), (PaymentMethod, DEFAULT_PAYMENT_METHODS)):
+            existing = set((await db.execute(select(model.name).where(model.name.in_(names)))).scalars())
+            db.add_all(model(name=name) for name in names if name not in existing)
         await db.commit()
+        reference.bump()
         break  # on ne veut qu’une seule session
 
-    # Démarrer la tâche de matérialisation des récurrences en arrière‑plan
-    start_recurring_materializer()
-
 
 @app.get("/ping")
 async def ping() -> dict[str, str]:
     """Endpoint de santé simple."""
-    return {"status": "ok"}
\ No newline at end of file
+    return {"status": "ok"}
+
+
+@app.get("/metrics/pool")
+async def pool_metrics(admin: User = Depends(require_admin)) -> dict[str, int]:
+    """Compteurs du pool de connexions (emprunts, connexions ouvertes, pic)."""
+    return pool_stats.as_dict()
+
+
+# Monter les fichiers statiques du frontend si disponibles (en dernier, pour ne
+# pas masquer les routes déclarées ci-dessus)
+static_path = Path(__file__).resolve().parents[1] / "static"
+if static_path.exists():
+    app.mount("/", StaticFrontend(static_path), name="static")
@@ -12,4 +12,9 @@ from .account import BankAccount  # noqa: F401
 from .share import AccountShare  # noqa: F401
 from .operation import Operation  # noqa: F401
 from .recurring import RecurringItem  # noqa: F401
-from .enums import AccountType, PermissionLevel, OperationType, RecurringFrequency  # noqa: F401
\ No newline at end of file
+from .job import Job  # noqa: F401
+from .fx_rate import FxRate  # noqa: F401
+from .budget import Budget, BudgetCounter, BudgetEvent  # noqa: F401
+from .audit import AuditEvent  # noqa: F401
+from .snapshot import AccountSnapshot, ArchivedOperation, CategorySnapshot  # noqa: F401
+from .enums import AccountType, PermissionLevel, OperationType, RecurringFrequency, JobStatus, BudgetPeriod, AuditEntity, AuditAction  # noqa: F401
\ No newline at end of file
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from datetime import datetime
+from decimal import Decimal
 
-from sqlalchemy import Column, DateTime, Enum as SAEnum, ForeignKey, Integer, Numeric, String
+from sqlalchemy import Column, DateTime, Enum as SAEnum, ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
 
+from ..core.money import Money
 from .base import Base
 from .enums import AccountType
 
@@ -18,7 +20,11 @@ class BankAccount(Base):
     name: str = Column(String(100), nullable=False)
     bank: str | None = Column(String(100), nullable=True)
     account_number: str | None = Column(String(100), nullable=True)
-    initial_balance: float = Column(Numeric(12, 2), nullable=False, default=0)
+    initial_balance: Decimal = Column(Money(), nullable=False, default=0)
+    # Devise ISO 4217 du compte ; NULL = devise de l’instance (`GlobalConfig.currency`)
+    currency: str | None = Column(String(3), nullable=True)
+    # Solde net des opérations archivées (voir `jobs.statements.archive_operations`)
+    archived_balance: Decimal = Column(Money(), nullable=False, default=0, server_default="0")
     owner_id: int = Column(Integer, ForeignKey("users.id"), nullable=False)
     type: AccountType = Column(SAEnum(AccountType), nullable=False)
     created_at: datetime = Column(DateTime, default=datetime.utcnow)
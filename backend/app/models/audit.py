@@ -0,0 +1,39 @@
+"""Modèle ORM du journal d’audit des modifications financières."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, Enum as SAEnum, Index, Integer
+
+from .base import Base
+from .enums import AuditAction, AuditEntity
+
+
+class AuditEvent(Base):
+    """Création, modification ou suppression d’une opération, d’un item
+    récurrent ou d’un partage, par un utilisateur, sur un compte.
+
+    Les lignes sont écrites par lots par `core.audit` : sans clé étrangère,
+    pour qu’un lot ne soit jamais refusé et que le journal survive aux lignes
+    qu’il décrit.
+    """
+
+    __tablename__ = "audit_events"
+
+    id: int | None = Column(Integer, primary_key=True)
+    account_id: int = Column(Integer, nullable=False)
+    user_id: int = Column(Integer, nullable=False)
+    entity: AuditEntity = Column(SAEnum(AuditEntity), nullable=False)
+    # Identifiant de l’opération ou de l’item ; utilisateur bénéficiaire pour un partage
+    entity_id: int = Column(Integer, nullable=False)
+    action: AuditAction = Column(SAEnum(AuditAction), nullable=False)
+    # Valeurs créées ou modifiées (montants et dates en texte)
+    changes: dict | None = Column(JSON, nullable=True)
+    created_at: datetime = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    # Pagination par clé du journal d’un compte (`id` décroissant)
+    __table_args__ = (Index("ix_audit_events_account_id", "account_id", "id"),)
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<AuditEvent id={self.id} {self.action} {self.entity} {self.entity_id}>"
@@ -0,0 +1,69 @@
+"""Modèles ORM des budgets par catégorie et de leurs compteurs de consommation."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import Column, Date, DateTime, Enum as SAEnum, ForeignKey, Index, Integer, UniqueConstraint
+
+from ..core.money import Money
+from .base import Base
+from .enums import BudgetPeriod
+
+
+class Budget(Base):
+    """Plafond de dépenses d’une catégorie sur une période.
+
+    Le budget porte sur un compte (`account_id`) ou, si celui-ci est vide, sur
+    tous les comptes dont l’utilisateur est propriétaire.
+    """
+
+    __tablename__ = "budgets"
+
+    id: int | None = Column(Integer, primary_key=True)
+    user_id: int = Column(Integer, ForeignKey("users.id"), nullable=False)
+    account_id: int | None = Column(Integer, ForeignKey("bank_accounts.id"), nullable=True)
+    category_id: int = Column(Integer, ForeignKey("categories.id"), nullable=False)
+    period: BudgetPeriod = Column(SAEnum(BudgetPeriod), nullable=False, default=BudgetPeriod.MONTHLY)
+    limit_amount: Decimal = Column(Money(), nullable=False)
+    # Seuil d’alerte en pourcentage du plafond (un événement est aussi émis à 100 %)
+    alert_percent: int = Column(Integer, nullable=False, default=80)
+    # Début de la première période comptée (compteurs tenus à partir de cette date)
+    since: date = Column(Date, nullable=False)
+    created_at: datetime = Column(DateTime, default=datetime.utcnow)
+
+    # Recherche des budgets touchés par une écriture d’opération
+    __table_args__ = (Index("ix_budgets_category_account", "category_id", "account_id"),)
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<Budget id={self.id} category={self.category_id} period={self.period}>"
+
+
+class BudgetCounter(Base):
+    """Dépenses cumulées d’un budget sur une période, tenues à jour à l’écriture."""
+
+    __tablename__ = "budget_counters"
+
+    budget_id: int = Column(Integer, ForeignKey("budgets.id"), primary_key=True)
+    # Premier jour de la période
+    period_start: date = Column(Date, primary_key=True)
+    spent: Decimal = Column(Money(), nullable=False, default=0)
+
+
+class BudgetEvent(Base):
+    """Franchissement d’un seuil (alerte ou plafond) pendant une période."""
+
+    __tablename__ = "budget_events"
+
+    id: int | None = Column(Integer, primary_key=True)
+    budget_id: int = Column(Integer, ForeignKey("budgets.id"), nullable=False)
+    period_start: date = Column(Date, nullable=False)
+    # Pourcentage du plafond franchi (`alert_percent` ou 100)
+    threshold: int = Column(Integer, nullable=False)
+    spent: Decimal = Column(Money(), nullable=False)
+    created_at: datetime = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("budget_id", "period_start", "threshold", name="uq_budget_events_period_threshold"),
+    )
@@ -35,4 +35,37 @@ class RecurringFrequency(str, Enum):
     EVERY_2_MONTHS = "EVERY_2_MONTHS"
     EVERY_3_MONTHS = "EVERY_3_MONTHS"
     EVERY_6_MONTHS = "EVERY_6_MONTHS"
-    YEARLY = "YEARLY"
\ No newline at end of file
+    YEARLY = "YEARLY"
+
+
+class BudgetPeriod(str, Enum):
+    """Période de remise à zéro d’un budget."""
+
+    WEEKLY = "WEEKLY"
+    MONTHLY = "MONTHLY"
+    YEARLY = "YEARLY"
+
+
+class JobStatus(str, Enum):
+    """État d’une tâche de la file d’attente."""
+
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+
+class AuditEntity(str, Enum):
+    """Nature de l’objet concerné par un événement d’audit."""
+
+    OPERATION = "OPERATION"
+    RECURRING = "RECURRING"
+    SHARE = "SHARE"
+
+
+class AuditAction(str, Enum):
+    """Modification enregistrée par un événement d’audit."""
+
+    CREATE = "CREATE"
+    UPDATE = "UPDATE"
+    DELETE = "DELETE"
@@ -0,0 +1,28 @@
+"""Modèle ORM pour les taux de change locaux."""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Column, Date, Integer, Numeric, String, UniqueConstraint
+
+from .base import Base
+
+
+class FxRate(Base):
+    """Cours d’une devise : 1 unité de `currency` vaut `rate` unités de la devise de l’instance."""
+
+    __tablename__ = "fx_rates"
+
+    id: int | None = Column(Integer, primary_key=True)
+    currency: str = Column(String(3), nullable=False)
+    date: date = Column(Date, nullable=False)
+    rate: Decimal = Column(Numeric(18, 8), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("currency", "date", name="uq_fx_currency_date"),
+    )
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<FxRate {self.currency} {self.date} {self.rate}>"
@@ -0,0 +1,39 @@
+"""Modèle ORM pour la file d’attente des tâches de fond."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, Enum as SAEnum, ForeignKey, Index, Integer, String, Text
+
+from .base import Base
+from .enums import JobStatus
+
+
+class Job(Base):
+    __tablename__ = "jobs"
+
+    id: int | None = Column(Integer, primary_key=True)
+    kind: str = Column(String(100), nullable=False)
+    payload: dict = Column(JSON, nullable=False, default=dict)
+    status: JobStatus = Column(SAEnum(JobStatus), nullable=False, default=JobStatus.PENDING)
+    attempts: int = Column(Integer, nullable=False, default=0)
+    max_attempts: int = Column(Integer, nullable=False, default=3)
+    # Date à partir de laquelle la tâche peut être prise (utilisée pour le backoff)
+    run_after: datetime = Column(DateTime, nullable=False, default=datetime.utcnow)
+    # Bail du worker courant : passé ce délai, la tâche peut être reprise
+    locked_by: str | None = Column(String(100), nullable=True)
+    lease_expires_at: datetime | None = Column(DateTime, nullable=True)
+    progress: int = Column(Integer, nullable=False, default=0)
+    result: dict | None = Column(JSON, nullable=True)
+    error: str | None = Column(Text, nullable=True)
+    owner_id: int | None = Column(Integer, ForeignKey("users.id"), nullable=True)
+    created_at: datetime = Column(DateTime, default=datetime.utcnow)
+    updated_at: datetime = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_jobs_status_run_after", "status", "run_after"),
+    )
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<Job id={self.id} kind={self.kind} status={self.status}>"
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 from datetime import date, datetime
+from decimal import Decimal
 
-from sqlalchemy import Column, Date, DateTime, Enum as SAEnum, ForeignKey, Integer, Numeric, String
+from sqlalchemy import Column, Date, DateTime, Enum as SAEnum, ForeignKey, Index, Integer, String, event
 from sqlalchemy.orm import relationship
 
+from ..core.duplicates import operation_fingerprint
+from ..core.money import Money
+from ..core.search import create_fts
 from .base import Base
 from .enums import OperationType
 
@@ -17,17 +21,35 @@ class Operation(Base):
     id: int | None = Column(Integer, primary_key=True)
     type: OperationType = Column(SAEnum(OperationType), nullable=False)
     label: str = Column(String(255), nullable=False)
-    amount: float = Column(Numeric(12, 2), nullable=False)
+    amount: Decimal = Column(Money(), nullable=False)
     date: date = Column(Date, nullable=False)
     account_id: int = Column(Integer, ForeignKey("bank_accounts.id"), nullable=False)
     category_id: int = Column(Integer, ForeignKey("categories.id"), nullable=False)
     payment_method_id: int | None = Column(Integer, ForeignKey("payment_methods.id"), nullable=True)
     comment: str | None = Column(String(255), nullable=True)
     created_at: datetime = Column(DateTime, default=datetime.utcnow)
+    # Empreinte (compte, type, montant, libellé normalisé) pour la détection de doublons
+    fingerprint: str | None = Column(String(32), nullable=True)
+
+    __table_args__ = (
+        Index("ix_operations_fingerprint_date", "fingerprint", "date"),
+    )
 
     account = relationship("BankAccount", back_populates="operations")
     category = relationship("Category")
     payment_method = relationship("PaymentMethod")
 
     def __repr__(self) -> str:  # pragma: no cover
-        return f"<Operation id={self.id} label={self.label} amount={self.amount}>"
\ No newline at end of file
+        return f"<Operation id={self.id} label={self.label} amount={self.amount}>"
+
+
+@event.listens_for(Operation, "before_insert")
+@event.listens_for(Operation, "before_update")
+def _set_fingerprint(mapper, connection, target: Operation) -> None:
+    target.fingerprint = operation_fingerprint(
+        target.account_id, target.type, target.amount, target.label
+    )
+
+
+# Index plein texte (FTS5 / tsvector) créé avec la table
+event.listen(Operation.__table__, "after_create", create_fts)
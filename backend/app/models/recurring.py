@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from datetime import date, datetime
+from decimal import Decimal
 
-from sqlalchemy import Column, Date, DateTime, Enum as SAEnum, ForeignKey, Integer, Numeric, String, Boolean
+from sqlalchemy import Column, Date, DateTime, Enum as SAEnum, ForeignKey, Integer, String, Boolean
 from sqlalchemy.orm import relationship
 
+from ..core.money import Money
 from .base import Base
 from .enums import OperationType, RecurringFrequency
 
@@ -17,7 +19,7 @@ class RecurringItem(Base):
     id: int | None = Column(Integer, primary_key=True)
     type: OperationType = Column(SAEnum(OperationType), nullable=False)
     label: str = Column(String(255), nullable=False)
-    amount: float = Column(Numeric(12, 2), nullable=False)
+    amount: Decimal = Column(Money(), nullable=False)
     account_id: int = Column(Integer, ForeignKey("bank_accounts.id"), nullable=False)
     frequency: RecurringFrequency = Column(SAEnum(RecurringFrequency), nullable=False)
     # Pour DAILY, moment est ignoré. Pour WEEKLY: 1=Monday…7=Sunday. Pour MONTHLY et autres: jour du mois 1..31.
@@ -0,0 +1,95 @@
+"""Modèles ORM des relevés mensuels figés et des opérations archivées."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Enum as SAEnum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+)
+
+from ..core.money import Money
+from .base import Base
+from .enums import OperationType
+
+
+class AccountSnapshot(Base):
+    """Totaux et solde de clôture d’un compte pour un mois échu."""
+
+    __tablename__ = "account_snapshots"
+
+    id: int | None = Column(Integer, primary_key=True)
+    account_id: int = Column(Integer, ForeignKey("bank_accounts.id"), nullable=False)
+    # Premier jour du mois concerné
+    month: date = Column(Date, nullable=False)
+    revenue: Decimal = Column(Money(), nullable=False, default=0)
+    expense: Decimal = Column(Money(), nullable=False, default=0)
+    operation_count: int = Column(Integer, nullable=False, default=0)
+    closing_balance: Decimal = Column(Money(), nullable=False)
+    # Une opération du mois (ou d’un mois antérieur) a changé depuis le relevé :
+    # il est recalculé au prochain passage de `close_months`
+    stale: bool = Column(Boolean, nullable=False, default=False)
+    created_at: datetime = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("account_id", "month", name="uq_account_snapshots_account_month"),
+    )
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<AccountSnapshot account={self.account_id} month={self.month}>"
+
+
+class CategorySnapshot(Base):
+    """Totaux d’un compte par catégorie pour un mois échu."""
+
+    __tablename__ = "category_snapshots"
+
+    id: int | None = Column(Integer, primary_key=True)
+    account_id: int = Column(Integer, ForeignKey("bank_accounts.id"), nullable=False)
+    month: date = Column(Date, nullable=False)
+    category_id: int = Column(Integer, ForeignKey("categories.id"), nullable=False)
+    revenue: Decimal = Column(Money(), nullable=False, default=0)
+    expense: Decimal = Column(Money(), nullable=False, default=0)
+    operation_count: int = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "account_id", "month", "category_id", name="uq_category_snapshots_account_month_category"
+        ),
+    )
+
+
+class ArchivedOperation(Base):
+    """Opération déplacée hors de la table `operations` (historique froid).
+
+    Même structure que `Operation`, sans index plein texte ni empreinte : la
+    table n’est lue qu’à la demande (`include_archive=true`).
+    """
+
+    __tablename__ = "operations_archive"
+
+    id: int = Column(Integer, primary_key=True, autoincrement=False)
+    type: OperationType = Column(SAEnum(OperationType), nullable=False)
+    label: str = Column(String(255), nullable=False)
+    amount: Decimal = Column(Money(), nullable=False)
+    date: date = Column(Date, nullable=False)
+    account_id: int = Column(Integer, ForeignKey("bank_accounts.id"), nullable=False)
+    category_id: int = Column(Integer, ForeignKey("categories.id"), nullable=False)
+    payment_method_id: int | None = Column(Integer, ForeignKey("payment_methods.id"), nullable=True)
+    comment: str | None = Column(String(255), nullable=True)
+    created_at: datetime = Column(DateTime)
+    archived_at: datetime = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_operations_archive_account_date", "account_id", "date"),
+    )
@@ -1,27 +1,89 @@
 """Exports des schémas Pydantic."""
 
-from .user import UserCreate, UserRead, UserUpdate
+from .user import UserAdminRead, UserCreate, UserRead, UserUpdate
 from .token import Token
-from .account import AccountCreate, AccountRead, ShareCreate
+from .account import (
+    AccountBalance,
+    AccountCreate,
+    AccountRead,
+    AccountSnapshotRead,
+    AccountsSummary,
+    AccountSummaryLine,
+    CategorySnapshotRead,
+    ShareCreate,
+    ShareRead,
+)
 from .category import CategoryCreate, CategoryRead
 from .payment_method import PaymentMethodCreate, PaymentMethodRead
-from .operation import OperationCreate, OperationRead
+from .operation import (
+    BatchAction,
+    CategorizeRequest,
+    CategorySuggestion,
+    DuplicateGroup,
+    DuplicateMatch,
+    DuplicatePolicy,
+    OperationBatch,
+    OperationBatchChanges,
+    OperationBatchResult,
+    OperationBulkCreate,
+    OperationBulkResult,
+    OperationCreate,
+    OperationExpandedRead,
+    OperationRead,
+    OperationUpdate,
+)
 from .recurring import RecurringCreate, RecurringRead
+from .forecast import AccountForecast, ForecastRead, ForecastScenario, OneOffOperation, RecurringChange
+from .job import JobCreate, JobRead
+from .budget import BudgetCreate, BudgetEventRead, BudgetRead, BudgetStatus
+from .audit import AuditEventRead
 
 __all__ = [
     "UserCreate",
     "UserRead",
     "UserUpdate",
+    "UserAdminRead",
     "Token",
     "AccountCreate",
     "AccountRead",
     "ShareCreate",
+    "ShareRead",
+    "AccountBalance",
+    "AccountsSummary",
+    "AccountSummaryLine",
+    "AccountSnapshotRead",
+    "CategorySnapshotRead",
     "CategoryCreate",
     "CategoryRead",
     "PaymentMethodCreate",
     "PaymentMethodRead",
     "OperationCreate",
     "OperationRead",
+    "OperationExpandedRead",
+    "CategorizeRequest",
+    "CategorySuggestion",
+    "DuplicatePolicy",
+    "OperationBulkCreate",
+    "OperationBulkResult",
+    "DuplicateMatch",
+    "DuplicateGroup",
+    "OperationUpdate",
+    "BatchAction",
+    "OperationBatch",
+    "OperationBatchChanges",
+    "OperationBatchResult",
     "RecurringCreate",
     "RecurringRead",
+    "ForecastScenario",
+    "RecurringChange",
+    "OneOffOperation",
+    "AccountForecast",
+    "ForecastRead",
+    "JobCreate",
+    "JobRead",
+    "BudgetCreate",
+    "BudgetRead",
+    "BudgetStatus",
+    "BudgetEventRead",
+    "AuditEventRead",
 ]
\ No newline at end of file
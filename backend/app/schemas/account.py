@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import date
 from decimal import Decimal
 from enum import Enum
 from typing import Optional
@@ -17,6 +18,7 @@ class AccountBase(BaseModel):
     account_number: Optional[str] = Field(default=None, max_length=100)
     initial_balance: Decimal = Field(default=0)
     type: AccountType = AccountType.PERSONAL
+    currency: Optional[str] = Field(default=None, min_length=3, max_length=3)
 
 
 class AccountCreate(AccountBase):
@@ -33,4 +35,52 @@ class AccountRead(AccountBase):
 
 class ShareCreate(BaseModel):
     user_id: int
-    permission: PermissionLevel
\ No newline at end of file
+    permission: PermissionLevel
+
+
+class ShareRead(ShareCreate):
+    username: str
+
+
+class AccountBalance(BaseModel):
+    account_id: int
+    initial_balance: Decimal
+    total_revenue: Decimal
+    total_expense: Decimal
+    # Solde net des opérations archivées (non comptées dans les totaux ci-dessus)
+    archived_balance: Decimal = Decimal("0.00")
+    balance: Decimal
+
+
+class AccountSummaryLine(BaseModel):
+    account_id: int
+    name: str
+    currency: str
+    balance: Decimal
+    converted_balance: Optional[Decimal] = None
+
+
+class AccountsSummary(BaseModel):
+    currency: str
+    rate_date: date
+    accounts: list[AccountSummaryLine]
+    total: Decimal
+    missing_rates: list[str] = []
+
+
+class CategorySnapshotRead(BaseModel):
+    category_id: int
+    revenue: Decimal
+    expense: Decimal
+    operation_count: int
+
+
+class AccountSnapshotRead(BaseModel):
+    """Relevé figé d’un mois échu."""
+
+    month: date
+    revenue: Decimal
+    expense: Decimal
+    operation_count: int
+    closing_balance: Decimal
+    categories: list[CategorySnapshotRead]
@@ -0,0 +1,22 @@
+"""Schémas Pydantic du journal d’audit."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+from ..models.enums import AuditAction, AuditEntity
+
+
+class AuditEventRead(BaseModel):
+    id: int
+    account_id: int
+    user_id: int
+    username: Optional[str] = None
+    entity: AuditEntity
+    entity_id: int
+    action: AuditAction
+    changes: Optional[dict] = None
+    created_at: datetime
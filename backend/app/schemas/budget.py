@@ -0,0 +1,58 @@
+"""Schémas Pydantic pour les budgets par catégorie."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from ..models.enums import BudgetPeriod
+
+
+class BudgetCreate(BaseModel):
+    category_id: int
+    # Vide : tous les comptes dont l’utilisateur est propriétaire
+    account_id: Optional[int] = None
+    period: BudgetPeriod = BudgetPeriod.MONTHLY
+    limit_amount: Decimal = Field(..., gt=0)
+    alert_percent: int = Field(default=80, ge=1, le=100)
+
+
+class BudgetRead(BudgetCreate):
+    id: int
+    user_id: int
+    since: date
+
+    class Config:
+        from_attributes = True
+
+
+class BudgetStatus(BaseModel):
+    """Consommation d’un budget sur la période en cours."""
+
+    budget_id: int
+    category_id: int
+    account_id: Optional[int] = None
+    period: BudgetPeriod
+    period_start: date
+    period_end: date
+    limit_amount: Decimal
+    spent: Decimal
+    remaining: Decimal
+    percent: int
+    alert: bool
+    exceeded: bool
+
+
+class BudgetEventRead(BaseModel):
+    id: int
+    budget_id: int
+    period_start: date
+    threshold: int
+    spent: Decimal
+    created_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
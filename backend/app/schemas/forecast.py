@@ -0,0 +1,63 @@
+"""Schémas Pydantic pour les prévisions de trésorerie et les simulations."""
+
+from __future__ import annotations
+
+from datetime import date as Date
+from decimal import Decimal
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from ..models.enums import OperationType, RecurringFrequency
+from .recurring import RecurringCreate
+
+
+class RecurringChange(BaseModel):
+    """Modification hypothétique d’un item récurrent existant."""
+
+    id: int
+    amount: Optional[Decimal] = None
+    frequency: Optional[RecurringFrequency] = None
+    moment: Optional[int] = Field(default=None, ge=0, le=31)
+    start_date: Optional[Date] = None
+    end_date: Optional[Date] = None
+    # False : l’item est retiré de la simulation
+    active: Optional[bool] = None
+
+
+class OneOffOperation(BaseModel):
+    """Opération ponctuelle hypothétique."""
+
+    account_id: int
+    type: OperationType
+    amount: Decimal
+    date: Date
+    label: str = Field(default="", max_length=255)
+
+
+class ForecastScenario(BaseModel):
+    """Simulation « et si » : les modifications ne sont jamais enregistrées."""
+
+    months: int = Field(default=6, ge=1, le=12)
+    account_ids: Optional[list[int]] = None
+    add: list[RecurringCreate] = []
+    change: list[RecurringChange] = []
+    one_off: list[OneOffOperation] = []
+
+
+class AccountForecast(BaseModel):
+    account_id: int
+    name: str
+    opening_balance: Decimal
+    min_balance: Decimal
+    min_balance_date: Date
+    first_overdraft: Optional[Date] = None
+    closing_balance: Decimal
+    # Solde de fin de journée, un élément par jour de `start_date` à `end_date`
+    balances: list[Decimal]
+
+
+class ForecastRead(BaseModel):
+    start_date: Date
+    end_date: Date
+    accounts: list[AccountForecast]
@@ -0,0 +1,31 @@
+"""Schémas Pydantic pour la file d’attente des tâches."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field
+
+from ..models.enums import JobStatus
+
+
+class JobCreate(BaseModel):
+    kind: str = Field(..., max_length=100)
+    payload: dict[str, Any] = Field(default_factory=dict)
+
+
+class JobRead(BaseModel):
+    id: int
+    kind: str
+    status: JobStatus
+    attempts: int
+    max_attempts: int
+    progress: int
+    result: Optional[dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
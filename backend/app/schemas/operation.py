@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from datetime import date
+from datetime import date as Date
 from decimal import Decimal
+from enum import Enum
 from typing import Optional
 
 from pydantic import BaseModel, Field
@@ -15,7 +16,7 @@ class OperationBase(BaseModel):
     type: OperationType
     label: str = Field(..., max_length=255)
     amount: Decimal
-    date: date
+    date: Date
     category_id: int
     payment_method_id: Optional[int] = None
     comment: Optional[str] = Field(default=None, max_length=255)
@@ -25,9 +26,94 @@ class OperationCreate(OperationBase):
     account_id: int
 
 
+class OperationUpdate(BaseModel):
+    """Modification partielle : seuls les champs transmis sont modifiés."""
+
+    type: Optional[OperationType] = None
+    label: Optional[str] = Field(default=None, max_length=255)
+    amount: Optional[Decimal] = None
+    date: Optional[Date] = None
+    category_id: Optional[int] = None
+    payment_method_id: Optional[int] = None
+    comment: Optional[str] = Field(default=None, max_length=255)
+
+
 class OperationRead(OperationBase):
     id: int
     account_id: int
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class OperationExpandedRead(OperationRead):
+    """Opération enrichie des noms liés demandés via `?expand=`."""
+
+    category_name: Optional[str] = None
+    payment_method_name: Optional[str] = None
+    account_name: Optional[str] = None
+
+
+class CategorizeRequest(BaseModel):
+    account_id: int
+    labels: list[str] = Field(..., max_length=10000)
+
+
+class CategorySuggestion(BaseModel):
+    label: str
+    category_id: Optional[int] = None
+    payment_method_id: Optional[int] = None
+    confidence: float = 0.0
+
+
+class DuplicatePolicy(str, Enum):
+    """Traitement des doublons probables lors d’une création."""
+
+    FLAG = "flag"
+    SKIP = "skip"
+
+
+class OperationBulkCreate(BaseModel):
+    operations: list[OperationCreate] = Field(..., max_length=5000)
+    on_duplicate: DuplicatePolicy = DuplicatePolicy.SKIP
+
+
+class DuplicateMatch(BaseModel):
+    index: int
+    duplicate_of: list[int]
+    skipped: bool
+
+
+class OperationBulkResult(BaseModel):
+    created: list[OperationRead]
+    duplicates: list[DuplicateMatch]
+
+
+class DuplicateGroup(BaseModel):
+    fingerprint: str
+    operations: list[OperationRead]
+
+
+class BatchAction(str, Enum):
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+class OperationBatchChanges(BaseModel):
+    """Champs modifiables en masse (ils n’entrent pas dans l’empreinte de doublon)."""
+
+    date: Optional[Date] = None
+    category_id: Optional[int] = None
+    payment_method_id: Optional[int] = None
+    comment: Optional[str] = Field(default=None, max_length=255)
+
+
+class OperationBatch(BaseModel):
+    ids: list[int] = Field(..., min_length=1, max_length=5000)
+    action: BatchAction
+    changes: Optional[OperationBatchChanges] = None
+
+
+class OperationBatchResult(BaseModel):
+    action: BatchAction
+    count: int
@@ -25,4 +25,11 @@ class UserRead(UserBase):
     is_admin: bool
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class UserAdminRead(UserRead):
+    """Utilisateur vu par l’administrateur, avec ses compteurs d’utilisation."""
+
+    account_count: int = 0
+    operation_count: int = 0
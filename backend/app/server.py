@@ -0,0 +1,100 @@
+"""Lancement du serveur de production (uvicorn, un ou plusieurs workers).
+
+    python -m app.server                        # paramètres issus de l’environnement
+    python -m app.server --workers 4 --limit-concurrency 200
+
+Le nombre de workers vaut `WEB_CONCURRENCY` (1 par défaut) ; avec plusieurs
+workers, uvicorn lance un processus superviseur qui partage le socket
+d’écoute. Un seul worker, élu par verrou de fichier (`core.leader`) et remplacé
+par un autre s’il meurt, exécute les boucles périodiques ; l’initialisation
+est sérialisée entre workers.
+
+À la réception de SIGTERM, chaque worker cesse d’accepter des connexions,
+termine les requêtes en cours et les tâches de fond pendant au plus
+`WEB_GRACEFUL_TIMEOUT_SECONDS`, puis s’arrête.
+
+Avec plusieurs workers, la limitation de débit en mémoire est propre à chaque
+processus : utiliser `RATE_LIMIT_BACKEND=sqlite:///…` pour des budgets communs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from typing import Any
+
+import uvicorn
+
+from .core.config import settings
+
+
+def _positive(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"Valeur strictement positive attendue : {value!r}")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.server", description="Démarre l’API ChatBuild avec uvicorn."
+    )
+    parser.add_argument("--host", default=settings.web_host)
+    parser.add_argument("--port", type=int, default=settings.web_port)
+    parser.add_argument(
+        "--workers",
+        type=_positive,
+        default=settings.web_concurrency,
+        help="Nombre de processus workers (en général, le nombre de cœurs).",
+    )
+    parser.add_argument(
+        "--limit-concurrency",
+        type=_positive,
+        default=settings.web_limit_concurrency,
+        help="Connexions simultanées maximales par worker avant de répondre 503.",
+    )
+    parser.add_argument(
+        "--keep-alive",
+        type=int,
+        default=settings.web_keep_alive_seconds,
+        help="Durée (s) de conservation d’une connexion HTTP inactive.",
+    )
+    parser.add_argument(
+        "--graceful-timeout",
+        type=int,
+        default=settings.web_graceful_timeout_seconds,
+        help="Délai (s) accordé aux requêtes en cours lors de l’arrêt.",
+    )
+    return parser
+
+
+def server_options(args: argparse.Namespace) -> dict[str, Any]:
+    """Options passées à `uvicorn.run` pour les arguments analysés."""
+    return {
+        "host": args.host,
+        "port": args.port,
+        "workers": args.workers,
+        "limit_concurrency": args.limit_concurrency,
+        "timeout_keep_alive": args.keep_alive,
+        "timeout_graceful_shutdown": args.graceful_timeout,
+        "proxy_headers": True,
+        # Les événements de démarrage et d’arrêt portent l’élection et le drainage
+        "lifespan": "on",
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = build_parser().parse_args(argv)
+    options = server_options(args)
+    # Sans SECRET_KEY, chaque worker générerait sa propre clé et refuserait les
+    # jetons signés par les autres : la clé du superviseur est transmise aux workers.
+    os.environ.setdefault("SECRET_KEY", settings.secret_key)
+    print(
+        f"[SERVER] {args.workers} worker(s) sur {args.host}:{args.port} (pid {os.getpid()})",
+        flush=True,
+    )
+    uvicorn.run("app.main:app", **options)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""Scripts de mesure de performance (hors suite de tests).
+
+Chaque module s’exécute depuis le dossier `backend/` :
+
+    python -m benchmarks.bench_operations_read
+"""
@@ -0,0 +1,73 @@
+"""Jeu de données synthétique partagé par les benchmarks."""
+
+from __future__ import annotations
+
+import random
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from decimal import Decimal
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.database import Base
+from app.models import BankAccount, Category, Operation, PaymentMethod, User
+from app.models.enums import AccountType, OperationType
+
+LABELS = ["CB CARREFOUR", "PRLV EDF", "VIR SALAIRE", "CB SNCF", "LOYER", "CB FNAC", "CB TOTAL"]
+
+
+async def make_engine(n_operations: int, n_accounts: int = 4, seed: int = 1) -> AsyncEngine:
+    """Crée une base SQLite en mémoire peuplée de `n_operations` opérations."""
+    rnd = random.Random(seed)
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(User.__table__), [{"id": 1, "username": "bench", "hashed_password": "x"}])
+        await conn.execute(insert(Category.__table__), [{"id": i, "name": f"Cat {i}", "deleted": False} for i in range(1, 15)])
+        await conn.execute(
+            insert(PaymentMethod.__table__), [{"id": i, "name": f"PM {i}", "deleted": False} for i in range(1, 5)]
+        )
+        await conn.execute(
+            insert(BankAccount.__table__),
+            [
+                {"id": i, "name": f"Compte {i}", "owner_id": 1, "type": AccountType.PERSONAL, "initial_balance": 0}
+                for i in range(1, n_accounts + 1)
+            ],
+        )
+        start = date(2020, 1, 1)
+        batch = []
+        for n in range(n_operations):
+            batch.append(
+                {
+                    "type": OperationType.DEPENSE if n % 5 else OperationType.REVENU,
+                    "label": f"{rnd.choice(LABELS)} {n % 97}",
+                    "amount": Decimal(rnd.randint(100, 20000)) / 100,
+                    "date": start + timedelta(days=n % 2000),
+                    "account_id": 1 + n % n_accounts,
+                    "category_id": 1 + n % 14,
+                    "payment_method_id": 1 + n % 4 if n % 3 else None,
+                    "comment": None,
+                }
+            )
+            if len(batch) == 10000:
+                await conn.execute(insert(Operation.__table__), batch)
+                batch = []
+        if batch:
+            await conn.execute(insert(Operation.__table__), batch)
+    return engine
+
+
+@contextmanager
+def timed(results: dict[str, float], name: str):
+    """Mesure la durée (en ms) du bloc et l’enregistre dans `results[name]`."""
+    start = time.perf_counter()
+    yield
+    results[name] = (time.perf_counter() - start) * 1000
+
+
+def print_table(title: str, results: dict[str, float], unit: str = "ms") -> None:
+    print(f"\n{title}")
+    for name, value in results.items():
+        print(f"  {name:<40} {value:12.1f} {unit}")
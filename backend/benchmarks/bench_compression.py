@@ -0,0 +1,50 @@
+"""Coût CPU et gain de taille de la compression d’une liste d’opérations en JSON.
+
+    python -m benchmarks.bench_compression [taille ...]   # défaut : 10000 100000
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.api.operations import expanded_operations_query
+from app.core.compression import available_encodings, compress
+from app.core.responses import dumps, rows_to_dicts
+
+from ._data import make_engine, print_table, timed
+
+LEVELS = {"gzip": (1, 6, 9), "br": (1, 4, 6, 11), "zstd": (1, 3, 9)}
+
+
+async def bench(n_operations: int) -> None:
+    engine = await make_engine(n_operations)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as db:
+        result = await db.execute(expanded_operations_query([1, 2, 3, 4], set()))
+        body = dumps(rows_to_dicts(result))
+    await engine.dispose()
+
+    results: dict[str, float] = {}
+    ratios: dict[str, float] = {}
+    for encoding in available_encodings():
+        for level in LEVELS[encoding]:
+            name = f"{encoding} niveau {level}"
+            with timed(results, name):
+                compressed = compress(body, encoding, level)
+            ratios[name] = 100 * (1 - len(compressed) / len(body))
+
+    print_table(f"Compression de {n_operations} opérations ({len(body)} o de JSON)", results)
+    print_table("Octets économisés", ratios, "%")
+    print_table("Débit", {name: len(body) / 1e6 / (ms / 1000) for name, ms in results.items()}, "Mo/s")
+
+
+async def main(sizes: list[int]) -> None:
+    for size in sizes:
+        await bench(size)
+
+
+if __name__ == "__main__":
+    asyncio.run(main([int(arg) for arg in sys.argv[1:]] or [10000, 100000]))
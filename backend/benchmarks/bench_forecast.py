@@ -0,0 +1,67 @@
+"""Projection d’un foyer sur 12 mois : calcul initial puis tableaux en cache.
+
+    python -m benchmarks.bench_forecast [comptes] [items_par_compte]   # défaut : 10 40
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+from datetime import date
+from decimal import Decimal
+
+from app.core.forecast import ForecastCache, PlannedItem, add_operations, horizon, project
+from app.core.money import from_cents
+from app.models.enums import OperationType, RecurringFrequency
+
+from ._data import print_table, timed
+
+FREQUENCIES = list(RecurringFrequency)
+
+
+def household(n_accounts: int, n_items: int, seed: int = 5) -> dict[int, tuple[PlannedItem, ...]]:
+    rnd = random.Random(seed)
+    return {
+        account_id: tuple(
+            PlannedItem(
+                n,
+                account_id,
+                OperationType.REVENU if n % 8 == 0 else OperationType.DEPENSE,
+                f"Item {n}",
+                Decimal(rnd.randint(100, 200000)) / 100,
+                rnd.choice(FREQUENCIES),
+                rnd.randint(1, 7),
+                None,
+                None,
+            )
+            for n in range(n_items)
+        )
+        for account_id in range(1, n_accounts + 1)
+    }
+
+
+def run(cache: ForecastCache, items: dict[int, tuple[PlannedItem, ...]], first: date, days: int) -> list:
+    lines = []
+    for account_id, account_items in items.items():
+        deltas = cache.deltas(account_id, first, days, account_items)
+        add_operations(deltas, first, [(first, OperationType.DEPENSE, Decimal("12.00"), "Ponctuel")], account_items)
+        projection = project(150000, deltas, first)
+        lines.append((projection.lowest(), projection.first_overdraft(), [from_cents(b) for b in projection.balances]))
+    return lines
+
+
+def main(n_accounts: int, n_items: int) -> None:
+    items = household(n_accounts, n_items)
+    first, days = horizon(date(2026, 1, 15), 12)
+    cache = ForecastCache()
+    results: dict[str, float] = {}
+    with timed(results, "premier calcul"):
+        run(cache, items, first, days)
+    with timed(results, "tableaux en cache"):
+        run(cache, items, first, days)
+    print_table(f"Prévision de {n_accounts} comptes × {n_items} items sur {days} jours", results)
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*(args + [10, 40][len(args):]))
@@ -0,0 +1,37 @@
+"""Sommes monétaires : Decimal, flottants et tableau de centimes entiers.
+
+    python -m benchmarks.bench_money [nombre_de_montants]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+from array import array
+from decimal import Decimal
+
+from app.core.money import from_cents, total
+
+from ._data import print_table, timed
+
+
+def main(n_amounts: int) -> None:
+    rnd = random.Random(3)
+    raw = [rnd.randint(-500000, 500000) for _ in range(n_amounts)]
+    decimals = [Decimal(c) / 100 for c in raw]
+    floats = [c / 100 for c in raw]
+    cents = array("q", raw)
+    results: dict[str, float] = {}
+    with timed(results, "sum(Decimal)"):
+        exact = sum(decimals)
+    with timed(results, "sum(float)"):
+        approx = sum(floats)
+    with timed(results, "total(array('q'))"):
+        fast = total(cents)
+    print_table(f"Somme de {n_amounts} montants", results)
+    print(f"  exact : {exact} | centimes : {fast} | flottant : {approx!r}")
+    assert fast == exact == from_cents(sum(raw))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
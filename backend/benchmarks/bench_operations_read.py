@@ -0,0 +1,66 @@
+"""Compare la lecture des opérations avec noms liés : ORM vs requête Core jointe.
+
+    python -m benchmarks.bench_operations_read [nombre_d_operations]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import selectinload
+
+from app.api.operations import EXPANSIONS, expanded_operations_query
+from app.models import Category, Operation, PaymentMethod
+from app.schemas.operation import OperationExpandedRead, OperationRead
+
+from ._data import make_engine, print_table, timed
+
+
+async def main(n_operations: int) -> None:
+    engine = await make_engine(n_operations)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    account_ids = [1, 2, 3, 4]
+    results: dict[str, float] = {}
+
+    async with session_factory() as db:
+        with timed(results, "ORM + listes séparées (client)"):
+            ops = (await db.execute(select(Operation).where(Operation.account_id.in_(account_ids)))).scalars().all()
+            payload = [OperationRead.model_validate(op).model_dump() for op in ops]
+            cats = {c.id: c.name for c in (await db.execute(select(Category))).scalars()}
+            pms = {p.id: p.name for p in (await db.execute(select(PaymentMethod))).scalars()}
+            for row in payload:
+                row["category_name"] = cats.get(row["category_id"])
+                row["payment_method_name"] = pms.get(row["payment_method_id"])
+
+    async with session_factory() as db:
+        with timed(results, "ORM + selectinload"):
+            ops = (
+                await db.execute(
+                    select(Operation)
+                    .where(Operation.account_id.in_(account_ids))
+                    .options(selectinload(Operation.category), selectinload(Operation.payment_method))
+                )
+            ).scalars().all()
+            payload = [
+                {
+                    **OperationRead.model_validate(op).model_dump(),
+                    "category_name": op.category.name if op.category else None,
+                    "payment_method_name": op.payment_method.name if op.payment_method else None,
+                }
+                for op in ops
+            ]
+
+    async with session_factory() as db:
+        with timed(results, "Core jointe (?expand=…)"):
+            rows = (await db.execute(expanded_operations_query(account_ids, set(EXPANSIONS)))).mappings()
+            payload = [OperationExpandedRead.model_validate(dict(row)).model_dump() for row in rows]
+
+    await engine.dispose()
+    print_table(f"Lecture de {n_operations} opérations avec noms liés", results)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000))
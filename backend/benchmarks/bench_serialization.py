@@ -0,0 +1,58 @@
+"""Débit de sérialisation des listes d’opérations : ORM + Pydantic vs lignes + orjson.
+
+    python -m benchmarks.bench_serialization [taille ...]   # défaut : 10000 100000
+    python -m benchmarks.bench_serialization 10000 100000 1000000
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.api.operations import expanded_operations_query
+from app.core.responses import dumps, rows_to_dicts
+from app.models import Operation
+from app.schemas.operation import OperationRead
+
+from ._data import make_engine, print_table, timed
+
+_adapter = TypeAdapter(list[OperationRead])
+
+
+async def bench(n_operations: int) -> None:
+    engine = await make_engine(n_operations)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    account_ids = [1, 2, 3, 4]
+    results: dict[str, float] = {}
+    sizes: dict[str, int] = {}
+
+    async with session_factory() as db:
+        with timed(results, "ORM + from_attributes + json"):
+            ops = (await db.execute(select(Operation).where(Operation.account_id.in_(account_ids)))).scalars().all()
+            body = json.dumps(_adapter.dump_python(_adapter.validate_python(ops), mode="json")).encode()
+        sizes["orm"] = len(body)
+
+    async with session_factory() as db:
+        with timed(results, "Colonnes + orjson"):
+            result = await db.execute(expanded_operations_query(account_ids, set()))
+            body = dumps(rows_to_dicts(result))
+        sizes["rows"] = len(body)
+
+    await engine.dispose()
+    print_table(f"Sérialisation de {n_operations} opérations", results)
+    print_table("Débit", {name: n_operations / (ms / 1000) for name, ms in results.items()}, "lignes/s")
+    print(f"  taille JSON : ORM {sizes['orm']} o, lignes {sizes['rows']} o")
+
+
+async def main(sizes: list[int]) -> None:
+    for size in sizes:
+        await bench(size)
+
+
+if __name__ == "__main__":
+    asyncio.run(main([int(arg) for arg in sys.argv[1:]] or [10000, 100000]))
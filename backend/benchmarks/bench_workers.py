@@ -0,0 +1,123 @@
+"""Débit du serveur de production selon le nombre de workers.
+
+Lance `python -m app.server --workers N` sur une base SQLite temporaire, puis
+mesure le nombre de requêtes par seconde sur `/ping` et sur une route
+authentifiée lisant la base, avec plusieurs processus clients concurrents.
+
+    python -m benchmarks.bench_workers [workers ...]   # défaut : 1 2 4 … jusqu’au nombre de cœurs
+    BENCH_SECONDS=10 BENCH_CLIENTS=4 python -m benchmarks.bench_workers 1 8
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import httpx
+from sqlalchemy import create_engine
+
+from app import models  # noqa: F401  (enregistre les tables)
+from app.database import Base
+
+from ._data import print_table
+
+PORT = 8799
+BASE_URL = f"http://127.0.0.1:{PORT}"
+BACKEND = Path(__file__).resolve().parents[1]
+SECONDS = float(os.environ.get("BENCH_SECONDS", "5"))
+CLIENTS = int(os.environ.get("BENCH_CLIENTS", str(max(2, (os.cpu_count() or 2) // 2))))
+CONNECTIONS = 32  # connexions simultanées par processus client
+PASSWORD = "benchpass"
+
+
+def _start_server(workers: int, directory: str) -> subprocess.Popen:
+    engine = create_engine(f"sqlite:///{directory}/db.sqlite3")
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite+aiosqlite:///{directory}/db.sqlite3",
+        "LEADER_LOCK_PATH": f"{directory}/leader.lock",
+        "ADMIN_PASSWORD": PASSWORD,
+        "RATE_LIMIT_ENABLED": "false",
+        "RUN_JOBS_IN_API": "false",
+    }
+    process = subprocess.Popen(
+        [sys.executable, "-m", "app.server", "--host", "127.0.0.1", "--port", str(PORT), "--workers", str(workers)],
+        cwd=BACKEND,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{BASE_URL}/ping").status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("Le serveur n’a pas démarré")
+
+
+async def _load(path: str, cookies: dict[str, str]) -> int:
+    done = 0
+    deadline = time.monotonic() + SECONDS
+    async with httpx.AsyncClient(base_url=BASE_URL, cookies=cookies, timeout=30) as client:
+
+        async def connection() -> None:
+            nonlocal done
+            while time.monotonic() < deadline:
+                response = await client.get(path)
+                if response.status_code != 200:
+                    raise RuntimeError(f"{path} : HTTP {response.status_code} {response.text[:200]}")
+                done += 1
+
+        await asyncio.gather(*(connection() for _ in range(CONNECTIONS)))
+    return done
+
+
+def _client(path: str, cookies: dict[str, str]) -> int:
+    return asyncio.run(_load(path, cookies))
+
+
+def _throughput(path: str, cookies: dict[str, str]) -> float:
+    with ProcessPoolExecutor(CLIENTS) as pool:
+        counts = list(pool.map(_client, [path] * CLIENTS, [cookies] * CLIENTS))
+    return sum(counts) / SECONDS
+
+
+def bench(workers: int) -> dict[str, float]:
+    with tempfile.TemporaryDirectory() as directory:
+        process = _start_server(workers, directory)
+        try:
+            login = httpx.post(f"{BASE_URL}/api/login", json={"username": "admin", "password": PASSWORD})
+            login.raise_for_status()
+            cookies = dict(login.cookies)
+            return {
+                "/ping": _throughput("/ping", {}),
+                "/api/accounts/accounts": _throughput("/api/accounts/accounts", cookies),
+            }
+        finally:
+            process.terminate()
+            process.wait(timeout=60)
+
+
+def main(counts: list[int]) -> None:
+    print(f"{CLIENTS} processus clients × {CONNECTIONS} connexions, {SECONDS:.0f} s par mesure")
+    results = {workers: bench(workers) for workers in counts}
+    for path in next(iter(results.values())):
+        print_table(f"Débit {path}", {f"{w} worker(s)": r[path] for w, r in results.items()}, "req/s")
+
+
+if __name__ == "__main__":
+    cores = os.cpu_count() or 1
+    default = [n for n in (1, 2, 4, 8, 16) if n <= cores] or [1]
+    main([int(arg) for arg in sys.argv[1:]] or default)
@@ -4,5 +4,11 @@ set -euo pipefail
 # Lancer les migrations Alembic (crée la base et les tables si nécessaire)
 alembic upgrade head
 
-# Démarrer l’application FastAPI
-exec uvicorn app.main:app --host 0.0.0.0 --port 8000
\ No newline at end of file
+# Une commande explicite (ex. `python -m app.jobs.worker`) remplace le serveur
+if [ "$#" -gt 0 ]; then
+  exec "$@"
+fi
+
+# Démarrer l’application FastAPI (WEB_CONCURRENCY workers, voir app/server.py).
+# `exec` transmet SIGTERM au serveur, qui draine les requêtes avant de s’arrêter.
+exec python -m app.server
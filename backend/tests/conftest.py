@@ -0,0 +1,159 @@
+"""Fixtures communes : base SQLite en mémoire, client HTTP asynchrone et fabriques.
+
+Le schéma est créé une seule fois par session de tests (et par processus avec
+`pytest -n auto`) dans une base SQLite en mémoire partagée. Chaque test
+s’exécute dans une transaction annulée à la fin : les `commit()` des routes
+ne libèrent qu’un point de sauvegarde, et la base est vide au test suivant.
+
+    async def test_x(client, factory, login):
+        user = await factory.user()
+        login(user)
+        response = await client.get("/api/accounts/accounts")
+
+La fixture `queries` compte les instructions SQL émises (voir `test_perf.py`).
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+import httpx
+import pytest
+import pytest_asyncio
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+# Les middlewares sont configurés à l’import de l’application : pas de limite
+# de débit entre tests qui partagent la même identité.
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+# Toute route qui dépasse son budget de requêtes SQL fait échouer le test.
+os.environ.setdefault("QUERY_BUDGET_MODE", "raise")
+# Jetons de version (registre des catégories, taux de change) propres à chaque
+# processus (`-n auto`)
+os.environ.setdefault(
+    "REFERENCE_VERSION_PATH", os.path.join(tempfile.gettempdir(), f"chatbuild-reference-{os.getpid()}.version")
+)
+os.environ.setdefault("FX_VERSION_PATH", os.path.join(tempfile.gettempdir(), f"chatbuild-fx-{os.getpid()}.version"))
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from backend.app.core.audit import audit_log
+from backend.app.core.reference import reference
+from backend.app.core.security import create_token
+from backend.app.database import Base, enforce_foreign_keys, get_session
+from backend.app.main import app
+from backend.tests.factories import Factory
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///file:chatbuild_tests?mode=memory&cache=shared&uri=true"
+# Instructions de contrôle de transaction exclues du décompte des requêtes
+_CONTROL = ("SAVEPOINT", "RELEASE", "ROLLBACK", "BEGIN", "COMMIT")
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def engine():
+    engine = create_async_engine(TEST_DATABASE_URL)
+    enforce_foreign_keys(engine)
+
+    # pysqlite/aiosqlite gèrent eux-mêmes BEGIN, ce qui casse les points de
+    # sauvegarde : SQLAlchemy émet BEGIN explicitement (recette de la doc).
+    @event.listens_for(engine.sync_engine, "connect")
+    def _no_implicit_begin(dbapi_connection, connection_record) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin(connection) -> None:
+        connection.exec_driver_sql("BEGIN")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def db(engine):
+    """Session du test, liée à une transaction annulée en fin de test."""
+    # Ni le registre ni le tampon d’audit ne doivent garder l’état d’un test précédent
+    reference.invalidate()
+    audit_log.clear()
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint")
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+
+
+@pytest.fixture
+def factory(db) -> Factory:
+    return Factory(db)
+
+
+@pytest_asyncio.fixture
+async def client(db):
+    """Client httpx branché directement sur l’application ASGI (sans réseau)."""
+
+    async def test_session():
+        yield db
+
+    app.dependency_overrides[get_session] = test_session
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            yield http
+    finally:
+        app.dependency_overrides.pop(get_session, None)
+
+
+@pytest.fixture
+def login(client):
+    """Authentifie le client pour l’utilisateur donné (cookie `access_token`)."""
+
+    def _login(user) -> None:
+        client.cookies.set("access_token", create_token({"sub": user.username}))
+
+    return _login
+
+
+class QueryCounter:
+    """Compte les instructions SQL émises et mesure la durée d’un bloc."""
+
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+        self.elapsed = 0.0
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if not statement.lstrip().upper().startswith(_CONTROL):
+            self.statements.append(statement)
+
+    @contextmanager
+    def measure(self):
+        self.statements.clear()
+        start = time.perf_counter()
+        yield self
+        self.elapsed = time.perf_counter() - start
+
+
+@pytest.fixture
+def queries(engine):
+    counter = QueryCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter._on_execute)
+    yield counter
+    event.remove(engine.sync_engine, "before_cursor_execute", counter._on_execute)
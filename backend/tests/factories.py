@@ -0,0 +1,172 @@
+"""Fabriques de modèles pour les tests (une méthode par modèle).
+
+Chaque méthode fournit des valeurs par défaut valides, accepte des
+surcharges en mots-clés, ajoute l’objet à la session et le `flush` afin que
+son identifiant soit disponible.
+"""
+
+from __future__ import annotations
+
+import itertools
+from datetime import date, timedelta
+from decimal import Decimal
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.models import (
+    AccountShare,
+    AccountSnapshot,
+    BankAccount,
+    Budget,
+    Category,
+    CategorySnapshot,
+    FxRate,
+    GlobalConfig,
+    Job,
+    Operation,
+    PaymentMethod,
+    RecurringItem,
+    User,
+)
+from backend.app.models.enums import AccountType, BudgetPeriod, OperationType, PermissionLevel, RecurringFrequency
+
+
+class Factory:
+    """Crée des objets persistés dans la session du test."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self._sequence = itertools.count(1)
+
+    def _next(self) -> int:
+        return next(self._sequence)
+
+    async def _save(self, obj):
+        self.session.add(obj)
+        await self.session.flush()
+        return obj
+
+    async def config(self, **overrides) -> GlobalConfig:
+        values = {"currency": "EUR", "timezone": "Europe/Paris", "initialized": True, **overrides}
+        return await self._save(GlobalConfig(**values))
+
+    async def user(self, **overrides) -> User:
+        values = {"username": f"user{self._next()}", "hashed_password": "x", **overrides}
+        return await self._save(User(**values))
+
+    async def admin(self, **overrides) -> User:
+        return await self.user(is_admin=True, **overrides)
+
+    async def category(self, **overrides) -> Category:
+        return await self._save(Category(**{"name": f"Catégorie {self._next()}", **overrides}))
+
+    async def payment_method(self, **overrides) -> PaymentMethod:
+        return await self._save(PaymentMethod(**{"name": f"Moyen {self._next()}", **overrides}))
+
+    async def account(self, owner: User | None = None, **overrides) -> BankAccount:
+        owner = owner or await self.user()
+        values = {
+            "name": f"Compte {self._next()}",
+            "owner_id": owner.id,
+            "type": AccountType.PERSONAL,
+            "initial_balance": Decimal("0"),
+            **overrides,
+        }
+        return await self._save(BankAccount(**values))
+
+    async def share(self, account: BankAccount, user: User, **overrides) -> AccountShare:
+        values = {"account_id": account.id, "user_id": user.id, "permission": PermissionLevel.VIEW_ONLY, **overrides}
+        return await self._save(AccountShare(**values))
+
+    async def operation(
+        self, account: BankAccount, category: Category | None = None, **overrides
+    ) -> Operation:
+        category = category or await self.category()
+        values = {
+            "type": OperationType.DEPENSE,
+            "label": f"Opération {self._next()}",
+            "amount": Decimal("12.50"),
+            "date": date(2026, 1, 15),
+            "account_id": account.id,
+            "category_id": category.id,
+            **overrides,
+        }
+        return await self._save(Operation(**values))
+
+    async def operations(
+        self,
+        account: BankAccount,
+        count: int,
+        categories: list[Category] | None = None,
+        start: date = date(2026, 1, 1),
+    ) -> None:
+        """Insère `count` opérations en une instruction (jeux de données volumineux)."""
+        categories = categories or [await self.category()]
+        rows = [
+            {
+                "type": OperationType.REVENU if n % 10 == 0 else OperationType.DEPENSE,
+                "label": f"Opération {n}",
+                "amount": Decimal(n % 200) + Decimal("0.99"),
+                "date": start + timedelta(days=n % 365),
+                "account_id": account.id,
+                "category_id": categories[n % len(categories)].id,
+            }
+            for n in range(count)
+        ]
+        await self.session.execute(insert(Operation), rows)
+
+    async def recurring(
+        self, account: BankAccount, category: Category | None = None, **overrides
+    ) -> RecurringItem:
+        category = category or await self.category()
+        values = {
+            "type": OperationType.DEPENSE,
+            "label": f"Prélèvement {self._next()}",
+            "amount": Decimal("30.00"),
+            "account_id": account.id,
+            "frequency": RecurringFrequency.MONTHLY,
+            "moment": 5,
+            "category_id": category.id,
+            **overrides,
+        }
+        return await self._save(RecurringItem(**values))
+
+    async def fx_rate(self, **overrides) -> FxRate:
+        values = {"currency": "USD", "date": date(2026, 1, 1), "rate": Decimal("0.9"), **overrides}
+        return await self._save(FxRate(**values))
+
+    async def job(self, owner: User | None = None, **overrides) -> Job:
+        values = {"kind": "recurring.materialize", "payload": {}, "owner_id": owner.id if owner else None, **overrides}
+        return await self._save(Job(**values))
+
+    async def snapshot(self, account: BankAccount, month: date, **overrides) -> AccountSnapshot:
+        values = {
+            "account_id": account.id,
+            "month": month,
+            "closing_balance": Decimal("0"),
+            **overrides,
+        }
+        return await self._save(AccountSnapshot(**values))
+
+    async def category_snapshot(
+        self, account: BankAccount, category: Category, month: date, **overrides
+    ) -> CategorySnapshot:
+        values = {
+            "account_id": account.id,
+            "category_id": category.id,
+            "month": month,
+            **overrides,
+        }
+        return await self._save(CategorySnapshot(**values))
+
+    async def budget(self, owner: User, category: Category, **overrides) -> Budget:
+        values = {
+            "user_id": owner.id,
+            "category_id": category.id,
+            "period": BudgetPeriod.MONTHLY,
+            "limit_amount": Decimal("100.00"),
+            "since": date.today().replace(day=1),
+            **overrides,
+        }
+        return await self._save(Budget(**values))
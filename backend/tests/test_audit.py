@@ -0,0 +1,96 @@
+"""Tests du journal d’audit écrit par lots."""
+
+import os
+import sys
+from datetime import date
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from backend.app.core.audit import AuditLog, audit_log
+from backend.app.models.enums import AuditAction, AuditEntity, PermissionLevel
+
+
+def test_buffer_signals_full_batches_and_drops_oldest() -> None:
+    log = AuditLog(batch_size=2, max_pending=3)
+    log.record(1, 1, AuditEntity.OPERATION, 1, AuditAction.CREATE)
+    assert not log._event().is_set()
+    log.record(1, 1, AuditEntity.OPERATION, 2, AuditAction.CREATE)
+    assert log._event().is_set()
+    for entity_id in (3, 4):
+        log.record(1, 1, AuditEntity.OPERATION, entity_id, AuditAction.CREATE)
+    assert (len(log), log.dropped) == (3, 1)
+    assert [event["entity_id"] for event in log._pending] == [2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_routes_are_audited(client, factory, login, db, queries) -> None:
+    owner = await factory.user()
+    partner = await factory.user()
+    account = await factory.account(owner=owner)
+    category = await factory.category()
+    login(owner)
+    await client.put(
+        f"/api/accounts/accounts/{account.id}/shares",
+        json=[{"user_id": partner.id, "permission": PermissionLevel.FULL_MANAGE.value}],
+    )
+    login(partner)
+    payload = {
+        "type": "DEPENSE",
+        "label": "Courses",
+        "amount": "12.50",
+        "date": "2026-03-02",
+        "account_id": account.id,
+        "category_id": category.id,
+    }
+    created = (await client.post("/api/operations/operations", json=payload)).json()
+    await client.patch(f"/api/operations/operations/{created['id']}", json={"amount": "13.00"})
+    await client.delete(f"/api/operations/operations/{created['id']}")
+    login(owner)
+    recurring = {**payload, "frequency": "MONTHLY", "moment": 2}
+    del recurring["date"]
+    item = (await client.post("/api/recurring/recurring", json=recurring)).json()
+    await client.put(f"/api/accounts/accounts/{account.id}/shares", json=[])
+
+    # Rien n’est écrit avant le vidage du tampon
+    assert (await client.get(f"/api/accounts/accounts/{account.id}/audit")).json() == []
+    with queries.measure():
+        assert await audit_log.flush(db) == 6
+    assert len(queries.statements) == 1
+
+    events = (await client.get(f"/api/accounts/accounts/{account.id}/audit")).json()
+    assert [(event["entity"], event["action"], event["username"]) for event in events] == [
+        ("SHARE", "DELETE", owner.username),
+        ("RECURRING", "CREATE", owner.username),
+        ("OPERATION", "DELETE", partner.username),
+        ("OPERATION", "UPDATE", partner.username),
+        ("OPERATION", "CREATE", partner.username),
+        ("SHARE", "CREATE", owner.username),
+    ]
+    assert events[0]["entity_id"] == partner.id
+    assert events[1]["entity_id"] == item["id"]
+    assert events[3]["changes"] == {"amount": "13.00"}
+    assert events[4]["changes"] == {
+        "type": "DEPENSE",
+        "label": "Courses",
+        "amount": "12.50",
+        "date": date(2026, 3, 2).isoformat(),
+        "category_id": category.id,
+        "payment_method_id": None,
+        "comment": None,
+    }
+
+    # Pagination par clé
+    page = (await client.get(f"/api/accounts/accounts/{account.id}/audit", params={"limit": 4})).json()
+    rest = (
+        await client.get(f"/api/accounts/accounts/{account.id}/audit", params={"before_id": page[-1]["id"]})
+    ).json()
+    assert [event["id"] for event in page + rest] == [event["id"] for event in events]
+    for limit in (-1, 0, 501):
+        response = await client.get(f"/api/accounts/accounts/{account.id}/audit", params={"limit": limit})
+        assert response.status_code == 422
+
+    # L’ancien bénéficiaire du partage n’a plus accès au journal
+    login(partner)
+    assert (await client.get(f"/api/accounts/accounts/{account.id}/audit")).status_code == 403
@@ -0,0 +1,127 @@
+"""Tests des budgets par catégorie et de leurs compteurs incrémentaux."""
+
+import os
+import sys
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from backend.app.core.budgets import period_end, period_start
+from backend.app.jobs.recurring import materialize_once
+from backend.app.models.enums import BudgetPeriod, OperationType
+
+
+def test_periods() -> None:
+    day = date(2026, 2, 18)  # mercredi
+    assert period_start(BudgetPeriod.WEEKLY, day) == date(2026, 2, 16)
+    assert period_end(BudgetPeriod.WEEKLY, date(2026, 2, 16)) == date(2026, 2, 22)
+    assert period_start(BudgetPeriod.MONTHLY, day) == date(2026, 2, 1)
+    assert period_end(BudgetPeriod.MONTHLY, date(2026, 2, 1)) == date(2026, 2, 28)
+    assert period_start(BudgetPeriod.YEARLY, day) == date(2026, 1, 1)
+    assert period_end(BudgetPeriod.YEARLY, date(2026, 1, 1)) == date(2026, 12, 31)
+
+
+async def _status(client) -> dict[int, dict]:
+    response = await client.get("/api/budgets/budgets/status")
+    assert response.status_code == 200, response.text
+    return {line["budget_id"]: line for line in response.json()}
+
+
+@pytest.mark.asyncio
+async def test_counters_follow_operation_writes(client, factory, login) -> None:
+    owner = await factory.user()
+    account = await factory.account(owner=owner)
+    savings = await factory.account(owner=owner)
+    restaurant = await factory.category()
+    other = await factory.category()
+    today = date.today()
+    last_month = period_start(BudgetPeriod.MONTHLY, today) - timedelta(days=1)
+    # Historique : seule la dépense du mois en cours compte à la création
+    await factory.operation(account, restaurant, amount=Decimal("15.00"), date=today)
+    await factory.operation(account, restaurant, amount=Decimal("99.00"), date=last_month)
+    await factory.operation(account, restaurant, amount=Decimal("500.00"), date=today, type=OperationType.REVENU)
+    login(owner)
+
+    created = await client.post(
+        "/api/budgets/budgets",
+        json={"category_id": restaurant.id, "account_id": account.id, "limit_amount": "100.00"},
+    )
+    assert created.status_code == 201, created.text
+    budget_id = created.json()["id"]
+    household = (
+        await client.post("/api/budgets/budgets", json={"category_id": restaurant.id, "limit_amount": "1000"})
+    ).json()["id"]
+    status = await _status(client)
+    assert status[budget_id]["spent"] == "15.00"
+    assert status[budget_id]["period_start"] == period_start(BudgetPeriod.MONTHLY, today).isoformat()
+    assert status[household]["spent"] == "15.00"
+
+    payload = {"type": "DEPENSE", "label": "Resto", "date": today.isoformat(), "category_id": restaurant.id}
+    first = await client.post("/api/operations/operations", json={**payload, "account_id": account.id, "amount": "40.00"})
+    second = await client.post("/api/operations/operations", json={**payload, "account_id": account.id, "amount": "30.00"})
+    await client.post(
+        "/api/operations/operations/bulk",
+        json={"operations": [{**payload, "account_id": savings.id, "amount": "5.00", "label": "Café"}]},
+    )
+    status = await _status(client)
+    assert status[budget_id]["spent"] == "85.00"
+    assert (status[budget_id]["percent"], status[budget_id]["alert"], status[budget_id]["exceeded"]) == (85, True, False)
+    assert status[household]["spent"] == "90.00"
+
+    events = (await client.get("/api/budgets/budgets/events")).json()
+    assert [(event["budget_id"], event["threshold"], event["spent"]) for event in events] == [(budget_id, 80, "85.00")]
+
+    await client.patch(f"/api/operations/operations/{first.json()['id']}", json={"amount": "60.00"})
+    assert (await _status(client))[budget_id]["remaining"] == "-5.00"
+    events = (await client.get("/api/budgets/budgets/events", params={"after_id": events[0]["id"]})).json()
+    assert [(event["threshold"], event["spent"]) for event in events] == [(100, "105.00")]
+    for limit in (-1, 0, 1001):
+        assert (await client.get("/api/budgets/budgets/events", params={"limit": limit})).status_code == 422
+
+    await client.delete(f"/api/operations/operations/{second.json()['id']}")
+    await client.post(
+        "/api/operations/operations/batch",
+        json={"ids": [first.json()["id"]], "action": "update", "changes": {"category_id": other.id}},
+    )
+    status = await _status(client)
+    assert status[budget_id]["spent"] == "15.00"
+    assert status[household]["spent"] == "20.00"
+    # Une dépense d’un mois échu ne touche pas la période en cours
+    await client.post(
+        "/api/operations/operations",
+        json={**payload, "account_id": account.id, "amount": "7.00", "date": last_month.isoformat()},
+    )
+    assert (await _status(client))[budget_id]["spent"] == "15.00"
+
+
+@pytest.mark.asyncio
+async def test_materializer_and_budget_visibility(client, factory, login, db) -> None:
+    owner = await factory.user()
+    partner = await factory.user()
+    account = await factory.account(owner=owner)
+    await factory.share(account, partner)
+    category = await factory.category()
+    today = date.today()
+    await factory.recurring(account, category, amount=Decimal("12.50"), moment=today.day)
+    login(owner)
+    budget = (
+        await client.post(
+            "/api/budgets/budgets",
+            json={"category_id": category.id, "account_id": account.id, "period": "YEARLY", "limit_amount": "50"},
+        )
+    ).json()
+
+    await materialize_once(db, today)
+    login(partner)
+    assert (await _status(client))[budget["id"]]["spent"] == "12.50"
+    assert [item["id"] for item in (await client.get("/api/budgets/budgets")).json()] == [budget["id"]]
+    assert (await client.delete(f"/api/budgets/budgets/{budget['id']}")).status_code == 403
+
+    login(owner)
+    assert (await client.delete(f"/api/budgets/budgets/{budget['id']}")).status_code == 204
+    assert await _status(client) == {}
+    missing = await client.post("/api/budgets/budgets", json={"category_id": 999999, "limit_amount": "10"})
+    assert missing.status_code == 404
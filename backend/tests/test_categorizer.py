@@ -0,0 +1,49 @@
+"""Tests du modèle de catégorisation automatique."""
+
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from backend.app.core.categorizer import MEMO_SIZE, AccountModel
+from backend.app.core.text import normalize_label
+
+
+def test_normalize_label_ignores_case_accents_and_digits() -> None:
+    assert normalize_label("CB CARREFOUR 12/01") == "cb carrefour"
+    assert normalize_label("Prélèvement ÉDF n°1234") == "prelevement edf"
+
+
+def test_model_learns_exact_labels_and_words() -> None:
+    model = AccountModel()
+    model.learn("CB CARREFOUR 12/01", category_id=4, payment_method_id=1)
+    model.learn("CB CARREFOUR 15/01", category_id=4, payment_method_id=1)
+    model.learn("PRLV EDF", category_id=14, payment_method_id=3)
+    model.learn("Restaurant Le Carrefour", category_id=5, payment_method_id=1)
+
+    exact = model.suggest("cb carrefour 30/01")
+    assert exact.category_id == 4 and exact.payment_method_id == 1 and exact.confidence == 1.0
+    assert model.suggest("EDF facture").category_id == 14
+    assert model.suggest("Inconnu").category_id is None
+
+
+def test_model_updates_incrementally() -> None:
+    model = AccountModel()
+    model.learn("Loyer", category_id=3, payment_method_id=None)
+    model.learn("Loyer", category_id=3, payment_method_id=None)
+    model.learn("Loyer", category_id=2, payment_method_id=None)
+    suggestion = model.suggest("LOYER")
+    assert suggestion.category_id == 3
+    assert suggestion.payment_method_id is None
+    assert 0.6 < suggestion.confidence < 0.7
+
+
+def test_suggestion_memo_is_bounded() -> None:
+    model = AccountModel()
+    model.learn("CB CARREFOUR", category_id=4, payment_method_id=1)
+    model.suggest("cb carrefour")
+    for n in range(MEMO_SIZE + 100):
+        word = "".join(chr(ord("a") + n // 26**i % 26) for i in range(3))
+        model.suggest(f"Magasin {word}")
+    assert len(model._memo) == MEMO_SIZE
+    assert model.suggest("cb carrefour").category_id == 4
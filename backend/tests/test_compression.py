@@ -0,0 +1,78 @@
+"""Tests du middleware de compression des réponses."""
+
+import gzip
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from backend.app.core.compression import CompressionMiddleware, accepted_encodings, available_encodings, compress
+
+ROWS = [{"id": n, "label": f"Opération {n}", "amount": "12.50"} for n in range(500)]
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/big")
+    async def big() -> list:
+        return ROWS
+
+    @app.get("/api/small")
+    async def small() -> dict:
+        return {"ok": True}
+
+    @app.get("/api/image")
+    async def image() -> Response:
+        return Response(b"\x89PNG" * 1000, media_type="image/png")
+
+    @app.get("/api/export")
+    async def export() -> StreamingResponse:
+        async def lines():
+            for n in range(100):
+                yield f"{n};Opération {n};12.50\n" * 20
+
+        return StreamingResponse(lines(), media_type="text/csv")
+
+    @app.get("/page")
+    async def page() -> PlainTextResponse:
+        return PlainTextResponse("x" * 5000)
+
+    app.add_middleware(CompressionMiddleware, minimum_size=1024, paths=["/api"])
+    return app
+
+
+def test_compresses_large_json_and_streams() -> None:
+    client = TestClient(_app())
+    big = client.get("/api/big", headers={"Accept-Encoding": "gzip"})
+    assert big.headers["content-encoding"] == "gzip" and big.headers["vary"] == "Accept-Encoding"
+    assert big.json() == ROWS
+    raw = client.get("/api/big", headers={"Accept-Encoding": "identity"})
+    assert int(big.headers["content-length"]) < len(raw.content) / 4
+
+    export = client.get("/api/export", headers={"Accept-Encoding": "gzip"})
+    assert export.headers["content-encoding"] == "gzip" and "content-length" not in export.headers
+    assert export.text.count("\n") == 2000
+
+    for path in ("/api/small", "/api/image", "/page"):
+        assert "content-encoding" not in client.get(path, headers={"Accept-Encoding": "gzip"}).headers
+
+
+def test_negotiation_and_one_shot_helper() -> None:
+    client = TestClient(_app())
+    preferred = next(iter(available_encodings()))
+    response = client.get("/api/big", headers={"Accept-Encoding": "gzip, br, zstd"})
+    assert response.headers["content-encoding"] == preferred
+    refused = client.get("/api/big", headers={"Accept-Encoding": "gzip;q=0"})
+    assert "content-encoding" not in refused.headers
+
+    header = b"GZIP;q=0.5, br; q=0, zstd;q=0.0, deflate;q=abc, identity"
+    assert accepted_encodings([(b"accept-encoding", header)]) == {"gzip", "identity"}
+    assert accepted_encodings([]) == set()
+
+    data = b"a;b;c\n" * 1000
+    assert gzip.decompress(compress(data, "gzip", 6)) == data
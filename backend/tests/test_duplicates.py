@@ -0,0 +1,51 @@
+"""Tests de la détection de doublons par empreinte."""
+
+import os
+import sys
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.app.core.duplicates import account_duplicates, find_duplicates, operation_fingerprint
+from backend.app.database import Base
+from backend.app.models import BankAccount, Category, Operation, User
+from backend.app.models.enums import AccountType, OperationType
+
+
+def test_fingerprint_ignores_formatting() -> None:
+    a = operation_fingerprint(1, OperationType.DEPENSE, Decimal("12.5"), "CB CARREFOUR 12/01")
+    b = operation_fingerprint(1, "DEPENSE", 12.50, "cb Carrefour")
+    assert a == b
+    assert a != operation_fingerprint(2, "DEPENSE", 12.50, "cb Carrefour")
+    assert a != operation_fingerprint(1, "DEPENSE", 12.51, "cb Carrefour")
+
+
+@pytest.mark.asyncio
+async def test_find_and_report_duplicates_within_window() -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        session.add_all([User(id=1, username="alice", hashed_password="x"), Category(id=1, name="Nourriture")])
+        session.add(BankAccount(id=1, name="Courant", owner_id=1, type=AccountType.PERSONAL))
+        for day in (1, 2, 20):
+            session.add(
+                Operation(
+                    type=OperationType.DEPENSE, label="Carrefour", amount=Decimal("30.00"),
+                    date=date(2026, 1, day), account_id=1, category_id=1,
+                )
+            )
+        await session.commit()
+
+        fp = operation_fingerprint(1, "DEPENSE", "30", "CARREFOUR")
+        matches = await find_duplicates(session, [(fp, date(2026, 1, 3)), (fp, date(2026, 1, 10))])
+        assert matches == [[1, 2], []]
+
+        groups = await account_duplicates(session, 1)
+        assert [[op.id for op in group] for group in groups] == [[1, 2]]
+    await engine.dispose()
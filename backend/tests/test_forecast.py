@@ -0,0 +1,160 @@
+"""Tests du moteur de prévision et des routes de simulation."""
+
+import os
+import sys
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from backend.app.core.forecast import (
+    ForecastCache,
+    PlannedItem,
+    add_operations,
+    horizon,
+    item_deltas,
+    occurrences,
+    project,
+)
+from backend.app.jobs.recurring import _is_due
+from backend.app.models.enums import OperationType, RecurringFrequency
+
+
+def _item(frequency: str, moment: int, amount: str = "10.00", **overrides) -> PlannedItem:
+    values = {
+        "id": 1,
+        "account_id": 1,
+        "type": OperationType.DEPENSE,
+        "label": "Loyer",
+        "amount": Decimal(amount),
+        "frequency": RecurringFrequency(frequency),
+        "moment": moment,
+        "start_date": None,
+        "end_date": None,
+        **overrides,
+    }
+    return PlannedItem(**values)
+
+
+@pytest.mark.parametrize(
+    "item",
+    [
+        _item("DAILY", 0),
+        _item("WEEKLY", 3),
+        _item("WEEKLY", 7, start_date=date(2026, 3, 4)),
+        _item("WEEKLY", 0),
+        _item("MONTHLY", 31),
+        _item("MONTHLY", 29, end_date=date(2026, 9, 1)),
+        _item("YEARLY", 15, start_date=date(2026, 2, 16)),
+        _item("MONTHLY", 0),
+    ],
+)
+def test_occurrences_match_materializer(item) -> None:
+    first, last = date(2026, 1, 10), date(2027, 3, 5)
+    expected = [
+        day.toordinal()
+        for day in (first + timedelta(days=n) for n in range((last - first).days + 1))
+        if _is_due(item, day)
+    ]
+    assert list(occurrences(item, first, last)) == expected
+
+
+def test_horizon_clamps_to_month_end() -> None:
+    assert horizon(date(2026, 8, 31), 6) == (date(2026, 9, 1), 181)
+    assert horizon(date(2026, 1, 15), 12) == (date(2026, 1, 16), 365)
+
+
+def test_projection_reports_lowest_balance_and_first_overdraft() -> None:
+    first = date(2026, 1, 1)
+    items = [
+        _item("MONTHLY", 5, "800.00"),
+        _item("MONTHLY", 28, "1000.00", type=OperationType.REVENU, label="Salaire"),
+    ]
+    deltas = item_deltas(items, first, 59)
+    projection = project(50000, deltas, first)
+    assert len(projection.balances) == 59
+    assert projection.last_day == date(2026, 2, 28)
+    assert projection.lowest() == (-30000, date(2026, 1, 5))
+    assert projection.first_overdraft() == date(2026, 1, 5)
+    assert projection.balances[-1] == 90000
+
+
+def test_existing_operation_replaces_due_item() -> None:
+    first = date(2026, 1, 1)
+    items = [_item("MONTHLY", 5, "800.00")]
+    deltas = item_deltas(items, first, 31)
+    # Loyer déjà saisi le 5 (montant différent), dépense ponctuelle le 10
+    add_operations(
+        deltas,
+        first,
+        [
+            (date(2026, 1, 5), OperationType.DEPENSE, Decimal("750.00"), "Loyer"),
+            (date(2026, 1, 10), OperationType.DEPENSE, Decimal("20.00"), "Cinéma"),
+            (date(2026, 3, 1), OperationType.DEPENSE, Decimal("1.00"), "Hors période"),
+        ],
+        items,
+    )
+    assert deltas[4] == -75000
+    assert deltas[9] == -2000
+    assert sum(deltas) == -77000
+
+
+def test_cache_reuses_and_recomputes_when_items_change() -> None:
+    cache = ForecastCache(max_entries=2)
+    first = date(2026, 1, 1)
+    items = (_item("DAILY", 0),)
+    deltas = cache.deltas(1, first, 30, items)
+    deltas[0] = 0  # la copie renvoyée peut être modifiée sans altérer le cache
+    assert cache.deltas(1, first, 30, items)[0] == -1000
+    assert (cache.hits, cache.misses) == (1, 1)
+    changed = (items[0]._replace(amount=Decimal("12.00")),)
+    assert cache.deltas(1, first, 30, changed)[0] == -1200
+    assert cache.misses == 2
+    cache.invalidate(1)
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_forecast_routes(client, factory, login) -> None:
+    owner = await factory.user()
+    account = await factory.account(owner=owner, initial_balance=Decimal("100.00"))
+    other = await factory.account()
+    category = await factory.category()
+    rent = await factory.recurring(account, category, amount=Decimal("40.00"), moment=1)
+    login(owner)
+
+    response = await client.get("/api/forecast/forecast", params={"months": 3})
+    assert response.status_code == 200, response.text
+    body = response.json()
+    today = date.today()
+    first, days = horizon(today, 3)
+    assert body["start_date"] == first.isoformat()
+    (line,) = body["accounts"]
+    assert line["account_id"] == account.id
+    assert line["opening_balance"] == "100.00"
+    assert len(line["balances"]) == days
+    # Trois prélèvements de 40 € sur trois mois : découvert au troisième
+    assert line["closing_balance"] == "-20.00"
+    assert line["min_balance"] == "-20.00"
+    assert line["first_overdraft"] is not None
+
+    scenario = {
+        "months": 3,
+        "change": [{"id": rent.id, "amount": "20.00"}],
+        "one_off": [
+            {"account_id": account.id, "type": "REVENU", "amount": "5.00", "date": first.isoformat()}
+        ],
+    }
+    simulated = (await client.post("/api/forecast/forecast", json=scenario)).json()["accounts"][0]
+    assert simulated["closing_balance"] == "45.00"
+    assert simulated["first_overdraft"] is None
+
+    removed = await client.post(
+        "/api/forecast/forecast", json={"change": [{"id": rent.id, "active": False}]}
+    )
+    assert removed.json()["accounts"][0]["min_balance"] == "100.00"
+
+    assert (await client.post("/api/forecast/forecast", json={"change": [{"id": 999999}]})).status_code == 404
+    assert (await client.get("/api/forecast/forecast", params={"account_id": other.id})).status_code == 403
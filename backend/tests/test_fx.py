@@ -0,0 +1,101 @@
+"""Tests du cache de taux de change et de la conversion en masse."""
+
+import os
+import sys
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.app.core.config import settings
+from backend.app.core.fx import FxRateCache, import_fx_rates, read_fx_file
+from backend.app.database import Base
+from backend.app.models import FxRate
+
+
+def _cache() -> FxRateCache:
+    cache = FxRateCache()
+    cache.load_rows(
+        [
+            ("usd", date(2026, 3, 1), Decimal("0.92")),
+            ("USD", date(2026, 1, 1), Decimal("0.90")),
+            ("CHF", date(2026, 1, 1), Decimal("1.05")),
+        ]
+    )
+    return cache
+
+
+def test_rate_lookup_uses_last_known_rate() -> None:
+    cache = _cache()
+    assert cache.rate("USD", date(2025, 12, 31)) is None
+    assert cache.rate("USD", date(2026, 1, 1)) == Decimal("0.9")
+    assert cache.rate("USD", date(2026, 2, 15)) == Decimal("0.9")
+    assert cache.rate("USD", date(2026, 3, 1)) == Decimal("0.92")
+    assert cache.rate("GBP", date(2026, 3, 1)) is None
+
+
+def test_bulk_conversion_single_and_per_row_dates() -> None:
+    cache = _cache()
+    currencies = ["EUR", "USD", "CHF", "GBP", "USD"]
+    cents = [1000, 1000, -333, 500, 1]
+    assert cache.convert_cents(currencies, cents, date(2026, 6, 1), "EUR") == [1000, 920, -350, None, 1]
+    days = [date(2026, 1, 1), date(2026, 1, 2), date(2025, 1, 1), date(2026, 1, 1), date(2026, 3, 2)]
+    assert cache.convert_cents(currencies, cents, days, "EUR") == [1000, 900, None, None, 1]
+
+
+def test_read_fx_file(tmp_path) -> None:
+    path = tmp_path / "rates.csv"
+    path.write_text("date,currency,rate\n2026-01-01, usd ,0.9\n", encoding="utf-8")
+    assert read_fx_file(path) == [("USD", date(2026, 1, 1), Decimal("0.9"))]
+
+
+@pytest.mark.asyncio
+async def test_import_from_another_process_reloads_workers(tmp_path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    maker = async_sessionmaker(engine, expire_on_commit=False)
+    # Cache d’un worker de l’API ; l’import passe par une autre session et le
+    # cache global, comme `python -m app.jobs.fx_import`
+    worker = FxRateCache(settings.fx_version_path)
+    async with maker() as api_session, maker() as import_session:
+        await worker.ensure_loaded(api_session)
+        assert worker.rate("USD", date(2026, 1, 1)) is None
+        await import_fx_rates(import_session, [("USD", date(2026, 1, 1), Decimal("0.9"))])
+        await worker.ensure_loaded(api_session)
+        assert worker.rate("USD", date(2026, 1, 1)) == Decimal("0.9")
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_import_replaces_rates_and_last_duplicate_wins(db) -> None:
+    await import_fx_rates(db, [("USD", date(2026, 1, 1), Decimal("0.90")), ("CHF", date(2026, 1, 1), Decimal("1"))])
+    rows = [
+        ("USD", date(2026, 1, 1), Decimal("0.91")),
+        ("USD", date(2026, 1, 1), Decimal("0.93")),
+        ("USD", date(2026, 1, 2), Decimal("0.92")),
+    ]
+    assert await import_fx_rates(db, rows) == 2
+    stored = await db.execute(select(FxRate.currency, FxRate.date, FxRate.rate).order_by(FxRate.currency, FxRate.date))
+    assert stored.all() == [
+        ("CHF", date(2026, 1, 1), Decimal("1")),
+        ("USD", date(2026, 1, 1), Decimal("0.93")),
+        ("USD", date(2026, 1, 2), Decimal("0.92")),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_import_of_several_years_of_daily_rates(db) -> None:
+    rows = [
+        (currency, date.fromordinal(date(2022, 1, 1).toordinal() + n), Decimal("1.1"))
+        for currency in ("USD", "CHF")
+        for n in range(1200)
+    ]
+    assert await import_fx_rates(db, rows) == 2400
+    assert await import_fx_rates(db, rows) == 2400  # réimport complet
+    assert (await db.execute(select(func.count()).select_from(FxRate))).scalar() == 2400
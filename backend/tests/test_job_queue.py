@@ -0,0 +1,123 @@
+"""Tests de la file d’attente des tâches (réclamation, succès, nouvelle tentative, bail)."""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.app.core.config import settings
+from backend.app.database import Base
+from backend.app.jobs.queue import claim_job, enqueue, fail_expired_jobs, register_task, run_job
+from backend.app.models.enums import JobStatus
+
+
+@register_task("test.ok")
+async def _ok(session, job):
+    return {"echo": job.payload["value"]}
+
+
+@register_task("test.boom")
+async def _boom(session, job):
+    raise RuntimeError("boom")
+
+
+async def _make_session():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return engine, async_sessionmaker(engine, expire_on_commit=False)()
+
+
+@pytest.mark.asyncio
+async def test_job_runs_once_and_succeeds() -> None:
+    engine, session = await _make_session()
+    job = await enqueue(session, "test.ok", {"value": 42})
+    claimed = await claim_job(session, "w1")
+    assert claimed.id == job.id and claimed.status == JobStatus.RUNNING
+    assert await claim_job(session, "w2") is None
+    await run_job(session, claimed)
+    assert claimed.status == JobStatus.SUCCEEDED
+    assert claimed.result == {"echo": 42}
+    await session.close()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_failed_job_is_rescheduled_then_failed() -> None:
+    engine, session = await _make_session()
+    job = await enqueue(session, "test.boom", max_attempts=2)
+    await run_job(session, await claim_job(session, "w1"))
+    job = await session.get(type(job), job.id, populate_existing=True)
+    assert job.status == JobStatus.PENDING and job.attempts == 1
+    # Le backoff repousse la prochaine tentative
+    assert await claim_job(session, "w1") is None
+    job.run_after = job.created_at
+    await session.commit()
+    await run_job(session, await claim_job(session, "w1"))
+    job = await session.get(type(job), job.id, populate_existing=True)
+    assert job.status == JobStatus.FAILED and "boom" in job.error
+    await session.close()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_retried_until_attempts_run_out() -> None:
+    engine, session = await _make_session()
+    job = await enqueue(session, "test.ok", {"value": 1}, max_attempts=2)
+    for attempt in (1, 2):
+        claimed = await claim_job(session, "w1")
+        assert (claimed.id, claimed.attempts) == (job.id, attempt)
+        # Le worker meurt pendant l’exécution : le bail expire
+        claimed.lease_expires_at = claimed.created_at
+        await session.commit()
+    assert await claim_job(session, "w2") is None
+    assert await fail_expired_jobs(session) == 1
+    job = await session.get(type(job), job.id, populate_existing=True)
+    assert job.status == JobStatus.FAILED and job.attempts == 2 and "Lease expired" in job.error
+    await session.close()
+    await engine.dispose()
+
+
+@register_task("test.slow")
+async def _slow(session, job):
+    # Plus long que le bail, sans signaler d’avancement
+    await asyncio.sleep(1.0)
+    return {}
+
+
+@pytest.mark.asyncio
+async def test_lease_is_renewed_while_handler_runs(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "job_lease_seconds", 0.6)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessions() as session, sessions() as other:
+        job = await enqueue(session, "test.slow")
+        running = asyncio.create_task(run_job(session, await claim_job(session, "w1")))
+        await asyncio.sleep(0.8)
+        # Bail initial dépassé : un autre worker ne reprend pas la tâche
+        assert await claim_job(other, "w2") is None
+        await running
+        job = await session.get(type(job), job.id, populate_existing=True)
+        assert job.status == JobStatus.SUCCEEDED and job.attempts == 1
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_payload_is_validated_at_enqueue(client, factory, login) -> None:
+    login(await factory.admin())
+    response = await client.post("/api/jobs/jobs", json={"kind": "operations.archive", "payload": {}})
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "payload", "before"]
+    payload = {"from": "2026-02-01", "to": "2026-01-01"}
+    response = await client.post("/api/jobs/jobs", json={"kind": "recurring.materialize", "payload": payload})
+    assert response.status_code == 422
+    payload = {"before": "2024-01-01"}
+    response = await client.post("/api/jobs/jobs", json={"kind": "operations.archive", "payload": payload})
+    assert response.status_code == 202
@@ -0,0 +1,65 @@
+"""Tests de l’arithmétique monétaire en centimes entiers."""
+
+import os
+import random
+import sys
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from backend.app.core.money import cents_array, from_cents, running_balance, signed_cents, to_cents, total
+from backend.app.database import Base
+from backend.app.models import BankAccount, Category, Operation, User
+from backend.app.models.enums import AccountType, OperationType
+
+
+def test_cents_conversions() -> None:
+    assert to_cents(Decimal("12.345")) == 1235
+    assert to_cents("0.1") == 10
+    assert to_cents(0.29) == 29
+    assert to_cents(3) == 300
+    assert from_cents(-1050) == Decimal("-10.50")
+
+
+def test_array_sum_is_exact_over_many_amounts() -> None:
+    rnd = random.Random(7)
+    amounts = [Decimal(rnd.randint(-100000, 100000)) / 100 for _ in range(200000)]
+    assert total(cents_array(amounts)) == sum(amounts)
+
+
+def test_signed_cents_and_running_balance() -> None:
+    deltas = signed_cents([(OperationType.REVENU, "100"), ("DEPENSE", Decimal("30.10")), ("DEPENSE", 0.9)])
+    assert list(deltas) == [10000, -3010, -90]
+    assert list(running_balance(500, deltas)) == [10500, 7490, 7400]
+
+
+@pytest.mark.asyncio
+async def test_money_column_round_trip_and_sql_sum() -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(User.__table__), [{"id": 1, "username": "alice", "hashed_password": "x"}])
+        await conn.execute(insert(Category.__table__), [{"id": 1, "name": "Divers"}])
+        await conn.execute(
+            insert(BankAccount.__table__),
+            [{"id": 1, "name": "C", "owner_id": 1, "type": AccountType.PERSONAL, "initial_balance": Decimal("0.10")}],
+        )
+        await conn.execute(
+            insert(Operation.__table__),
+            [
+                {"type": OperationType.DEPENSE, "label": "x", "amount": Decimal("0.10"), "date": date(2026, 1, 1),
+                 "account_id": 1, "category_id": 1}
+                for _ in range(1000)
+            ],
+        )
+        raw = (await conn.exec_driver_sql("SELECT amount FROM operations LIMIT 1")).scalar()
+        assert raw == 10
+        assert (await conn.execute(select(func.sum(Operation.amount)))).scalar() == Decimal("100.00")
+        assert (await conn.execute(select(BankAccount.initial_balance))).scalar() == Decimal("0.10")
+    await engine.dispose()
@@ -0,0 +1,92 @@
+"""Tests des modifications et suppressions d’opérations (unitaires et en masse)."""
+
+import os
+import sys
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.app.api.operations import batch_operations, update_operation
+from backend.app.core.duplicates import operation_fingerprint
+from backend.app.database import Base
+from backend.app.models import AccountShare, BankAccount, Category, Operation, User
+from backend.app.models.enums import AccountType, OperationType, PermissionLevel
+from backend.app.schemas.operation import OperationBatch, OperationUpdate
+
+
+@pytest.mark.asyncio
+async def test_patch_and_batch_edit_operations() -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        alice = User(id=1, username="alice", hashed_password="x")
+        bob = User(id=2, username="bob", hashed_password="x")
+        session.add_all([alice, bob, Category(id=1, name="Courses"), Category(id=2, name="Loisirs")])
+        session.add(BankAccount(id=1, name="Courant", owner_id=1, type=AccountType.PERSONAL))
+        session.add(AccountShare(account_id=1, user_id=2, permission=PermissionLevel.VIEW_ONLY))
+        for n in range(3):
+            session.add(
+                Operation(
+                    type=OperationType.DEPENSE, label=f"Achat {n}", amount=Decimal("10.00"),
+                    date=date(2026, 1, 1), account_id=1, category_id=1,
+                )
+            )
+        await session.commit()
+
+        row = await update_operation(1, OperationUpdate(amount=Decimal("12.50")), current_user=alice, db=session)
+        assert row["amount"] == Decimal("12.50") and row["label"] == "Achat 0"
+        fingerprint = (await session.execute(select(Operation.fingerprint).where(Operation.id == 1))).scalar()
+        assert fingerprint == operation_fingerprint(1, "DEPENSE", "12.50", "Achat 0")
+
+        with pytest.raises(HTTPException) as exc:
+            await update_operation(1, OperationUpdate(label="x"), current_user=bob, db=session)
+        assert exc.value.status_code == 403
+
+        batch = OperationBatch(ids=[1, 2], action="update", changes={"category_id": 2})
+        assert (await batch_operations(batch, current_user=alice, db=session)).count == 2
+        categories = (await session.execute(select(Operation.category_id).order_by(Operation.id))).scalars()
+        assert list(categories) == [2, 2, 1]
+
+        with pytest.raises(HTTPException) as exc:
+            await batch_operations(OperationBatch(ids=[3, 4], action="delete"), current_user=alice, db=session)
+        assert exc.value.status_code == 404
+        assert (await batch_operations(OperationBatch(ids=[2, 3], action="delete"), current_user=alice, db=session)).count == 2
+        assert list((await session.execute(select(Operation.id))).scalars()) == [1]
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_only_full_manage_sharers_can_modify(client, factory, login) -> None:
+    owner = await factory.user()
+    adder = await factory.user()
+    manager = await factory.user()
+    account = await factory.account(owner=owner)
+    await factory.share(account, adder, permission=PermissionLevel.VIEW_ADD_CURRENT)
+    await factory.share(account, manager, permission=PermissionLevel.FULL_MANAGE)
+    first = await factory.operation(account)
+    second = await factory.operation(account)
+
+    login(adder)
+    detail = "Insufficient permission to modify operation"
+    responses = [
+        await client.patch(f"/api/operations/operations/{first.id}", json={"label": "x"}),
+        await client.delete(f"/api/operations/operations/{first.id}"),
+        await client.post(
+            "/api/operations/operations/batch",
+            json={"ids": [first.id, second.id], "action": "update", "changes": {"comment": "x"}},
+        ),
+        await client.post("/api/operations/operations/batch", json={"ids": [first.id], "action": "delete"}),
+    ]
+    assert [(response.status_code, response.json()["detail"]) for response in responses] == [(403, detail)] * 4
+
+    login(manager)
+    assert (await client.patch(f"/api/operations/operations/{first.id}", json={"label": "x"})).status_code == 200
+    assert (await client.delete(f"/api/operations/operations/{second.id}")).status_code == 204
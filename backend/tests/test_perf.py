@@ -0,0 +1,165 @@
+"""Budgets de requêtes SQL et de latence par route (palier `perf`).
+
+Chaque route est appelée sur un petit jeu de données puis sur un jeu dix fois
+plus grand : le nombre d’instructions SQL doit rester identique (pas de
+requête par ligne, « N+1 ») et ne pas dépasser le budget de la route. Un
+premier appel à vide charge les caches de processus (taux de change…).
+
+    python -m pytest -m perf            # uniquement ce palier
+    python -m pytest -m "not perf"      # sans ce palier
+
+Les budgets de latence sont larges (base en mémoire) ; `PERF_LATENCY_FACTOR`
+les multiplie sur une machine lente.
+"""
+
+import os
+import sys
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from backend.app.core.reference import reference
+from backend.app.models.enums import PermissionLevel
+
+pytestmark = [pytest.mark.perf, pytest.mark.asyncio]
+
+LATENCY_FACTOR = float(os.environ.get("PERF_LATENCY_FACTOR", "1"))
+SMALL, LARGE = 3, 30
+
+
+class Dataset:
+    """Administrateur, propriétaire et compte principal, agrandis par `grow()`."""
+
+    def __init__(self, factory) -> None:
+        self.factory = factory
+        self.size = 0
+
+    async def create(self) -> "Dataset":
+        factory = self.factory
+        self.admin = await factory.admin()
+        self.owner = await factory.user()
+        self.categories = [await factory.category() for _ in range(3)]
+        self.payment_method = await factory.payment_method()
+        self.account = await factory.account(owner=self.owner)
+        self.shared = await factory.account()
+        await factory.share(self.shared, self.owner, permission=PermissionLevel.FULL_MANAGE)
+        self.job = await factory.job(self.owner)
+        # Budgets couvrant tout le jeu de données, plafonds jamais atteints
+        budget = {"since": date(2025, 1, 1), "limit_amount": Decimal("1000000")}
+        for category in self.categories:
+            await factory.budget(self.owner, category, **budget)
+            await factory.budget(self.owner, category, account_id=self.account.id, **budget)
+        for month in range(1, 4):
+            await factory.snapshot(self.account, date(2025, month, 1))
+            for category in self.categories:
+                await factory.category_snapshot(self.account, category, date(2025, month, 1))
+        return self
+
+    async def grow(self, size: int) -> None:
+        factory = self.factory
+        for _ in range(size - self.size):
+            await factory.share(self.account, await factory.user())
+            await factory.recurring(self.account, self.categories[0])
+            await factory.account(owner=self.owner)
+        await factory.operations(self.account, (size - self.size) * 10, self.categories)
+        await factory.operations(self.shared, (size - self.size) * 10, self.categories)
+        self.size = size
+
+
+# (chemin, en tant qu’administrateur, budget de requêtes, budget de latence en ms)
+READ_ROUTES = [
+    ("/api/accounts/accounts", False, 3, 100),
+    ("/api/accounts/accounts/summary", False, 4, 100),
+    ("/api/accounts/accounts/{account}/balance", False, 3, 100),
+    ("/api/accounts/accounts/{account}/shares", False, 3, 100),
+    ("/api/accounts/accounts/{account}/duplicates", False, 3, 150),
+    ("/api/accounts/accounts/{account}/snapshots", False, 4, 100),
+    ("/api/accounts/accounts/{account}/audit", False, 3, 100),
+    ("/api/categories/categories", False, 1, 100),
+    ("/api/operations/operations", False, 3, 200),
+    ("/api/operations/operations?include_archive=true", False, 3, 200),
+    ("/api/operations/operations/search?q=Op", False, 3, 200),
+    ("/api/recurring/recurring", False, 3, 100),
+    ("/api/jobs/jobs/{job}", False, 2, 100),
+    ("/api/forecast/forecast?months=12", False, 5, 50),
+    ("/api/budgets/budgets/status", False, 3, 100),
+    ("/api/users/users", True, 3, 150),
+]
+
+
+async def _call(client, queries, method: str, path: str, **kwargs):
+    with queries.measure():
+        response = await client.request(method, path, **kwargs)
+    assert response.status_code < 300, response.text
+    return queries.count, queries.elapsed * 1000
+
+
+@pytest.mark.parametrize("path,as_admin,max_queries,max_ms", READ_ROUTES)
+async def test_read_routes_have_constant_query_count(
+    client, factory, login, queries, path, as_admin, max_queries, max_ms
+) -> None:
+    data = await Dataset(factory).create()
+    login(data.admin if as_admin else data.owner)
+    url = path.format(account=data.account.id, job=data.job.id)
+    await client.get(url)
+
+    await data.grow(SMALL)
+    small, _ = await _call(client, queries, "GET", url)
+    await data.grow(LARGE)
+    large, elapsed = await _call(client, queries, "GET", url)
+
+    assert small == large, f"{url} : {small} → {large} requêtes (N+1)\n" + "\n".join(queries.statements)
+    assert large <= max_queries, "\n".join(queries.statements)
+    assert elapsed <= max_ms * LATENCY_FACTOR
+
+
+async def test_batch_writes_have_constant_query_count(client, factory, login, queries, db) -> None:
+    from sqlalchemy import select
+
+    from backend.app.models import Operation
+
+    data = await Dataset(factory).create()
+    await data.grow(LARGE)
+    login(data.owner)
+    ids = (await db.execute(select(Operation.id).where(Operation.account_id == data.account.id))).scalars().all()
+    # Le registre des catégories est chargé hors mesure
+    await reference.ensure_loaded(db)
+    counts = []
+    for batch in (ids[:3], ids[3:300]):
+        count, _ = await _call(
+            client,
+            queries,
+            "POST",
+            "/api/operations/operations/batch",
+            json={"ids": batch, "action": "update", "changes": {"category_id": data.categories[1].id}},
+        )
+        counts.append(count)
+    assert counts[0] == counts[1]
+
+    users = [await factory.user() for _ in range(20)]
+    counts = []
+    for group in (users[:2], users[2:]):
+        payload = [{"user_id": user.id, "permission": PermissionLevel.VIEW_ONLY.value} for user in group]
+        count, _ = await _call(client, queries, "PUT", f"/api/accounts/accounts/{data.account.id}/shares", json=payload)
+        counts.append(count)
+    assert counts[0] == counts[1]
+
+
+async def test_create_operation_budget(client, factory, login, queries) -> None:
+    data = await Dataset(factory).create()
+    await data.grow(SMALL)
+    login(data.owner)
+    payload = {
+        "account_id": data.account.id,
+        "type": "DEPENSE",
+        "label": "Boulangerie",
+        "amount": str(Decimal("4.20")),
+        "date": "2026-02-01",
+        "category_id": data.categories[0].id,
+    }
+    count, elapsed = await _call(client, queries, "POST", "/api/operations/operations", json=payload)
+    assert count <= 9, "\n".join(queries.statements)
+    assert elapsed <= 150 * LATENCY_FACTOR
@@ -0,0 +1,153 @@
+"""Budgets de requêtes SQL : rapport, middleware et routes d’écriture."""
+
+import os
+import sys
+from datetime import date
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select, text
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from backend.app.core.security import get_password_hash
+from backend.app.core.query_budget import QueryBudgetExceeded, QueryBudgetMiddleware, query_budget, query_log
+from backend.app.jobs.recurring import materialize_once
+from backend.app.models import Operation
+
+
+def test_report_groups_repeated_statements() -> None:
+    engine = create_engine("sqlite://")
+    with pytest.raises(QueryBudgetExceeded) as excinfo:
+        with query_log("boucle", budget=2):
+            with engine.connect() as conn:
+                for n in range(5):
+                    conn.execute(text("SELECT :n"), {"n": n})
+    report = str(excinfo.value)
+    assert report.startswith("boucle: 5 SQL statements (budget 2)")
+    assert "5 × SELECT ?" in report
+
+
+def test_middleware_replaces_response_over_budget() -> None:
+    engine = create_engine("sqlite://")
+    app = FastAPI()
+
+    @app.get("/n-plus-one")
+    @query_budget(1)
+    def n_plus_one() -> dict:
+        with engine.connect() as conn:
+            return {"rows": [conn.execute(text("SELECT :n"), {"n": n}).scalar() for n in range(3)]}
+
+    @app.get("/ok")
+    @query_budget(1)
+    def ok() -> dict:
+        with engine.connect() as conn:
+            return {"rows": [conn.execute(text("SELECT 1")).scalar()]}
+
+    app.add_middleware(QueryBudgetMiddleware)
+    client = TestClient(app)
+    response = client.get("/n-plus-one")
+    assert response.status_code == 500
+    assert "GET /n-plus-one: 3 SQL statements (budget 1)" in response.text
+    assert client.get("/ok").status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_write_routes_within_budget(client, factory, login, db) -> None:
+    # En mode `raise` (conftest), une route hors budget répond 500.
+    admin = await factory.admin()
+    owner = await factory.user()
+    other = await factory.user()
+    category = await factory.category()
+    account = await factory.account(owner=owner)
+    await factory.config(initialized=False)
+
+    assert (await client.post("/api/setup", json={"currency": "EUR", "timezone": "Europe/Paris"})).status_code < 300
+
+    admin.hashed_password = get_password_hash("adminpw")
+    await db.flush()
+    assert (await client.post("/api/login", json={"username": admin.username, "password": "adminpw"})).status_code == 200
+    created = await client.post("/api/users/users", json={"username": "carol", "password": "secret1"})
+    assert created.status_code == 201, created.text
+    user_id = created.json()["id"]
+    assert (await client.put(f"/api/users/users/{user_id}", json={"disabled": True})).status_code == 200
+
+    login(owner)
+    calls = [
+        ("POST", "/api/accounts/accounts", {"name": "Épargne"}),
+        ("POST", f"/api/accounts/accounts/{account.id}/shares", {"user_id": other.id, "permission": "VIEW_ONLY"}),
+        ("PUT", f"/api/accounts/accounts/{account.id}/shares", [{"user_id": other.id, "permission": "FULL_MANAGE"}]),
+        ("POST", "/api/categories/categories", {"name": "Vacances"}),
+        (
+            "POST",
+            "/api/operations/operations",
+            {
+                "account_id": account.id,
+                "type": "DEPENSE",
+                "label": "Boulangerie",
+                "amount": "4.20",
+                "date": "2026-02-01",
+                "category_id": category.id,
+            },
+        ),
+        (
+            "POST",
+            "/api/operations/operations/bulk",
+            {
+                "operations": [
+                    {
+                        "account_id": account.id,
+                        "type": "DEPENSE",
+                        "label": f"Import {n}",
+                        "amount": "10.00",
+                        "date": "2026-02-02",
+                        "category_id": category.id,
+                    }
+                    for n in range(20)
+                ]
+            },
+        ),
+        ("POST", "/api/operations/operations/categorize", {"account_id": account.id, "labels": ["Boulangerie"]}),
+        (
+            "POST",
+            "/api/recurring/recurring",
+            {
+                "account_id": account.id,
+                "type": "DEPENSE",
+                "label": "Loyer",
+                "amount": "700",
+                "frequency": "MONTHLY",
+                "moment": 5,
+                "category_id": category.id,
+            },
+        ),
+    ]
+    for method, path, payload in calls:
+        response = await client.request(method, path, json=payload)
+        assert response.status_code < 300, f"{method} {path}: {response.text}"
+
+    operation = (await client.get("/api/operations/operations")).json()[0]
+    patched = await client.patch(f"/api/operations/operations/{operation['id']}", json={"label": "Pain"})
+    assert patched.status_code == 200, patched.text
+    assert (await client.delete(f"/api/operations/operations/{operation['id']}")).status_code == 204
+
+    login(admin)
+    unused = await factory.category()
+    assert (await client.delete(f"/api/categories/categories/{unused.id}")).status_code < 300
+    job = await client.post("/api/jobs/jobs", json={"kind": "recurring.materialize", "payload": {}})
+    assert job.status_code == 202, job.text
+
+
+@pytest.mark.asyncio
+async def test_materialize_once_budget(factory, db) -> None:
+    account = await factory.account()
+    category = await factory.category()
+    for n in range(10):
+        await factory.recurring(account, category, label=f"Abonnement {n}", moment=5)
+    # Lecture des items, lecture des opérations du jour, insertion groupée,
+    # recherche des budgets touchés (aucun ici), relevés périmés (mois échu)
+    with query_log("materialize_once", budget=5):
+        await materialize_once(db, date(2026, 3, 5))
+    labels = (await db.execute(select(Operation.label).where(Operation.account_id == account.id))).scalars()
+    assert sorted(labels) == sorted(f"Abonnement {n}" for n in range(10))
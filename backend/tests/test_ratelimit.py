@@ -0,0 +1,64 @@
+"""Tests de la limitation de débit par seau à jetons."""
+
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.app.core.ratelimit import MemoryBackend, RateLimitMiddleware, SQLiteBackend, parse_rules
+
+
+RULES = parse_rules({"POST /api/login": "2/10"}, "100/10")
+
+
+def test_bucket_refills_and_evicts() -> None:
+    backend = MemoryBackend(max_keys=2)
+    login = RULES[0]
+
+    async def scenario() -> None:
+        assert (await backend.hit("a", login, now=0.0)).remaining == 1
+        assert (await backend.hit("a", login, now=0.0)).allowed
+        denied = await backend.hit("a", login, now=1.0)
+        assert not denied.allowed and round(denied.retry_after, 3) == 4.0
+        assert (await backend.hit("a", login, now=6.0)).allowed
+        await backend.hit("b", login, now=6.0)
+        await backend.hit("c", login, now=6.0)
+        assert len(backend) == 2  # « a » a été évincé
+
+    asyncio.run(scenario())
+
+
+def test_sqlite_backend_is_shared(tmp_path) -> None:
+    path = str(tmp_path / "limits.db")
+    first, second = SQLiteBackend(path), SQLiteBackend(path)
+    login = RULES[0]
+
+    async def scenario() -> None:
+        assert (await first.hit("ip:1", login, now=100.0)).allowed
+        assert (await second.hit("ip:1", login, now=100.0)).allowed
+        assert not (await first.hit("ip:1", login, now=100.5)).allowed
+        assert (await second.hit("ip:1", login, now=105.0)).allowed
+
+    asyncio.run(scenario())
+
+
+def test_middleware_headers_and_429() -> None:
+    app = FastAPI()
+
+    @app.post("/api/login")
+    async def login() -> dict:
+        return {"ok": True}
+
+    app.add_middleware(RateLimitMiddleware, rules=RULES, backend=MemoryBackend())
+    client = TestClient(app)
+    first = client.post("/api/login")
+    assert first.status_code == 200
+    assert first.headers["x-ratelimit-limit"] == "2" and first.headers["x-ratelimit-remaining"] == "1"
+    client.post("/api/login")
+    blocked = client.post("/api/login")
+    assert blocked.status_code == 429
+    assert int(blocked.headers["retry-after"]) >= 1
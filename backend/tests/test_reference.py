@@ -0,0 +1,134 @@
+"""Tests du registre en mémoire des catégories et des moyens de paiement."""
+
+import os
+import sys
+from datetime import date
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from backend.app.core.config import settings
+from backend.app.core.reference import ReferenceRegistry
+
+
+@pytest.mark.asyncio
+async def test_references_are_checked_on_create(client, factory, login, monkeypatch) -> None:
+    owner = await factory.user()
+    account = await factory.account(owner=owner)
+    category = await factory.category()
+    method = await factory.payment_method()
+    login(owner)
+    payload = {
+        "type": "DEPENSE",
+        "label": "Courses",
+        "amount": "12.00",
+        "date": date.today().isoformat(),
+        "account_id": account.id,
+        "category_id": category.id,
+    }
+
+    unknown = await client.post("/api/operations/operations", json={**payload, "category_id": 999999})
+    assert (unknown.status_code, unknown.json()["detail"]) == (404, "Category not found: 999999")
+    unknown = await client.post("/api/operations/operations", json={**payload, "payment_method_id": 999998})
+    assert (unknown.status_code, unknown.json()["detail"]) == (404, "Payment method not found: 999998")
+    created = await client.post("/api/operations/operations", json={**payload, "payment_method_id": method.id})
+    assert created.status_code == 201, created.text
+
+    # Catégorie créée hors des routes après le chargement du registre : visible
+    # une fois le délai entre deux rechargements écoulé
+    late = await factory.category()
+    monkeypatch.setattr(settings, "reference_reload_interval_seconds", 0)
+    recurring = {**payload, "frequency": "MONTHLY", "moment": 5, "category_id": late.id}
+    del recurring["date"]
+    assert (await client.post("/api/recurring/recurring", json=recurring)).status_code == 201
+
+    admin = await factory.user(is_admin=True)
+    login(admin)
+    assert (await client.delete(f"/api/categories/categories/{category.id}")).status_code == 200
+    login(owner)
+    deleted = await client.post("/api/operations/operations", json=payload)
+    assert (deleted.status_code, deleted.json()["detail"]) == (400, f"Category is deleted: {category.id}")
+    names = [item["name"] for item in (await client.get("/api/categories/categories")).json()]
+    assert late.name in names and category.name not in names
+
+
+@pytest.mark.asyncio
+async def test_category_names_are_unique(client, factory, login) -> None:
+    existing = await factory.category()
+    login(await factory.user())
+    duplicate = await client.post("/api/categories/categories", json={"name": existing.name})
+    assert duplicate.status_code == 400
+    created = await client.post("/api/categories/categories", json={"name": "Jardin"})
+    assert created.status_code == 201
+    names = [item["name"] for item in (await client.get("/api/categories/categories")).json()]
+    assert "Jardin" in names
+
+
+@pytest.mark.asyncio
+async def test_version_file_reloads_other_workers(db, factory, queries, tmp_path) -> None:
+    path = str(tmp_path / "reference.version")
+    worker, other = ReferenceRegistry(path), ReferenceRegistry(path)
+    category = await factory.category()
+    await worker.ensure_loaded(db)
+    await other.ensure_loaded(db)
+
+    with queries.measure():
+        await worker.ensure_loaded(db)
+    assert worker.categories.get(category.id) == (category.name, False)
+    assert queries.count == 0
+
+    added = await factory.category()
+    await other.ensure_loaded(db)
+    assert other.categories.get(added.id) is None
+    worker.bump()
+    with queries.measure():
+        await other.ensure_loaded(db)
+    assert other.categories.get(added.id) == (added.name, False)
+    assert queries.count == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_ids_reload_at_most_once_per_interval(db, factory, queries, tmp_path, monkeypatch) -> None:
+    registry = ReferenceRegistry(str(tmp_path / "reference.version"))
+    monkeypatch.setattr(settings, "reference_reload_interval_seconds", 60)
+    await registry.ensure_loaded(db)
+    with queries.measure():
+        for _ in range(5):
+            assert await registry.check(db, registry.categories, [999999]) == ([999999], [])
+    assert queries.count == 0
+
+    # Délai écoulé : un identifiant inconnu provoque une seule relecture
+    added = await factory.category()
+    monkeypatch.setattr(settings, "reference_reload_interval_seconds", 0)
+    with queries.measure():
+        assert await registry.check(db, registry.categories, [added.id]) == ([], [])
+    assert queries.count == 1
+
+
+@pytest.mark.asyncio
+async def test_foreign_keys_are_enforced(client, factory, login, db) -> None:
+    from sqlalchemy import delete, text
+
+    from backend.app.models import Category
+
+    assert (await db.execute(text("PRAGMA foreign_keys"))).scalar() == 1
+    owner = await factory.user()
+    account = await factory.account(owner=owner)
+    category = await factory.category()
+    stale = await factory.category()
+    login(owner)
+    payload = {
+        "type": "DEPENSE",
+        "label": "Courses",
+        "amount": "12.00",
+        "date": date.today().isoformat(),
+        "account_id": account.id,
+        "category_id": category.id,
+    }
+    assert (await client.post("/api/operations/operations", json=payload)).status_code == 201
+
+    # Ligne supprimée hors des routes : le registre est périmé, la base refuse
+    await db.execute(delete(Category).where(Category.id == stale.id))
+    response = await client.post("/api/operations/operations", json={**payload, "category_id": stale.id, "label": "Ter"})
+    assert (response.status_code, response.json()["detail"]) == (400, "Referenced row does not exist")
@@ -0,0 +1,59 @@
+"""Tests de l’index plein texte des opérations (SQLite FTS5)."""
+
+import os
+import sys
+from datetime import date
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.app.core.search import fts_match_clause, search_terms
+from backend.app.database import Base
+from backend.app.models import BankAccount, Category, Operation, User
+from backend.app.models.enums import AccountType, OperationType
+
+
+async def _search(session, query: str) -> list[str]:
+    result = await session.execute(
+        select(Operation.label).where(fts_match_clause("sqlite", search_terms(query))).order_by(Operation.id)
+    )
+    return list(result.scalars().all())
+
+
+@pytest.mark.asyncio
+async def test_prefix_and_accent_insensitive_search() -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        session.add_all([User(id=1, username="alice", hashed_password="x"), Category(id=1, name="Énergie")])
+        session.add(BankAccount(id=1, name="Courant", owner_id=1, type=AccountType.PERSONAL))
+        for label, comment in [("Facture Électricité EDF", None), ("Carrefour Market", "courses"), ("EDF régul", None)]:
+            session.add(
+                Operation(
+                    type=OperationType.DEPENSE, label=label, amount=10, date=date(2026, 1, 1),
+                    account_id=1, category_id=1, comment=comment,
+                )
+            )
+        await session.commit()
+
+        assert await _search(session, "carr") == ["Carrefour Market"]
+        assert await _search(session, "electricite") == ["Facture Électricité EDF"]
+        assert await _search(session, "edf") == ["Facture Électricité EDF", "EDF régul"]
+        assert await _search(session, "edf regul") == ["EDF régul"]
+        assert await _search(session, "courses") == ["Carrefour Market"]
+
+        # Les triggers maintiennent l’index lors des mises à jour en masse
+        await session.execute(update(Operation).where(Operation.label == "Carrefour Market").values(label="Leclerc"))
+        await session.commit()
+        assert await _search(session, "carrefour") == []
+        assert await _search(session, "lecl") == ["Leclerc"]
+    await engine.dispose()
+
+
+def test_search_terms_strip_fts_syntax() -> None:
+    assert search_terms('EDF" OR *') == ["EDF", "OR"]
@@ -0,0 +1,109 @@
+"""Tests du profil multi-workers : élection du leader et arrêt gracieux."""
+
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from backend.app.core.leader import acquire_leadership, release_leadership, startup_lock
+from backend.app.jobs import lifecycle
+from backend.app.jobs.leadership import campaign
+from backend.app.server import build_parser, server_options
+
+
+@pytest.mark.asyncio
+async def test_single_leader_per_lock_file(tmp_path) -> None:
+    path = str(tmp_path / "leader.lock")
+    assert acquire_leadership(path)
+    assert acquire_leadership(path)  # idempotent dans le processus leader
+
+    # Un autre descripteur (comme un autre worker) n’obtient pas le verrou
+    import fcntl
+
+    fd = os.open(path, os.O_RDWR)
+    with pytest.raises(OSError):
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    release_leadership(path)
+    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    os.close(fd)
+
+    # Deux initialisations concurrentes s’exécutent l’une après l’autre
+    order = []
+
+    async def initialize(name: str) -> None:
+        async with startup_lock(str(tmp_path / "startup.lock")):
+            order.append(name)
+            await asyncio.sleep(0.02)
+            order.append(name)
+
+    await asyncio.gather(initialize("a"), initialize("b"))
+    assert order in (["a", "a", "b", "b"], ["b", "b", "a", "a"])
+
+
+@pytest.mark.asyncio
+async def test_follower_takes_over_released_leadership(tmp_path) -> None:
+    path = str(tmp_path / "leader.lock")
+    # Un autre worker, leader jusqu’à ce qu’on lui écrive une ligne
+    script = (
+        "import sys; sys.path.append(sys.argv[2]);"
+        "from backend.app.core.leader import acquire_leadership, release_leadership;"
+        "print(acquire_leadership(sys.argv[1]), flush=True);"
+        "sys.stdin.readline(); release_leadership(sys.argv[1]);"
+        "print('released', flush=True); sys.stdin.readline()"
+    )
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+    leader = subprocess.Popen(
+        [sys.executable, "-c", script, path, root], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True
+    )
+    try:
+        assert leader.stdout.readline().strip() == "True"
+        elected = []
+        follower = asyncio.create_task(campaign(lambda: elected.append(os.getpid()), path, interval=0.01))
+        await asyncio.sleep(0.1)
+        assert not elected and not follower.done()
+
+        leader.stdin.write("\n")
+        leader.stdin.flush()
+        assert leader.stdout.readline().strip() == "released"
+        assert await asyncio.wait_for(follower, timeout=5)
+        assert elected == [os.getpid()]
+    finally:
+        leader.stdin.close()
+        leader.wait(timeout=5)
+        release_leadership(path)
+
+
+@pytest.mark.asyncio
+async def test_shutdown_drains_then_cancels() -> None:
+    finished = []
+
+    async def job() -> None:
+        # Travail en cours mené à terme malgré la demande d’arrêt
+        while not lifecycle.stopping():
+            await lifecycle.sleep_or_stop(60)
+        await asyncio.sleep(0.01)
+        finished.append("job")
+
+    async def stuck() -> None:
+        await asyncio.sleep(60)
+
+    lifecycle.spawn(job())
+    hung = lifecycle.spawn(stuck())
+    await asyncio.sleep(0)
+    assert await lifecycle.shutdown(timeout=0.5) == 1
+    assert finished == ["job"] and hung.cancelled()
+    assert not lifecycle.stopping()  # prêt pour un redémarrage
+
+
+def test_server_options() -> None:
+    args = build_parser().parse_args(["--workers", "4", "--limit-concurrency", "200", "--keep-alive", "15"])
+    options = server_options(args)
+    assert options["workers"] == 4
+    assert options["limit_concurrency"] == 200
+    assert options["timeout_keep_alive"] == 15
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["--workers", "0"])
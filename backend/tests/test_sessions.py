@@ -0,0 +1,52 @@
+"""Une requête authentifiée n’utilise qu’une session et une connexion."""
+
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.app.core.security import create_token
+from backend.app.database import Base, get_session, track_pool
+from backend.app.main import app
+from backend.app.models import BankAccount, User
+from backend.app.models.enums import AccountType
+
+
+def test_one_connection_per_request(tmp_path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+    maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def prepare() -> None:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with maker() as session:
+            session.add(User(id=1, username="alice", hashed_password="x"))
+            session.add(BankAccount(id=1, name="Courant", owner_id=1, type=AccountType.PERSONAL))
+            await session.commit()
+
+    asyncio.run(prepare())
+    stats = track_pool(engine)
+    sessions = []
+
+    async def test_session():
+        async with maker() as session:
+            sessions.append(session)
+            yield session
+
+    app.dependency_overrides[get_session] = test_session
+    try:
+        client = TestClient(app)
+        client.cookies.set("access_token", create_token({"sub": "alice"}))
+        for path in ("/api/accounts/accounts", "/api/accounts/accounts/1/balance"):
+            stats.reset()
+            sessions.clear()
+            assert client.get(path).status_code == 200
+            assert len(sessions) == 1
+            assert stats.checkouts == 1 and stats.peak_in_use == 1
+    finally:
+        app.dependency_overrides.clear()
+        asyncio.run(engine.dispose())
@@ -0,0 +1,61 @@
+"""Tests du remplacement en bloc des partages d’un compte."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.app.api.accounts import replace_shares
+from backend.app.database import Base
+from backend.app.models import AccountShare, BankAccount, User
+from backend.app.models.enums import AccountType, PermissionLevel
+from backend.app.schemas.account import ShareCreate
+
+
+@pytest.mark.asyncio
+async def test_replace_shares_applies_diff() -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        owner = User(id=1, username="owner", hashed_password="x")
+        session.add_all([owner] + [User(id=n, username=f"user{n}", hashed_password="x") for n in (2, 3, 4)])
+        session.add(BankAccount(id=1, name="Foyer", owner_id=1, type=AccountType.JOINT))
+        session.add_all(
+            [
+                AccountShare(account_id=1, user_id=2, permission=PermissionLevel.VIEW_ONLY),
+                AccountShare(account_id=1, user_id=3, permission=PermissionLevel.VIEW_ONLY),
+            ]
+        )
+        await session.commit()
+
+        acl = await replace_shares(
+            1,
+            [
+                ShareCreate(user_id=3, permission=PermissionLevel.FULL_MANAGE),
+                ShareCreate(user_id=4, permission=PermissionLevel.VIEW_ADD_CURRENT),
+            ],
+            current_user=owner,
+            db=session,
+        )
+        assert [(s.username, s.permission) for s in acl] == [
+            ("user3", PermissionLevel.FULL_MANAGE),
+            ("user4", PermissionLevel.VIEW_ADD_CURRENT),
+        ]
+        stored = await session.execute(
+            select(AccountShare.user_id, AccountShare.permission).order_by(AccountShare.user_id)
+        )
+        assert stored.all() == [(3, PermissionLevel.FULL_MANAGE), (4, PermissionLevel.VIEW_ADD_CURRENT)]
+
+        with pytest.raises(HTTPException) as exc:
+            await replace_shares(
+                1, [ShareCreate(user_id=99, permission=PermissionLevel.VIEW_ONLY)], current_user=owner, db=session
+            )
+        assert exc.value.status_code == 404
+    await engine.dispose()
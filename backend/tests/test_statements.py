@@ -0,0 +1,120 @@
+"""Tests des relevés mensuels figés et de l’archivage de l’historique."""
+
+import os
+import sys
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.app.api.accounts import get_balance, list_snapshots
+from backend.app.database import Base
+from backend.app.jobs.statements import archive_operations, close_months, mark_stale, snapshot_month
+from backend.app.models import AccountSnapshot, ArchivedOperation, BankAccount, Category, Operation, User
+from backend.app.models.enums import AccountType, OperationType
+
+
+@pytest.mark.asyncio
+async def test_snapshot_then_archive_keeps_balances() -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        alice = User(id=1, username="alice", hashed_password="x")
+        session.add_all([alice, Category(id=1, name="Salaire"), Category(id=2, name="Courses")])
+        session.add(
+            BankAccount(id=1, name="Courant", owner_id=1, type=AccountType.PERSONAL, initial_balance=Decimal("100"))
+        )
+        for kind, amount, day, category in [
+            (OperationType.REVENU, "1000.00", date(2024, 1, 5), 1),
+            (OperationType.DEPENSE, "30.10", date(2024, 1, 9), 2),
+            (OperationType.DEPENSE, "19.90", date(2024, 2, 1), 2),
+            (OperationType.DEPENSE, "5.00", date(2025, 6, 1), 2),
+        ]:
+            session.add(
+                Operation(
+                    type=kind, label="x", amount=Decimal(amount), date=day, account_id=1, category_id=category
+                )
+            )
+        await session.commit()
+        before = await get_balance(1, current_user=alice, db=session)
+
+        assert await snapshot_month(session, date(2024, 1, 15)) == 1
+        assert await snapshot_month(session, date(2024, 1, 1)) == 0  # mois déjà figé
+
+        assert await archive_operations(session, date(2024, 3, 10)) == 3
+        assert (await session.execute(select(func.count()).select_from(Operation))).scalar() == 1
+        assert (await session.execute(select(func.count()).select_from(ArchivedOperation))).scalar() == 3
+
+        after = await get_balance(1, current_user=alice, db=session)
+        assert after.balance == before.balance == Decimal("1045.00")
+        assert after.archived_balance == Decimal("950.00")
+
+        january, february = await list_snapshots(1, current_user=alice, db=session, from_month=None, to_month=None)
+        assert january.month == date(2024, 1, 1) and january.closing_balance == Decimal("1069.90")
+        assert [(c.category_id, c.revenue, c.expense) for c in january.categories] == [
+            (1, Decimal("1000.00"), Decimal("0.00")),
+            (2, Decimal("0.00"), Decimal("30.10")),
+        ]
+        assert february.closing_balance == Decimal("1050.00") and february.operation_count == 1
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_writes_in_closed_months_are_resnapshotted(client, factory, login, db) -> None:
+    owner = await factory.user()
+    account = await factory.account(owner=owner, initial_balance=Decimal("100"))
+    category = await factory.category()
+    old = await factory.operation(account, category, amount=Decimal("10.00"), date=date(2026, 1, 15))
+    for month in (date(2026, 1, 1), date(2026, 2, 1)):
+        await snapshot_month(db, month)
+    login(owner)
+
+    payload = {
+        "type": "DEPENSE",
+        "label": "Oubli",
+        "amount": "5.00",
+        "date": "2026-01-20",
+        "account_id": account.id,
+        "category_id": category.id,
+    }
+    assert (await client.post("/api/operations/operations", json=payload)).status_code == 201
+    await client.patch(f"/api/operations/operations/{old.id}", json={"amount": "20.00"})
+    snapshots = AccountSnapshot.__table__
+    stale = await db.execute(
+        select(snapshots.c.month, snapshots.c.stale).where(snapshots.c.account_id == account.id)
+    )
+    assert sorted(stale.all()) == [(date(2026, 1, 1), True), (date(2026, 2, 1), True)]
+
+    await close_months(db, date.today())
+    response = await client.get(f"/api/accounts/accounts/{account.id}/snapshots", params={"to_month": "2026-02-01"})
+    lines = [(line["month"], line["expense"], line["closing_balance"]) for line in response.json()]
+    assert lines == [("2026-01-01", "25.00", "75.00"), ("2026-02-01", "0.00", "75.00")]
+    assert (await db.execute(select(func.count()).where(snapshots.c.stale))).scalar() == 0
+
+
+@pytest.mark.asyncio
+async def test_late_write_in_archived_month_is_resnapshotted(factory, db) -> None:
+    account = await factory.account(initial_balance=Decimal("100"))
+    category = await factory.category()
+    await factory.operation(
+        account, category, type=OperationType.REVENU, amount=Decimal("1000"), date=date(2024, 1, 5)
+    )
+    await factory.operation(account, category, amount=Decimal("50"), date=date(2024, 2, 5))
+    assert await archive_operations(db, date(2024, 3, 1)) == 2
+
+    await factory.operation(account, category, amount=Decimal("1"), date=date(2024, 1, 20))
+    await mark_stale(db, [(account.id, date(2024, 1, 20))])
+    await close_months(db, date.today())
+
+    owner = await db.get(User, account.owner_id)
+    rows = await list_snapshots(account.id, current_user=owner, db=db, from_month=None, to_month=date(2024, 2, 1))
+    assert [(s.month, s.revenue, s.expense, s.operation_count, s.closing_balance) for s in rows] == [
+        (date(2024, 1, 1), Decimal("1000.00"), Decimal("1.00"), 2, Decimal("1099.00")),
+        (date(2024, 2, 1), Decimal("0.00"), Decimal("50.00"), 1, Decimal("1049.00")),
+    ]
@@ -0,0 +1,54 @@
+"""Tests du service des fichiers statiques précompressés."""
+
+import gzip
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.app.core.static import IMMUTABLE, StaticFrontend, precompress
+
+
+def test_precompressed_variants_and_cache_headers(tmp_path) -> None:
+    (tmp_path / "assets").mkdir()
+    bundle = b"console.log('chatbuild');\n" * 200
+    (tmp_path / "assets" / "index-3f9a1c2b.js").write_bytes(bundle)
+    (tmp_path / "index.html").write_text("<html>" + "x" * 1000 + "</html>", encoding="utf-8")
+    assert precompress(tmp_path) >= 2
+
+    app = FastAPI()
+
+    @app.get("/api/ping")
+    async def ping() -> dict:
+        return {"ok": True}
+
+    app.mount("/", StaticFrontend(tmp_path))
+    client = TestClient(app)
+
+    asset = client.get("/assets/index-3f9a1c2b.js", headers={"Accept-Encoding": "gzip"})
+    assert asset.status_code == 200 and asset.content == bundle  # décompressé par le client
+    assert asset.headers["content-encoding"] == "gzip"
+    assert int(asset.headers["content-length"]) == len(gzip.compress(bundle, compresslevel=9, mtime=0))
+    assert asset.headers["cache-control"] == IMMUTABLE
+    assert asset.headers["vary"] == "Accept-Encoding"
+
+    plain = client.get("/assets/index-3f9a1c2b.js", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers and plain.content == bundle
+    refused = client.get("/assets/index-3f9a1c2b.js", headers={"Accept-Encoding": "br; q=0, gzip; q=0.0"})
+    assert "content-encoding" not in refused.headers
+    # Une représentation par encodage, chacune avec son propre ETag
+    assert asset.headers["etag"] == plain.headers["etag"][:-1] + '-gzip"'
+    for encoding, status in (("gzip", 304), ("identity", 200)):
+        headers = {"Accept-Encoding": encoding, "If-None-Match": asset.headers["etag"]}
+        assert client.get("/assets/index-3f9a1c2b.js", headers=headers).status_code == status
+
+    page = client.get("/comptes/12")  # route du frontend : index.html
+    assert page.status_code == 200 and page.headers["cache-control"] == "no-cache"
+    assert client.get("/", headers={"If-None-Match": page.headers["etag"]}).status_code == 304
+
+    assert client.get("/api/ping").json() == {"ok": True}
+    assert client.get("/api/unknown").status_code == 404
+    assert client.get("/missing.png").status_code == 404
@@ -0,0 +1,68 @@
+"""Tests de la liste paginée des utilisateurs (administration)."""
+
+import json
+import os
+import sys
+from datetime import date
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.app.api.users import list_users
+from backend.app.database import Base
+from backend.app.models import BankAccount, Category, Operation, User
+from backend.app.models.enums import AccountType, OperationType
+
+
+@pytest.mark.asyncio
+async def test_list_users_filters_pages_and_counts() -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        admin = User(id=1, username="admin", hashed_password="x", is_admin=True)
+        session.add_all(
+            [
+                admin,
+                User(id=2, username="alice", hashed_password="x"),
+                User(id=3, username="albert", hashed_password="x", disabled=True),
+                User(id=4, username="bob", hashed_password="x"),
+                Category(id=1, name="Courses"),
+            ]
+        )
+        session.add_all(
+            [
+                BankAccount(id=1, name="A1", owner_id=2, type=AccountType.PERSONAL),
+                BankAccount(id=2, name="A2", owner_id=2, type=AccountType.PERSONAL),
+            ]
+        )
+        for n in range(3):
+            session.add(
+                Operation(
+                    type=OperationType.DEPENSE, label=f"op {n}", amount=1,
+                    date=date(2026, 1, 1), account_id=1, category_id=1,
+                )
+            )
+        await session.commit()
+
+        async def call(**params):
+            query = {"q": None, "disabled": None, "is_admin": None, "limit": 50, "offset": 0, **params}
+            response = await list_users(db=session, current_admin=admin, **query)
+            return response.headers["x-total-count"], json.loads(response.body)
+
+        total, rows = await call(q="al")
+        assert total == "2"
+        assert [(r["username"], r["account_count"], r["operation_count"]) for r in rows] == [
+            ("albert", 0, 0),
+            ("alice", 2, 3),
+        ]
+        total, rows = await call(q="al", disabled=False)
+        assert total == "1" and rows[0]["username"] == "alice"
+        total, rows = await call(limit=2, offset=2)
+        assert total == "4" and [r["username"] for r in rows] == ["alice", "bob"]
+        total, rows = await call(is_admin=True)
+        assert [r["username"] for r in rows] == ["admin"]
+    await engine.dispose()
@@ -0,0 +1,23 @@
+"""Tests de l’interface en ligne de commande du worker de tâches de fond."""
+
+import os
+import sys
+from datetime import date
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from backend.app.jobs.worker import build_parser
+
+
+def test_parser_backfill_range() -> None:
+    args = build_parser().parse_args(["--once", "--from", "2026-01-01", "--to", "2026-01-31"])
+    assert args.once
+    assert args.start == date(2026, 1, 1)
+    assert args.end == date(2026, 1, 31)
+
+
+def test_parser_rejects_invalid_date() -> None:
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["--once", "--from", "01/01/2026"])
@@ -51,6 +51,21 @@ export interface User {
   username: string;
   is_admin: boolean;
   disabled: boolean;
+  account_count?: number;
+  operation_count?: number;
+}
+
+export interface UserQuery {
+  q?: string;
+  disabled?: boolean;
+  is_admin?: boolean;
+  limit?: number;
+  offset?: number;
+}
+
+export interface UserPage {
+  users: User[];
+  total: number;
 }
 
 export interface CreateUserRequest {
@@ -60,11 +75,14 @@ export interface CreateUserRequest {
 }
 
 /**
- * Récupère la liste de tous les utilisateurs (requiert un admin authentifié).
+ * Récupère une page d’utilisateurs (requiert un admin authentifié).
+ *
+ * Le nombre total d’utilisateurs correspondant aux filtres est lu dans
+ * l’en-tête `X-Total-Count`.
  */
-export const fetchUsers = async (): Promise<User[]> => {
-  const res = await api.get('/users');
-  return res.data;
+export const fetchUsers = async (query: UserQuery = {}): Promise<UserPage> => {
+  const res = await api.get('/users', { params: query });
+  return { users: res.data, total: Number(res.headers['x-total-count'] ?? res.data.length) };
 };
 
 /**
@@ -3,15 +3,21 @@ import { Navigate } from 'react-router-dom';
 import { AuthContext } from '../providers/AuthProvider';
 import { fetchUsers, createUser, User } from '../api';
 
+const PAGE_SIZE = 50;
+
 /**
  * Page de gestion des utilisateurs pour l’administrateur.
  *
- * Permet de lister les utilisateurs existants et d’en créer de nouveaux. Elle
- * redirige vers la page d’accueil si l’utilisateur courant n’est pas admin.
+ * Permet de lister les utilisateurs existants (par pages, avec recherche sur le
+ * début du nom) et d’en créer de nouveaux. Elle redirige vers la page d’accueil
+ * si l’utilisateur courant n’est pas admin.
  */
 const AdminUsers: React.FC = () => {
   const { isAdmin } = useContext(AuthContext);
   const [users, setUsers] = useState<User[]>([]);
+  const [total, setTotal] = useState(0);
+  const [search, setSearch] = useState('');
+  const [page, setPage] = useState(0);
   const [username, setUsername] = useState('');
   const [password, setPassword] = useState('');
   const [isAdminFlag, setIsAdminFlag] = useState(false);
@@ -19,11 +25,14 @@ const AdminUsers: React.FC = () => {
 
   useEffect(() => {
     if (isAdmin) {
-      fetchUsers()
-        .then(setUsers)
+      fetchUsers({ q: search || undefined, limit: PAGE_SIZE, offset: page * PAGE_SIZE })
+        .then((result) => {
+          setUsers(result.users);
+          setTotal(result.total);
+        })
         .catch(() => setUsers([]));
     }
-  }, [isAdmin]);
+  }, [isAdmin, search, page]);
 
   if (!isAdmin) {
     return <Navigate to="/" replace />;
@@ -35,6 +44,7 @@ const AdminUsers: React.FC = () => {
     try {
       const newUser = await createUser({ username, password, is_admin: isAdminFlag });
       setUsers([...users, newUser]);
+      setTotal(total + 1);
       setUsername('');
       setPassword('');
       setIsAdminFlag(false);
@@ -77,6 +87,15 @@ const AdminUsers: React.FC = () => {
           Créer
         </button>
       </form>
+      <input
+        value={search}
+        onChange={(e) => {
+          setSearch(e.target.value);
+          setPage(0);
+        }}
+        placeholder="Rechercher (début du nom)"
+        className="border p-2 mb-2"
+      />
       <table className="min-w-full bg-white">
         <thead>
           <tr>
@@ -84,6 +103,8 @@ const AdminUsers: React.FC = () => {
             <th className="border px-4 py-2">Nom</th>
             <th className="border px-4 py-2">Admin</th>
             <th className="border px-4 py-2">Actif</th>
+            <th className="border px-4 py-2">Comptes</th>
+            <th className="border px-4 py-2">Opérations</th>
           </tr>
         </thead>
         <tbody>
@@ -93,10 +114,33 @@ const AdminUsers: React.FC = () => {
               <td className="border px-4 py-2">{u.username}</td>
               <td className="border px-4 py-2 text-center">{u.is_admin ? 'Oui' : 'Non'}</td>
               <td className="border px-4 py-2 text-center">{u.disabled ? 'Non' : 'Oui'}</td>
+              <td className="border px-4 py-2 text-center">{u.account_count ?? 0}</td>
+              <td className="border px-4 py-2 text-center">{u.operation_count ?? 0}</td>
             </tr>
           ))}
         </tbody>
       </table>
+      <div className="mt-2 flex items-center">
+        <button
+          type="button"
+          disabled={page === 0}
+          onClick={() => setPage(page - 1)}
+          className="border p-2 mr-2 disabled:opacity-50"
+        >
+          Précédent
+        </button>
+        <span className="mr-2">
+          Page {page + 1} / {Math.max(1, Math.ceil(total / PAGE_SIZE))}
+        </span>
+        <button
+          type="button"
+          disabled={(page + 1) * PAGE_SIZE >= total}
+          onClick={() => setPage(page + 1)}
+          className="border p-2 disabled:opacity-50"
+        >
+          Suivant
+        </button>
+      </div>
     </div>
   );
 };